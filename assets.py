@@ -0,0 +1,439 @@
+"""
+Portfolio Static Asset Pipeline
+===============================
+
+Publishes files into Streamlit's app static folder (``static/`` next to
+``app.py``) under content-hashed names, so the page only has to carry a short
+URL instead of the file itself.
+
+Streamlit serves that folder at ``app/static/`` once
+``server.enableStaticServing`` is switched on (see ``.streamlit/config.toml``).
+Its static route answers with ``ETag`` and ``Last-Modified`` headers and
+honours HTTP ``Range`` requests, and because every published name contains
+the hash of its content, browsers and proxies can keep a copy until the file
+actually changes.
+
+The ``static/`` folder is generated: files are published into it from the
+sources in the repository the first time the app needs them, and it is not
+meant to be edited by hand.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import os
+import re
+import mimetypes
+import logging
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Sequence, Tuple
+
+from utils import build_image_derivatives
+from css_optimizer import critical_css, purge_css
+
+logger = logging.getLogger(__name__)
+
+# Older Python releases do not know AVIF or WOFF2; Streamlit's static route relies on mimetypes
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("font/woff2", ".woff2")
+
+# Folder served by Streamlit and the URL prefix it is served under
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL_PREFIX = "app/static"
+
+# Built file contents and published URLs, keyed by (source path, size, mtime,
+# transform) so each source is read and transformed once per process
+_built: Dict[Tuple[str, int, int, str], bytes] = {}
+_published: Dict[Tuple[str, int, int, str], str] = {}
+_publish_lock = threading.Lock()
+
+# Strings and comments are matched first so their contents are never rewritten
+_CSS_TOKEN_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|([^"\'/]+|/)', re.S)
+_CSS_WHITESPACE = re.compile(r'\s+')
+_CSS_PUNCTUATION_SPACE = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON_SPACE = re.compile(r':\s+')
+_CSS_STRING_PLACEHOLDER = re.compile(r'\x00(\d+)\x00')
+
+def content_hash(data: bytes, length: int = 12) -> str:
+    """
+    Short content hash used in published file names.
+
+    Args:
+        data (bytes): File contents
+        length (int): Number of hex characters to keep
+
+    Returns:
+        str: Truncated hex digest
+    """
+    return hashlib.sha256(data).hexdigest()[:length]
+
+def hashed_name(filename: str, data: bytes) -> str:
+    """
+    Insert the content hash into a file name (``style.css`` -> ``style.<hash>.css``).
+
+    Args:
+        filename (str): Public file name
+        data (bytes): File contents
+
+    Returns:
+        str: File name carrying the content hash
+    """
+    path = Path(filename)
+    return f"{path.stem}.{content_hash(data)}{path.suffix}"
+
+def static_url(name: str) -> str:
+    """Return the URL a file in ``STATIC_DIR`` is served from."""
+    return f"{STATIC_URL_PREFIX}/{name}"
+
+def publish_bytes(data: bytes, filename: str) -> str:
+    """
+    Write ``data`` into the static folder under a content-hashed name.
+
+    The file is written atomically and only when it is not already present.
+    Older published versions of the same file are removed.
+
+    Args:
+        data (bytes): File contents
+        filename (str): Public file name, e.g. ``"Aarya_Mody_Resume.pdf"``
+
+    Returns:
+        str: URL the published file is served from
+    """
+    name = hashed_name(filename, data)
+    target = STATIC_DIR / name
+
+    if not target.exists():
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, target)
+
+        stem, suffix = Path(filename).stem, Path(filename).suffix
+        stale_pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(suffix)}")
+        for stale in STATIC_DIR.iterdir():
+            if stale.name != name and stale_pattern.fullmatch(stale.name):
+                stale.unlink(missing_ok=True)
+
+        logger.info(f"Published {filename} as {name} ({len(data)} bytes)")
+
+    return static_url(name)
+
+def _source_key(source_path: os.PathLike, transform: Optional[Callable[[bytes], bytes]]) -> Optional[Tuple[str, int, int, str]]:
+    """Identify a source file version (and the transform applied to it) by ``stat``."""
+    try:
+        stat = os.stat(source_path)
+    except OSError as e:
+        logger.error(f"Cannot read asset {source_path}: {e}")
+        return None
+    transform_name = transform.__qualname__ if transform else ""
+    return (os.fspath(source_path), stat.st_size, stat.st_mtime_ns, transform_name)
+
+def build_file(source_path: os.PathLike, transform: Optional[Callable[[bytes], bytes]] = None) -> Optional[bytes]:
+    """
+    Read a source file and apply ``transform`` to it, once per file version.
+
+    Args:
+        source_path (os.PathLike): File to read
+        transform (Optional[Callable[[bytes], bytes]]): Build step, e.g. minification
+
+    Returns:
+        Optional[bytes]: Built contents, or None if the file could not be read
+    """
+    key = _source_key(source_path, transform)
+    if key is None:
+        return None
+
+    data = _built.get(key)
+    if data is None:
+        with _publish_lock:
+            data = _built.get(key)
+            if data is None:
+                data = Path(source_path).read_bytes()
+                if transform:
+                    data = transform(data)
+                _built[key] = data
+    return data
+
+def publish_file(
+    source_path: os.PathLike,
+    public_name: Optional[str] = None,
+    transform: Optional[Callable[[bytes], bytes]] = None
+) -> Optional[str]:
+    """
+    Publish a file from the repository into the static folder.
+
+    Results are memoised per process on the file's path, size and
+    modification time, so repeated calls cost a single ``stat``.
+
+    Args:
+        source_path (os.PathLike): File to publish
+        public_name (Optional[str]): Name to publish under (defaults to the file name)
+        transform (Optional[Callable[[bytes], bytes]]): Build step applied before publishing
+
+    Returns:
+        Optional[str]: URL of the published file, or None if it could not be read
+    """
+    key = _source_key(source_path, transform)
+    if key is None:
+        return None
+
+    url = _published.get(key)
+    if url is not None:
+        return url
+
+    data = build_file(source_path, transform)
+    if data is None:
+        return None
+
+    with _publish_lock:
+        url = _published.get(key)
+        if url is None:
+            url = publish_bytes(data, public_name or Path(source_path).name)
+            _published[key] = url
+
+    return url
+
+# Stylesheets
+# ===========
+
+def minify_css(css: str) -> str:
+    """
+    Minify a stylesheet: drop comments and redundant whitespace.
+
+    Quoted strings (``content`` values, inline SVG ``url()`` data) are copied
+    verbatim; only the code between them is rewritten.
+
+    Args:
+        css (str): Stylesheet source
+
+    Returns:
+        str: Minified stylesheet
+    """
+    strings = []
+
+    def stash(match):
+        string, comment, code = match.groups()
+        if string:
+            strings.append(string)
+            return f"\x00{len(strings) - 1}\x00"
+        # A comment still separates the tokens around it
+        return ' ' if comment else code
+
+    code = _CSS_TOKEN_PATTERN.sub(stash, css)
+    code = _CSS_WHITESPACE.sub(' ', code)
+    code = _CSS_PUNCTUATION_SPACE.sub(r'\1', code)
+    code = _CSS_COLON_SPACE.sub(':', code).replace(';}', '}').strip()
+    return _CSS_STRING_PLACEHOLDER.sub(lambda match: strings[int(match.group(1))], code)
+
+def _minify_css_file(data: bytes) -> bytes:
+    """Build step for ``build_file``: minify UTF-8 CSS."""
+    return minify_css(data.decode('utf-8')).encode('utf-8')
+
+def load_minified_stylesheet(source_path: os.PathLike) -> str:
+    """
+    Minified stylesheet text for inlining when static serving is unavailable.
+
+    Args:
+        source_path (os.PathLike): Stylesheet to load
+
+    Returns:
+        str: Minified CSS, or an empty string if the file could not be read
+    """
+    data = build_file(source_path, transform=_minify_css_file)
+    return data.decode('utf-8') if data is not None else ""
+
+class OptimizedStylesheet(NamedTuple):
+    """A stylesheet purged of unused rules, with its critical part split out."""
+    critical: str
+    full: str
+
+# Optimized stylesheets and their published URLs, keyed by source version and name sets
+_optimized: Dict[Tuple[Any, ...], OptimizedStylesheet] = {}
+_optimized_urls: Dict[Tuple[Any, ...], str] = {}
+
+def _optimized_key(source_path: os.PathLike, used: FrozenSet[str], critical: FrozenSet[str]) -> Optional[Tuple[Any, ...]]:
+    key = _source_key(source_path, None)
+    return key[:3] + (used, critical) if key is not None else None
+
+def optimize_stylesheet(
+    source_path: os.PathLike,
+    used: FrozenSet[str],
+    critical: FrozenSet[str]
+) -> Optional[OptimizedStylesheet]:
+    """
+    Minify a stylesheet, drop its unused rules and extract its critical rules.
+
+    Built once per file version and pair of name sets (see ``css_optimizer.py``).
+
+    Args:
+        source_path (os.PathLike): Stylesheet to optimize
+        used (FrozenSet[str]): Class and id names the page can emit
+        critical (FrozenSet[str]): Class and id names of the above-the-fold markup
+
+    Returns:
+        Optional[OptimizedStylesheet]: Critical and full CSS, or None if the
+        file could not be read
+    """
+    key = _optimized_key(source_path, used, critical)
+    if key is None:
+        return None
+
+    stylesheet = _optimized.get(key)
+    if stylesheet is None:
+        css = load_minified_stylesheet(source_path)
+        if not css:
+            return None
+        full = purge_css(css, used)
+        stylesheet = OptimizedStylesheet(critical_css(full, critical), full)
+        _optimized[key] = stylesheet
+        logger.info(
+            f"Optimized {Path(source_path).name}: {len(css)} -> {len(full)} bytes, "
+            f"{len(stylesheet.critical)} bytes critical"
+        )
+    return stylesheet
+
+def publish_optimized_stylesheet(
+    source_path: os.PathLike,
+    used: FrozenSet[str],
+    critical: FrozenSet[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Optimize a stylesheet and publish its full CSS as ``<name>.<hash>.css``.
+
+    Args:
+        source_path (os.PathLike): Stylesheet to publish
+        used (FrozenSet[str]): Class and id names the page can emit
+        critical (FrozenSet[str]): Class and id names of the above-the-fold markup
+
+    Returns:
+        Optional[Tuple[str, str]]: The critical CSS to inline and the URL of
+        the full stylesheet, or None if the file could not be read
+    """
+    stylesheet = optimize_stylesheet(source_path, used, critical)
+    if stylesheet is None:
+        return None
+
+    key = _optimized_key(source_path, used, critical)
+    url = _optimized_urls.get(key)
+    if url is None:
+        with _publish_lock:
+            url = _optimized_urls.get(key)
+            if url is None:
+                url = _optimized_urls[key] = publish_bytes(stylesheet.full.encode('utf-8'), Path(source_path).name)
+    return stylesheet.critical, url
+
+# Scripts
+# =======
+
+def minify_js(js: str) -> str:
+    """
+    Minify a script conservatively: drop indentation, blank lines and
+    whole-line ``//`` comments.
+
+    Line breaks are kept, so automatic semicolon insertion behaves as in the
+    source, and nothing inside a line is touched, so strings, regular
+    expressions and template literals are safe as long as no multi-line
+    string depends on its indentation.
+
+    Args:
+        js (str): Script source
+
+    Returns:
+        str: Minified script
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//")) + "\n"
+
+def _minify_js_file(data: bytes) -> bytes:
+    """Build step for ``publish_file``: minify a UTF-8 script."""
+    return minify_js(data.decode('utf-8')).encode('utf-8')
+
+def publish_script(source_path: os.PathLike) -> Optional[str]:
+    """
+    Minify a script and publish it as ``<name>.<hash>.js``.
+
+    Args:
+        source_path (os.PathLike): Script to publish
+
+    Returns:
+        Optional[str]: URL of the published script
+    """
+    return publish_file(source_path, transform=_minify_js_file)
+
+def load_minified_script(source_path: os.PathLike) -> str:
+    """
+    Minified script text for inlining when static serving is unavailable.
+
+    Args:
+        source_path (os.PathLike): Script to load
+
+    Returns:
+        str: Minified script, or an empty string if the file could not be read
+    """
+    data = build_file(source_path, transform=_minify_js_file)
+    return data.decode('utf-8') if data is not None else ""
+
+# Images
+# ======
+
+# Responsive derivatives live under static/img/<source hash>/
+IMAGE_DIR = STATIC_DIR / "img"
+
+# Published image manifests keyed like _published
+_images: Dict[Tuple[str, int, int, str], Dict[str, Any]] = {}
+
+def attach_image_urls(manifest: Dict[str, Any], url_prefix: str) -> Dict[str, Any]:
+    """
+    Add a ``url`` to every variant of a derivative manifest.
+
+    Args:
+        manifest (Dict[str, Any]): Manifest from ``utils.build_image_derivatives``
+        url_prefix (str): URL of the folder the derivatives were built into
+
+    Returns:
+        Dict[str, Any]: The same manifest, updated in place
+    """
+    folder = manifest['source_hash'][:16]
+    for variants in manifest['formats'].values():
+        for variant in variants:
+            variant['url'] = f"{url_prefix}/{folder}/{variant['file']}"
+    return manifest
+
+def publish_image(source_path: os.PathLike, widths: Sequence[int] = (320, 640)) -> Optional[Dict[str, Any]]:
+    """
+    Publish resized WebP/AVIF/JPEG copies of an image.
+
+    Derivatives are built with ``utils.build_image_derivatives`` and stored
+    by the content hash of the source, so they survive restarts and are only
+    rebuilt when the source image changes.
+
+    Args:
+        source_path (os.PathLike): Source image
+        widths (Sequence[int]): Target widths in pixels
+
+    Returns:
+        Optional[Dict[str, Any]]: The derivative manifest with a ``url`` added
+        to every variant, or None if the image could not be processed
+    """
+    key = _source_key(source_path, None)
+    if key is None:
+        return None
+    key = key[:3] + (",".join(map(str, widths)),)
+
+    image = _images.get(key)
+    if image is not None:
+        return image
+
+    with _publish_lock:
+        image = _images.get(key)
+        if image is None:
+            manifest = build_image_derivatives(os.fspath(source_path), str(IMAGE_DIR), widths=widths)
+            if manifest is None:
+                return None
+
+            image = _images[key] = attach_image_urls(manifest, static_url("img"))
+
+    return image
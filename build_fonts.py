@@ -0,0 +1,328 @@
+"""
+Portfolio Font Build
+====================
+
+Builds self-hosted, subsetted WOFF2 copies of the page's web fonts, so the
+page no longer ``@import``s them from Google Fonts. That ``@import`` blocked
+rendering and chained two third-party round trips before any text showed.
+
+From local font files (static per-weight files or variable fonts, e.g. the
+Inter and Poppins downloads from Google Fonts), the build:
+
+- keeps only the families named in ``font-family`` declarations of
+  ``style.css`` and the weights its ``font-weight`` declarations use (plus
+  400 and the 700 browsers use for ``<strong>``)
+- subsets every font to the characters that occur in the page's sources
+  (``css_optimizer.PAGE_SOURCES``) plus printable ASCII, for form input
+- writes ``fonts/<Family>-<weight>.woff2`` and ``fonts/fonts.json``
+
+The app publishes the files as hashed static assets. It inlines their
+``@font-face`` rules (``font-display: swap``) and preloads the faces the
+stylesheet declares directly: the body text and the headings. Until the fonts
+are built, or when static serving is off, it links Google Fonts, limited to
+the same weights.
+
+Requires ``fontTools`` with WOFF2 support (``pip install "fonttools[woff]"``);
+the app itself does not.
+
+Usage:
+    python build_fonts.py [--source vendor/fonts] [--output fonts]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import string
+import argparse
+from pathlib import Path
+from urllib.parse import quote_plus
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from css_optimizer import PAGE_SOURCES, parse_stylesheet
+
+ROOT = Path(__file__).parent
+STYLESHEET = ROOT / "style.css"
+
+# Generated fonts and their manifest, served by app.py and copied by export_static.py
+FONT_DIR = ROOT / "fonts"
+FONT_MANIFEST = FONT_DIR / "fonts.json"
+
+# Local font files to build from
+DEFAULT_SOURCE = Path(os.getenv("FONTS_SOURCE_DIR", ROOT / "vendor" / "fonts"))
+
+GOOGLE_FONTS_CSS_URL = "https://fonts.googleapis.com/css2"
+
+# Weights the browser applies without a font-weight declaration (<strong>, <b>)
+DEFAULT_WEIGHTS = {400, 700}
+WEIGHT_KEYWORDS = {"normal": 400, "bold": 700}
+
+# Always kept so text typed into the contact form renders in the page font
+BASE_CHARACTERS = string.printable.strip() + " "
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".woff", ".woff2")
+
+_DECLARATION_PATTERN = re.compile(r'(font-family|font-weight)\s*:\s*([^;]+)')
+
+class FontFile(NamedTuple):
+    """A local font file and the weights it covers."""
+    path: Path
+    family: str
+    min_weight: int
+    max_weight: int
+    variable: bool
+
+# Stylesheet
+# ==========
+
+def _first_family(value: str) -> str:
+    return value.split(",")[0].strip().strip("'\"")
+
+def _weight(value: str) -> Optional[int]:
+    value = value.replace("!important", "").strip().lower()
+    if value.isdigit():
+        return int(value)
+    return WEIGHT_KEYWORDS.get(value)
+
+def stylesheet_fonts(css: str) -> Tuple[Dict[str, Set[int]], Set[Tuple[str, int]]]:
+    """
+    Find the font families and weights a stylesheet uses.
+
+    Family and weight are inherited separately, so every family gets every
+    weight used anywhere in the stylesheet.
+
+    Args:
+        css (str): Minified CSS
+
+    Returns:
+        Tuple[Dict[str, Set[int]], Set[Tuple[str, int]]]: Weights per family,
+        and the ``(family, weight)`` pairs declared together by the rules that
+        set a ``font-family`` (the faces worth preloading)
+    """
+    families: Set[str] = set()
+    weights = set(DEFAULT_WEIGHTS)
+    declared: Set[Tuple[str, int]] = set()
+
+    def visit(blocks) -> None:
+        for block in blocks:
+            if block.children is not None:
+                visit(block.children)
+            elif block.body is not None and not block.prelude.startswith("@"):
+                declarations = dict(_DECLARATION_PATTERN.findall(block.body))
+                weight = _weight(declarations.get("font-weight", "normal"))
+                if weight:
+                    weights.add(weight)
+                if "font-family" in declarations:
+                    family = _first_family(declarations["font-family"])
+                    families.add(family)
+                    declared.add((family, weight or 400))
+
+    visit(parse_stylesheet(css))
+    return {family: set(weights) for family in families}, declared
+
+def google_fonts_url(fonts: Dict[str, Set[int]]) -> str:
+    """Google Fonts stylesheet URL for the given families and weights."""
+    families = "&".join(
+        f"family={quote_plus(family)}:wght@{';'.join(map(str, sorted(weights)))}"
+        for family, weights in sorted(fonts.items())
+    )
+    return f"{GOOGLE_FONTS_CSS_URL}?{families}&display=swap"
+
+def page_characters(paths: Sequence[Path] = PAGE_SOURCES) -> str:
+    """Every printable character in the page's sources plus printable ASCII, sorted."""
+    characters = set(BASE_CHARACTERS)
+    for path in paths:
+        characters.update(char for char in path.read_text(encoding="utf-8") if char.isprintable())
+    return "".join(sorted(characters))
+
+# Font Faces
+# ==========
+
+def font_face_css(fonts: Sequence[Dict[str, Any]], url_for: Callable[[Dict[str, Any]], str]) -> str:
+    """
+    ``@font-face`` rules for built fonts.
+
+    Args:
+        fonts (Sequence[Dict[str, Any]]): Entries of ``fonts.json``
+        url_for (Callable[[Dict[str, Any]], str]): URL of an entry's file
+
+    Returns:
+        str: Minified CSS
+    """
+    return "".join(
+        f"@font-face{{font-family:'{font['family']}';font-style:normal;font-weight:{font['weight']};"
+        f"font-display:swap;src:url({url_for(font)}) format('woff2')}}"
+        for font in fonts
+    )
+
+def font_preload_html(fonts: Sequence[Dict[str, Any]], url_for: Callable[[Dict[str, Any]], str]) -> str:
+    """``<link rel="preload">`` tags for the entries of ``fonts.json`` marked for preloading."""
+    return "".join(
+        f'<link rel="preload" href="{url_for(font)}" as="font" type="font/woff2" crossorigin>'
+        for font in fonts if font.get("preload")
+    )
+
+def load_manifest(path: Path = FONT_MANIFEST) -> Optional[List[Dict[str, Any]]]:
+    """Entries of ``fonts.json``, or None if the fonts have not been built."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["fonts"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+# Building
+# ========
+
+def scan_font_files(source: Path) -> List[FontFile]:
+    """
+    Read family names and weights of the upright fonts in a folder.
+
+    Args:
+        source (Path): Folder holding font files (searched recursively)
+
+    Returns:
+        List[FontFile]: One entry per usable file; italic files are skipped
+    """
+    from fontTools.ttLib import TTFont
+
+    fonts = []
+    for path in sorted(source.rglob("*")):
+        if path.suffix.lower() not in FONT_EXTENSIONS:
+            continue
+        with TTFont(path, lazy=True) as font:
+            name = font["name"]
+            family = str(name.getName(16, 3, 1, 0x409) or name.getName(1, 3, 1, 0x409) or path.stem)
+            if font["OS/2"].fsSelection & 1:
+                continue
+
+            axes = {axis.axisTag: axis for axis in font["fvar"].axes} if "fvar" in font else {}
+            if "wght" in axes:
+                fonts.append(FontFile(path, family, int(axes["wght"].minValue), int(axes["wght"].maxValue), True))
+            else:
+                weight = font["OS/2"].usWeightClass
+                fonts.append(FontFile(path, family, weight, weight, False))
+    return fonts
+
+def build_font(font_file: FontFile, weight: int, text: str) -> bytes:
+    """
+    Build one WOFF2 face: pin the weight of a variable font, then subset it.
+
+    Args:
+        font_file (FontFile): Source font
+        weight (int): Weight to build
+        text (str): Characters to keep
+
+    Returns:
+        bytes: WOFF2 data
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk"]
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6]
+    output = io.BytesIO()
+
+    with TTFont(font_file.path) as font:
+        if font_file.variable:
+            # Pin every axis: weight to the requested value, the others to their defaults
+            font = instancer.instantiateVariableFont(
+                font, {axis.axisTag: weight if axis.axisTag == "wght" else None for axis in font["fvar"].axes}
+            )
+
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        subset.save_font(font, output, options)
+    return output.getvalue()
+
+def build_fonts(source: Path, output_dir: Path) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int]]]:
+    """
+    Build every face ``style.css`` uses from the files in ``source``.
+
+    Args:
+        source (Path): Folder with local font files
+        output_dir (Path): Folder to write the WOFF2 files and ``fonts.json`` to
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Tuple[str, int]]]: Manifest entries,
+        and the ``(family, weight)`` faces no local file covers
+    """
+    from assets import minify_css
+
+    used, declared = stylesheet_fonts(minify_css(STYLESHEET.read_text(encoding="utf-8")))
+    available = scan_font_files(source)
+    text = page_characters()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = []
+    missing = []
+    for family, weights in sorted(used.items()):
+        for weight in sorted(weights):
+            candidates = [
+                font for font in available
+                if font.family == family and font.min_weight <= weight <= font.max_weight
+            ]
+            if not candidates:
+                missing.append((family, weight))
+                continue
+            # A static file of exactly this weight beats instancing a variable font
+            font_file = min(candidates, key=lambda font: font.variable)
+            data = build_font(font_file, weight, text)
+            file_name = f"{family.replace(' ', '')}-{weight}.woff2"
+            (output_dir / file_name).write_bytes(data)
+            entries.append({
+                "family": family,
+                "weight": weight,
+                "file": file_name,
+                "bytes": len(data),
+                "preload": (family, weight) in declared,
+            })
+
+    manifest = {"characters": len(text), "fonts": entries}
+    (output_dir / FONT_MANIFEST.name).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return entries, missing
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Build subsetted WOFF2 fonts from local font files.")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE,
+                        help="folder with .ttf/.otf/.woff2 files (default: $FONTS_SOURCE_DIR or vendor/fonts)")
+    parser.add_argument("--output", type=Path, default=FONT_DIR, help="folder to write the fonts to (default: fonts)")
+    args = parser.parse_args(argv)
+
+    try:
+        import fontTools  # noqa: F401
+        import brotli  # noqa: F401
+    except ImportError:
+        print('❌ fontTools with WOFF2 support is required: pip install "fonttools[woff]"')
+        return 1
+    if not args.source.is_dir():
+        print(f"❌ Font folder not found: {args.source}")
+        return 1
+
+    entries, missing = build_fonts(args.source, args.output)
+    for family, weight in missing:
+        print(f"   ⚠️  No local font for {family} {weight}; browsers will synthesize it")
+    for entry in entries:
+        preload = " (preloaded)" if entry["preload"] else ""
+        print(f"   {entry['file']:<24} {entry['bytes'] / 1024:>6.1f} KB{preload}")
+    if not entries:
+        print("❌ No fonts built")
+        return 1
+
+    total = sum(entry["bytes"] for entry in entries)
+    print(f"✅ Built {len(entries)} fonts ({total / 1024:.1f} KB) into {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
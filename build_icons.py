@@ -0,0 +1,283 @@
+"""
+Portfolio Icon Build
+====================
+
+Builds ``icons.css``, a small stylesheet holding only the Font Awesome icons
+the page uses, so the app no longer loads the full Font Awesome stylesheet
+and webfonts from a CDN.
+
+The build scans the modules that produce the page's markup (the templates in
+``sections.py`` and the content in ``config.py``) for icon classes such as
+``fas fa-envelope`` or ``fab fa-github``, and reads each icon's SVG from a
+local copy of Font Awesome Free. No network access is needed. Use the
+unpacked "Free for Web" download, or the ``@fortawesome/fontawesome-free``
+npm package (``svgs/`` and ``css/all.css`` are used). Names from Font Awesome
+5 (``fa-map-marker-alt``) are resolved to their Font Awesome 6 files
+(``location-dot``) through the aliases in ``css/all.css``.
+
+Every icon becomes a CSS mask painted in ``currentColor``. The existing
+``<i class="fas fa-...">`` markup, colours and font sizes therefore work as
+before, and no icon font has to download before the icons show. The app
+links ``icons.css`` when it exists and falls back to the CDN otherwise.
+``--check`` fails when the stylesheet misses an icon in use or still holds
+one that no longer is.
+
+Usage:
+    python build_icons.py [--source vendor/fontawesome] [--output components/runtime/icons.css]
+    python build_icons.py --check
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import os
+import re
+import sys
+import argparse
+from pathlib import Path
+from urllib.parse import quote
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+ROOT = Path(__file__).parent
+
+# Generated stylesheet, served by app.py and copied by export_static.py. It lives in the
+# client runtime component's folder, which Streamlit serves even without static serving
+ICON_STYLESHEET = ROOT / "components" / "runtime" / "icons.css"
+
+# Used by the app until icons.css has been built
+FONT_AWESOME_CDN_URL = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css"
+
+# Local Font Awesome Free copy (the folder holding svgs/ and css/)
+DEFAULT_SOURCE = Path(os.getenv("FONT_AWESOME_DIR", ROOT / "vendor" / "fontawesome"))
+
+# Modules whose markup ends up on the page: the section templates and the content
+ICON_SOURCES = [ROOT / "sections.py", ROOT / "config.py"]
+
+# Style class -> folder under svgs/
+STYLE_FOLDERS = {
+    "fa": "solid", "fas": "solid", "fa-solid": "solid",
+    "far": "regular", "fa-regular": "regular",
+    "fab": "brands", "fa-brands": "brands",
+}
+
+# Longest style names first so "fa-solid" is not read as "fa"
+_ICON_CLASS_PATTERN = re.compile(
+    r'\b(fa-solid|fa-regular|fa-brands|fas|far|fab|fa)\s+fa-([a-z0-9]+(?:-[a-z0-9]+)*)\b'
+)
+_ALIAS_PATTERN = re.compile(r'\.fa-([a-z0-9-]+)::before\s*\{\s*content:\s*"\\([0-9a-f]+)"')
+_VIEWBOX_PATTERN = re.compile(r'viewBox="0 0 (\d+(?:\.\d+)?) (\d+(?:\.\d+)?)"')
+_SVG_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.S)
+_VERSION_PATTERN = re.compile(r'Font Awesome Free (\d+(?:\.\d+)*)')
+_BUILT_ICON_PATTERN = re.compile(r'^\.(fa[a-z-]*)\.fa-([a-z0-9-]+)\{', re.M)
+_UNAVAILABLE_PATTERN = re.compile(r'^/\* Not in Font Awesome Free: (.*) \*/$', re.M)
+
+# Shared by every icon; the per-icon rules only set the two custom properties,
+# so existing rules such as ".social-link i { width: ... }" still win
+BASE_RULE = (
+    ".fa,.fas,.far,.fab,.fa-solid,.fa-regular,.fa-brands{"
+    "display:inline-block;width:var(--fa-width,1em);height:1em;vertical-align:-.125em;"
+    "font-style:normal;background-color:currentColor;"
+    "-webkit-mask:var(--fa-icon) center/contain no-repeat;mask:var(--fa-icon) center/contain no-repeat}"
+)
+
+Icon = Tuple[str, str]  # (style class, icon name without "fa-")
+
+# Scanning
+# ========
+
+def find_icons(paths: Sequence[Path] = ICON_SOURCES) -> List[Icon]:
+    """
+    Collect the icon classes used in the given source files.
+
+    Args:
+        paths (Sequence[Path]): Files to scan
+
+    Returns:
+        List[Icon]: Sorted, de-duplicated ``(style, name)`` pairs
+    """
+    icons: Set[Icon] = set()
+    for path in paths:
+        icons.update(_ICON_CLASS_PATTERN.findall(path.read_text(encoding="utf-8")))
+    return sorted(icons)
+
+def built_icons(stylesheet: Path = ICON_STYLESHEET) -> Set[Icon]:
+    """
+    Icons an existing ``icons.css`` was built for.
+
+    Read from its selectors and from the comment listing the icons Font
+    Awesome Free did not have when it was built.
+
+    Args:
+        stylesheet (Path): Built stylesheet
+
+    Returns:
+        Set[Icon]: ``(style, name)`` pairs, empty if the file does not exist
+    """
+    if not stylesheet.exists():
+        return set()
+    css = stylesheet.read_text(encoding="utf-8")
+    icons = set(_BUILT_ICON_PATTERN.findall(css))
+    for listed in _UNAVAILABLE_PATTERN.findall(css):
+        icons.update(tuple(entry.split(" fa-", 1)) for entry in listed.split(", "))
+    return icons
+
+# Font Awesome Copy
+# =================
+
+class FontAwesomeSource:
+    """SVG files and name aliases of a local Font Awesome Free copy."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.svg_dir = root / "svgs"
+        if not self.svg_dir.is_dir():
+            raise FileNotFoundError(f"No svgs/ folder in {root}; point --source at an unpacked Font Awesome Free copy")
+        self.aliases = self._load_aliases(root / "css" / "all.css")
+
+    @staticmethod
+    def _load_aliases(stylesheet: Path) -> Dict[str, List[str]]:
+        """Map each icon name to every name sharing its glyph (Font Awesome 5 and 6 names)."""
+        if not stylesheet.exists():
+            return {}
+        by_glyph: Dict[str, List[str]] = {}
+        names: Dict[str, str] = {}
+        for name, glyph in _ALIAS_PATTERN.findall(stylesheet.read_text(encoding="utf-8")):
+            by_glyph.setdefault(glyph, []).append(name)
+            names[name] = glyph
+        return {name: by_glyph[glyph] for name, glyph in names.items()}
+
+    def find_svg(self, style: str, name: str) -> Optional[Path]:
+        """
+        Locate the SVG for an icon, following aliases.
+
+        Args:
+            style (str): Style class, e.g. ``"fas"``
+            name (str): Icon name without the ``fa-`` prefix
+
+        Returns:
+            Optional[Path]: The SVG file, or None if this copy does not have the icon
+        """
+        folder = self.svg_dir / STYLE_FOLDERS[style]
+        for candidate in [name, *self.aliases.get(name, [])]:
+            path = folder / f"{candidate}.svg"
+            if path.exists():
+                return path
+        return None
+
+    def version(self) -> str:
+        """Font Awesome version, read from the licence comment of an SVG."""
+        for path in self.svg_dir.rglob("*.svg"):
+            match = _VERSION_PATTERN.search(path.read_text(encoding="utf-8"))
+            return match.group(1) if match else "unknown"
+        return "unknown"
+
+# Stylesheet
+# ==========
+
+def svg_data_uri(svg: str) -> str:
+    """
+    Encode an SVG as a compact ``data:`` URI for use in CSS.
+
+    Args:
+        svg (str): SVG markup
+
+    Returns:
+        str: URI safe to place inside double quotes
+    """
+    svg = _SVG_COMMENT_PATTERN.sub("", svg).strip().replace('"', "'")
+    return "data:image/svg+xml," + quote(svg, safe=" '/:=,.-()")
+
+def icon_rule(style: str, name: str, svg: str) -> str:
+    """
+    CSS rule drawing one icon.
+
+    Args:
+        style (str): Style class, e.g. ``"fab"``
+        name (str): Icon name without the ``fa-`` prefix
+        svg (str): SVG markup of the icon
+
+    Returns:
+        str: Rule setting ``--fa-icon`` and ``--fa-width`` (glyph width in ``em``)
+    """
+    width = 1.0
+    match = _VIEWBOX_PATTERN.search(svg)
+    if match:
+        width = float(match.group(1)) / float(match.group(2))
+    return f'.{style}.fa-{name}{{--fa-icon:url("{svg_data_uri(svg)}");--fa-width:{width:.4g}em}}'
+
+def build_stylesheet(source: FontAwesomeSource, icons: Sequence[Icon]) -> Tuple[str, List[Icon]]:
+    """
+    Build the icon stylesheet.
+
+    Args:
+        source (FontAwesomeSource): Local Font Awesome copy
+        icons (Sequence[Icon]): Icons to include
+
+    Returns:
+        Tuple[str, List[Icon]]: The stylesheet and the icons the copy does not have
+    """
+    rules = []
+    missing = []
+    for style, name in icons:
+        path = source.find_svg(style, name)
+        if path is None:
+            missing.append((style, name))
+            continue
+        rules.append(icon_rule(style, name, path.read_text(encoding="utf-8")))
+
+    header = (
+        f"/*! Font Awesome Free {source.version()} by @fontawesome - https://fontawesome.com "
+        "License - https://fontawesome.com/license/free (Icons: CC BY 4.0) */\n"
+        "/* Generated by build_icons.py from the icon classes used by the app; do not edit */\n"
+    )
+    if missing:
+        header += f"/* Not in Font Awesome Free: {', '.join(f'{style} fa-{name}' for style, name in missing)} */\n"
+    return header + BASE_RULE + "\n" + "\n".join(rules) + "\n", missing
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Build icons.css from a local Font Awesome Free copy.")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE,
+                        help="Font Awesome Free folder holding svgs/ and css/ (default: $FONT_AWESOME_DIR or vendor/fontawesome)")
+    parser.add_argument("--output", type=Path, default=ICON_STYLESHEET,
+                        help="stylesheet to write (default: components/runtime/icons.css)")
+    parser.add_argument("--check", action="store_true", help="only check that the stylesheet holds exactly the icons in use")
+    args = parser.parse_args(argv)
+
+    icons = find_icons()
+    print(f"🔍 {len(icons)} icons in use")
+
+    if args.check:
+        built = built_icons(args.output)
+        missing = sorted(set(icons) - built)
+        unused = sorted(built - set(icons))
+        for style, name in missing:
+            print(f"   ⚠️  {style} fa-{name} is not in {args.output.name}")
+        for style, name in unused:
+            print(f"   ⚠️  {style} fa-{name} is in {args.output.name} but no longer used")
+        if missing or unused:
+            print(f"❌ {args.output.name} is out of date; run python build_icons.py")
+            return 1
+        print(f"✅ {args.output.name} holds exactly the icons in use")
+        return 0
+
+    try:
+        source = FontAwesomeSource(args.source)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+
+    stylesheet, missing = build_stylesheet(source, icons)
+    for style, name in missing:
+        print(f"   ⚠️  {style} fa-{name} is not in Font Awesome Free {source.version()}; skipped")
+
+    args.output.write_text(stylesheet, encoding="utf-8")
+    print(f"✅ Wrote {args.output.name}: {len(icons) - len(missing)} icons, {len(stylesheet.encode('utf-8')):,} bytes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
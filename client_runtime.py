@@ -0,0 +1,99 @@
+"""
+Portfolio Client Runtime
+========================
+
+Mounts the page's client-side behaviour (animations, reveal effects, smooth
+scrolling, lazy section loading) through one persistent custom component,
+instead of injecting the scripts with ``components.html`` on every rerun.
+
+Every ``components.html`` call created a fresh iframe and re-sent and
+re-executed its script on each rerun, stacking scroll listeners on the page.
+The component here has a stable key, so Streamlit keeps its frame mounted
+across reruns and only sends it new arguments. On its first render the frame
+adds ``js/runtime.js`` to the page:
+
+- with static serving, as a minified, content-hashed file from ``app/static/``
+  that the browser caches until the script changes
+- otherwise, as inline source passed in the component's arguments (only the
+  first render uses it)
+
+The runtime lives in the page itself, so it is loaded once per browser
+session; later renders only hand it the current options. It can also send
+JSON values back, which :func:`mount_client_runtime` returns.
+
+Streamlit serves the component's folder whether or not static serving is on,
+so :func:`component_file_url` also gives other generated files placed there
+(``icons.css``) a URL the page can link to instead of inlining them.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import build_file, content_hash, load_minified_script, publish_script
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parent
+
+# The component's frame (a bootstrap page) and the runtime it loads into the page
+COMPONENT_DIR = ROOT / "components" / "runtime"
+RUNTIME_SCRIPT = ROOT / "js" / "runtime.js"
+
+RUNTIME_KEY = "portfolio_runtime"
+
+_runtime_component = components.declare_component("portfolio_runtime", path=str(COMPONENT_DIR))
+
+def mount_client_runtime(options: Optional[Dict[str, Any]] = None, key: str = RUNTIME_KEY) -> Any:
+    """
+    Render the runtime component; call once per run, at the same place in the page.
+
+    Args:
+        options (Optional[Dict[str, Any]]): JSON options for the runtime,
+            e.g. ``{"lazySections": True}``
+        key (str): Widget key keeping the component mounted across reruns
+
+    Returns:
+        Any: The last value the runtime sent, or None
+    """
+    url = publish_script(RUNTIME_SCRIPT) if st.get_option("server.enableStaticServing") else None
+    if url is None:
+        source = load_minified_script(RUNTIME_SCRIPT)
+        if not source:
+            logger.warning(f"Client runtime not found: {RUNTIME_SCRIPT}")
+            return None
+    else:
+        source = None
+
+    return _runtime_component(url=url, source=source, options=options or {}, key=key, default=None)
+
+def component_file_url(path: Path) -> Optional[str]:
+    """
+    URL of a file in the component's folder, served by Streamlit's component endpoint.
+
+    The content hash in the query string changes with the file, so the browser
+    can keep its cached copy until then.
+
+    Args:
+        path (Path): File inside ``COMPONENT_DIR``
+
+    Returns:
+        Optional[str]: Page-relative URL, or None if the file is missing or
+        outside the folder
+    """
+    try:
+        relative = path.resolve().relative_to(COMPONENT_DIR.resolve())
+    except ValueError:
+        logger.warning(f"{path} is not in {COMPONENT_DIR}")
+        return None
+    data = build_file(path)
+    if data is None:
+        return None
+    return f"component/{_runtime_component.name}/{relative.as_posix()}?v={content_hash(data)}"
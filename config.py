@@ -8,6 +8,9 @@
 # 4. Replace the placeholder image URLs with your actual photos
 # 5. Update contact information
 
+import os
+from pathlib import Path
+
 # PERSONAL INFORMATION
 NAME = "Aarya Mody"
 TITLE = "Python Developer | Data Scientist | AI Enthusiast" 
@@ -17,8 +20,51 @@ LOCATION = "Surat, India"  # Replace with your actual location
 GITHUB_URL = "https://github.com/AaryaMody1301"  # Replace with your GitHub
 LINKEDIN_URL = "https://linkedin.com/in/aarya-mody"  # Replace with your LinkedIn
 PROFILE_PHOTO = "profile_photo_optimized.jpg"  # Your optimized profile photo
+PROFILE_PHOTO_SOURCE = "IMG_4921.PNG"  # High-resolution original used to build responsive WebP/AVIF versions
 BIO = """Results-oriented data analyst with proven expertise in Python, SQL, Tableau, and machine learning. Skilled at building predictive models, automating data pipelines, and developing AI/NLP-powered tools. Known for delivering insights that improve operations and support strategic decisions. Seeking opportunities in data analytics and business intelligence."""
 
+# ABOUT SECTION (Badges, fun facts, counters, values, interests and certifications)
+ACHIEVEMENTS = [
+    {"icon": "fas fa-trophy", "text": "95% accuracy in Face Detection Attendance System"},
+    {"icon": "fas fa-chart-bar", "text": "MAPE <5% in Sales Forecasting Model"},
+    {"icon": "fas fa-brain", "text": "92% accuracy in Sentiment Analysis NLP Pipeline"},
+    {"icon": "fas fa-graduation-cap", "text": "8.73/10.0 GPA in Information Technology"},
+    {"icon": "fas fa-code", "text": "4+ Projects in Machine Learning & AI"}
+]
+
+FUN_FACTS = [
+    {"icon": "☕", "text": "Can't start coding without a perfect cup of coffee"},
+    {"icon": "🌐", "text": "Fluent in 4 languages: Gujarati, Hindi, English, and German"},
+    {"icon": "🎯", "text": "Achieved 98% on-time delivery rate at Amazon DSP"},
+    {"icon": "🚀", "text": "Built a voice assistant with <2-second response time"},
+    {"icon": "📊", "text": "Analyzed 50,000+ product reviews for sentiment analysis"},
+    {"icon": "🔍", "text": "Optimized algorithms to reduce computation time by 40%"}
+]
+
+ANIMATED_STATS = [
+    {"value": 4, "label": "Projects Completed"},
+    {"value": 95, "label": "Best Model Accuracy"},
+    {"value": 4, "label": "Programming Languages"},
+    {"value": 15, "label": "Tools & Technologies"},
+    {"value": 8.73, "label": "University GPA"},
+    {"value": 1, "label": "Years Experience"}
+]
+
+CORE_VALUES = [
+    {"title": "Innovation", "icon": "fas fa-lightbulb", "description": "Always seeking creative solutions and embracing new technologies to solve complex problems."},
+    {"title": "Precision", "icon": "fas fa-crosshairs", "description": "Attention to detail and accuracy in every project, ensuring high-quality deliverables."},
+    {"title": "Collaboration", "icon": "fas fa-users", "description": "Working effectively with diverse teams to achieve common goals and share knowledge."},
+    {"title": "Growth", "icon": "fas fa-chart-line", "description": "Committed to continuous learning and professional development in emerging technologies."}
+]
+
+INTERESTS = ["Machine Learning Research", "Open Source Contributing", "Tech Blogging", "Data Visualization", "Cloud Computing", "Artificial Intelligence Ethics", "Photography", "Travel & Cultural Exchange"]
+
+CERTIFICATIONS = [
+    {"name": "Python for Data Science", "issuer": "Coursera", "year": "2023", "icon": "fab fa-python"},
+    {"name": "Machine Learning Specialization", "issuer": "Stanford Online", "year": "2023", "icon": "fas fa-robot"},
+    {"name": "SQL for Data Analysis", "issuer": "Udacity", "year": "2022", "icon": "fas fa-database"}
+]
+
 # SKILLS (Based on your actual projects and experience)
 PROGRAMMING_LANGUAGES = ["Python", "SQL", "JavaScript", "HTML/CSS"]
 WEB_DEVELOPMENT = ["Streamlit", "Flask", "HTML/CSS", "Bootstrap", "Dash"]
@@ -27,44 +73,334 @@ AI_ML = ["NLP", "Computer Vision", "OpenCV", "dlib", "Machine Learning", "Speech
 DATABASES = ["MySQL", "PostgreSQL", "SQLite", "Excel"]
 TOOLS_TECHNOLOGIES = ["Git", "Jupyter", "VS Code", "Power BI", "APIs", "Statistical Analysis"]
 
-# PROJECTS (Your actual projects from resume)
-PROJECT_1 = {
-    "title": "Sales Forecasting Using Time Series Analysis",
-    "description": "Forecasted retail sales using ARIMA in Python with MAPE <5%. Automated data preprocessing with Pandas/NumPy, reducing prep time by 50%. Visualized trends in Tableau, aiding stakeholder decision-making.",
-    "technologies": ["Python", "ARIMA", "Pandas", "NumPy", "Tableau", "Time Series Analysis"],
-    "github": "https://github.com/AaryaMody1301/Sales-Forcasting-Using-Time-Series-Analysis",
-    "demo": None,
-    "features": ["ARIMA Modeling", "Automated Preprocessing", "Tableau Visualizations", "MAPE <5% Accuracy"]
-}
-
-PROJECT_2 = {
-    "title": "Sentiment Analysis for Product Reviews", 
-    "description": "Developed an NLP pipeline in Python to analyse 50,000 product reviews with 92% accuracy. Implemented interactive dashboards with Matplotlib and Seaborn, providing real-time insights into customer sentiment trends.",
-    "technologies": ["Python", "NLP", "Matplotlib", "Seaborn", "Natural Language Processing"],
-    "github": "https://github.com/AaryaMody1301/Sentiment-Analysis-for-Product-Reviews",
-    "demo": None,
-    "features": ["NLP Pipeline", "92% Accuracy", "Interactive Dashboards", "Real-time Insights"]
+# SKILL CATEGORIES (Cards in the skills section; also indexed by the skill search box)
+SKILL_CATEGORIES = {
+    "Programming": {
+        "description": "Core programming languages that form the foundation of my development work",
+        "icon": "fas fa-code",
+        "color": "#3b82f6",
+        "skills": [
+            {
+                "name": "Python",
+                "icon": "fab fa-python",
+                "proficiency": 95,
+                "experience": "3+ years",
+                "projects": "8+ projects",
+                "description": "Primary language for data science, machine learning, and web development",
+                "badge": "Expert"
+            },
+            {
+                "name": "SQL",
+                "icon": "fas fa-database",
+                "proficiency": 90,
+                "experience": "2+ years",
+                "projects": "6+ projects",
+                "description": "Database querying, optimization, and data manipulation",
+                "badge": "Expert"
+            },
+            {
+                "name": "JavaScript",
+                "icon": "fab fa-js-square",
+                "proficiency": 75,
+                "experience": "1+ years",
+                "projects": "3+ projects",
+                "description": "Frontend development and interactive web applications",
+                "badge": "Advanced"
+            },
+            {
+                "name": "HTML/CSS",
+                "icon": "fab fa-html5",
+                "proficiency": 85,
+                "experience": "2+ years",
+                "projects": "5+ projects",
+                "description": "Modern web markup and styling with responsive design",
+                "badge": "Advanced"
+            }
+        ]
+    },
+    "Web Dev": {
+        "description": "Frameworks and tools for building modern web applications",
+        "icon": "fas fa-globe",
+        "color": "#10b981",
+        "skills": [
+            {
+                "name": "Streamlit",
+                "icon": "fas fa-rocket",
+                "proficiency": 90,
+                "experience": "1+ years",
+                "projects": "4+ projects",
+                "description": "Building interactive data applications and dashboards",
+                "badge": "Expert"
+            },
+            {
+                "name": "Flask",
+                "icon": "fas fa-flask",
+                "proficiency": 80,
+                "experience": "1+ years",
+                "projects": "2+ projects",
+                "description": "Lightweight web framework for API development",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Bootstrap",
+                "icon": "fab fa-bootstrap",
+                "proficiency": 75,
+                "experience": "1+ years",
+                "projects": "3+ projects",
+                "description": "Responsive CSS framework for rapid UI development",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Dash",
+                "icon": "fas fa-chart-line",
+                "proficiency": 70,
+                "experience": "6 months",
+                "projects": "1+ projects",
+                "description": "Python framework for building analytical web applications",
+                "badge": "Intermediate"
+            }
+        ]
+    },
+    "Data Science": {
+        "description": "Libraries and tools for data analysis, visualization, and statistical modeling",
+        "icon": "fas fa-chart-bar",
+        "color": "#8b5cf6",
+        "skills": [
+            {
+                "name": "Pandas",
+                "icon": "fas fa-table",
+                "proficiency": 95,
+                "experience": "2+ years",
+                "projects": "8+ projects",
+                "description": "Data manipulation, cleaning, and analysis",
+                "badge": "Expert"
+            },
+            {
+                "name": "NumPy",
+                "icon": "fas fa-calculator",
+                "proficiency": 90,
+                "experience": "2+ years",
+                "projects": "6+ projects",
+                "description": "Numerical computing and mathematical operations",
+                "badge": "Expert"
+            },
+            {
+                "name": "Matplotlib",
+                "icon": "fas fa-chart-line",
+                "proficiency": 85,
+                "experience": "2+ years",
+                "projects": "6+ projects",
+                "description": "Data visualization and plotting",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Seaborn",
+                "icon": "fas fa-palette",
+                "proficiency": 85,
+                "experience": "1+ years",
+                "projects": "4+ projects",
+                "description": "Statistical data visualization",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Plotly",
+                "icon": "fas fa-chart-pie",
+                "proficiency": 80,
+                "experience": "1+ years",
+                "projects": "3+ projects",
+                "description": "Interactive data visualizations",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Tableau",
+                "icon": "fas fa-chart-area",
+                "proficiency": 80,
+                "experience": "1+ years",
+                "projects": "2+ projects",
+                "description": "Business intelligence and data visualization",
+                "badge": "Advanced"
+            }
+        ]
+    },
+    "AI/ML": {
+        "description": "Machine learning, artificial intelligence, and computer vision technologies",
+        "icon": "fas fa-brain",
+        "color": "#f59e0b",
+        "skills": [
+            {
+                "name": "Scikit-learn",
+                "icon": "fas fa-robot",
+                "proficiency": 90,
+                "experience": "2+ years",
+                "projects": "6+ projects",
+                "description": "Machine learning algorithms and model development",
+                "badge": "Expert"
+            },
+            {
+                "name": "OpenCV",
+                "icon": "fas fa-eye",
+                "proficiency": 85,
+                "experience": "1+ years",
+                "projects": "2+ projects",
+                "description": "Computer vision and image processing",
+                "badge": "Advanced"
+            },
+            {
+                "name": "NLP",
+                "icon": "fas fa-comments",
+                "proficiency": 80,
+                "experience": "1+ years",
+                "projects": "3+ projects",
+                "description": "Natural language processing and text analysis",
+                "badge": "Advanced"
+            },
+            {
+                "name": "dlib",
+                "icon": "fas fa-user-check",
+                "proficiency": 75,
+                "experience": "6 months",
+                "projects": "1+ projects",
+                "description": "Face recognition and computer vision",
+                "badge": "Advanced"
+            }
+        ]
+    },
+    "Databases": {
+        "description": "Database management systems and data storage solutions",
+        "icon": "fas fa-database",
+        "color": "#ef4444",
+        "skills": [
+            {
+                "name": "MySQL",
+                "icon": "fas fa-database",
+                "proficiency": 85,
+                "experience": "1+ years",
+                "projects": "3+ projects",
+                "description": "Relational database management and optimization",
+                "badge": "Advanced"
+            },
+            {
+                "name": "PostgreSQL",
+                "icon": "fas fa-elephant",
+                "proficiency": 80,
+                "experience": "6 months",
+                "projects": "2+ projects",
+                "description": "Advanced relational database with complex queries",
+                "badge": "Advanced"
+            },
+            {
+                "name": "SQLite",
+                "icon": "fas fa-file-alt",
+                "proficiency": 90,
+                "experience": "2+ years",
+                "projects": "4+ projects",
+                "description": "Lightweight database for applications and prototyping",
+                "badge": "Expert"
+            },
+            {
+                "name": "Excel",
+                "icon": "fas fa-file-excel",
+                "proficiency": 85,
+                "experience": "3+ years",
+                "projects": "10+ projects",
+                "description": "Data analysis, reporting, and business intelligence",
+                "badge": "Advanced"
+            }
+        ]
+    },
+    "Tools": {
+        "description": "Development tools, IDEs, and productivity software",
+        "icon": "fas fa-tools",
+        "color": "#6b7280",
+        "skills": [
+            {
+                "name": "Git",
+                "icon": "fab fa-git-alt",
+                "proficiency": 85,
+                "experience": "2+ years",
+                "projects": "All projects",
+                "description": "Version control and collaborative development",
+                "badge": "Advanced"
+            },
+            {
+                "name": "Jupyter",
+                "icon": "fas fa-book",
+                "proficiency": 90,
+                "experience": "2+ years",
+                "projects": "8+ projects",
+                "description": "Interactive development and data analysis",
+                "badge": "Expert"
+            },
+            {
+                "name": "VS Code",
+                "icon": "fas fa-code",
+                "proficiency": 90,
+                "experience": "3+ years",
+                "projects": "All projects",
+                "description": "Primary IDE for development and debugging",
+                "badge": "Expert"
+            },
+            {
+                "name": "Power BI",
+                "icon": "fas fa-chart-pie",
+                "proficiency": 75,
+                "experience": "6 months",
+                "projects": "2+ projects",
+                "description": "Business analytics and data visualization",
+                "badge": "Intermediate"
+            }
+        ]
+    }
 }
 
-PROJECT_3 = {
-    "title": "Face Detection Attendance System",
-    "description": "Built a facial recognition attendance system in Python using OpenCV and dlib, achieving 95% accuracy across 100+ users. Optimized image processing algorithms to reduce computation time by 40%. Integrated SQLite for efficient storage and retrieval of attendance records.",
-    "technologies": ["Python", "OpenCV", "dlib", "SQLite", "Computer Vision"],
-    "github": "https://github.com/AaryaMody1301/Face_Detection_Attendance_System",
-    "demo": None,
-    "features": ["95% Accuracy", "100+ Users", "40% Speed Optimization", "SQLite Integration"]
+# SKILL SEARCH ALIASES (Other names the skill search box should find a skill by)
+SKILL_SEARCH_ALIASES = {
+    "JavaScript": ["JS", "ES6"],
+    "Scikit-learn": ["sklearn"],
+    "PostgreSQL": ["Postgres"],
+    "VS Code": ["VSCode"],
+    "Power BI": ["PowerBI"],
+    "NLP": ["Natural Language Processing"],
 }
 
-PROJECT_4 = {
-    "title": "FRIDAY Voice Assistant",
-    "description": "Developed a voice-activated AI assistant with Python, NLP, and APIs. Achieved 92% wake word accuracy and <2-second response time.",
-    "technologies": ["Python", "NLP", "APIs", "Speech Recognition", "AI"],
-    "github": "https://github.com/AaryaMody1301/friday-voice-assistant",
-    "demo": None,
-    "features": ["92% Wake Word Accuracy", "<2-second Response Time", "Voice Activation", "API Integration"]
-}
+# PROJECTS (Your actual projects from resume)
+PROJECTS = [
+    {
+        "title": "Sales Forecasting Using Time Series Analysis",
+        "description": "Forecasted retail sales using ARIMA in Python with MAPE <5%. Automated data preprocessing with Pandas/NumPy, reducing prep time by 50%. Visualized trends in Tableau, aiding stakeholder decision-making.",
+        "technologies": ["Python", "ARIMA", "Pandas", "NumPy", "Tableau", "Time Series Analysis"],
+        "github": "https://github.com/AaryaMody1301/Sales-Forcasting-Using-Time-Series-Analysis",
+        "demo": None,
+        "features": ["ARIMA Modeling", "Automated Preprocessing", "Tableau Visualizations", "MAPE <5% Accuracy"]
+    },
+    {
+        "title": "Sentiment Analysis for Product Reviews", 
+        "description": "Developed an NLP pipeline in Python to analyse 50,000 product reviews with 92% accuracy. Implemented interactive dashboards with Matplotlib and Seaborn, providing real-time insights into customer sentiment trends.",
+        "technologies": ["Python", "NLP", "Matplotlib", "Seaborn", "Natural Language Processing"],
+        "github": "https://github.com/AaryaMody1301/Sentiment-Analysis-for-Product-Reviews",
+        "demo": None,
+        "features": ["NLP Pipeline", "92% Accuracy", "Interactive Dashboards", "Real-time Insights"]
+    },
+    {
+        "title": "Face Detection Attendance System",
+        "description": "Built a facial recognition attendance system in Python using OpenCV and dlib, achieving 95% accuracy across 100+ users. Optimized image processing algorithms to reduce computation time by 40%. Integrated SQLite for efficient storage and retrieval of attendance records.",
+        "technologies": ["Python", "OpenCV", "dlib", "SQLite", "Computer Vision"],
+        "github": "https://github.com/AaryaMody1301/Face_Detection_Attendance_System",
+        "demo": None,
+        "features": ["95% Accuracy", "100+ Users", "40% Speed Optimization", "SQLite Integration"]
+    },
+    {
+        "title": "FRIDAY Voice Assistant",
+        "description": "Developed a voice-activated AI assistant with Python, NLP, and APIs. Achieved 92% wake word accuracy and <2-second response time.",
+        "technologies": ["Python", "NLP", "APIs", "Speech Recognition", "AI"],
+        "github": "https://github.com/AaryaMody1301/friday-voice-assistant",
+        "demo": None,
+        "features": ["92% Wake Word Accuracy", "<2-second Response Time", "Voice Activation", "API Integration"]
+    }
+]
 
-# Add more projects as needed...
+# Add more projects to the list as needed; the projects section pages through them
+PROJECTS_PER_PAGE = 4  # Project cards shown at first and added by each "Load more"
 
 # WORK EXPERIENCE (Your actual experience from resume)
 EXPERIENCE_1 = {
@@ -95,6 +431,48 @@ EXPERIENCE_2 = {
 
 # Add more experience entries as needed...
 
+# EXPERIENCE DETAILS (Timeline entries shown in the experience section)
+EXPERIENCE_DETAILS = [
+    {
+        "title": EXPERIENCE_1['title'],
+        "company": EXPERIENCE_1['company'],
+        "duration": EXPERIENCE_1['duration'],
+        "description": EXPERIENCE_1['description'],
+        "achievements": EXPERIENCE_1['achievements'],
+        "technologies": ["Excel", "SQL", "Python", "Data Analysis", "Web Research", "Data Visualization"],
+        "company_logo": "fas fa-chart-line",
+        "company_color": "#FF6B35",
+        "location": "Remote",
+        "employment_type": "Full-time",
+        "current": True,
+        "website": "https://transformsolutions.com",
+        "key_metrics": [
+            {"metric": "Projects", "value": "15+", "description": "Client projects completed"},
+            {"metric": "Accuracy", "value": "98%", "description": "Data accuracy achieved"},
+            {"metric": "Efficiency", "value": "40%", "description": "Process improvement"}
+        ]
+    },
+    {
+        "title": EXPERIENCE_2['title'],
+        "company": EXPERIENCE_2['company'],
+        "duration": EXPERIENCE_2['duration'],
+        "description": EXPERIENCE_2['description'],
+        "achievements": EXPERIENCE_2['achievements'],
+        "technologies": ["Logistics", "Process Optimization", "Team Collaboration", "Quality Control", "German Language"],
+        "company_logo": "fab fa-amazon",
+        "company_color": "#FF9900",
+        "location": "Schönefeld, Germany",
+        "employment_type": "Part-time",
+        "current": False,
+        "website": "https://amazon.com",
+        "key_metrics": [
+            {"metric": "Delivery Rate", "value": "98%", "description": "On-time delivery achieved"},
+            {"metric": "Daily Orders", "value": "100+", "description": "Orders processed daily"},
+            {"metric": "Efficiency", "value": "95%", "description": "Process efficiency maintained"}
+        ]
+    }
+]
+
 # EDUCATION (Your actual education details)
 EDUCATION_1 = {
     "degree": "Bachelor's in Information Technology",
@@ -105,6 +483,134 @@ EDUCATION_1 = {
     "thesis": "Face Recognition Attendance System (95% accuracy)"
 }
 
+# EDUCATION DETAILS (Cards, coursework and activities shown in the education section)
+EDUCATION_DETAILS = [
+    {
+        "degree": EDUCATION_1['degree'],
+        "major": "Information Technology",
+        "institution": EDUCATION_1['institution'],
+        "location": "Vadodara, Gujarat, India",
+        "year": EDUCATION_1['year'],
+        "duration": "3 years",
+        "gpa": EDUCATION_1['gpa'],
+        "gpa_scale": "10.0",
+        "relevant_courses": EDUCATION_1['relevant_courses'],
+        "thesis": EDUCATION_1['thesis'],
+        "degree_type": "Bachelor's",
+        "institution_logo": "fas fa-university",
+        "institution_color": "#2563eb",
+        "institution_website": "https://paruluniversity.ac.in",
+        "status": "Graduated",
+        "coursework": [
+            {
+                "name": "Data Structures and Algorithms",
+                "code": "IT301",
+                "description": "Advanced data structures, algorithm design, complexity analysis, and optimization techniques",
+                "grade": "A+",
+                "credits": 4
+            },
+            {
+                "name": "Database Management Systems",
+                "code": "IT302",
+                "description": "Relational databases, SQL, normalization, database design, and administration",
+                "grade": "A",
+                "credits": 4
+            },
+            {
+                "name": "Machine Learning",
+                "code": "IT401",
+                "description": "Supervised and unsupervised learning, neural networks, and practical ML applications",
+                "grade": "A+",
+                "credits": 4
+            },
+            {
+                "name": "Computer Vision",
+                "code": "IT402",
+                "description": "Image processing, object detection, facial recognition, and OpenCV implementation",
+                "grade": "A+",
+                "credits": 3
+            },
+            {
+                "name": "Software Engineering",
+                "code": "IT303",
+                "description": "Software development lifecycle, design patterns, testing, and project management",
+                "grade": "A",
+                "credits": 3
+            },
+            {
+                "name": "Web Development",
+                "code": "IT304",
+                "description": "Full-stack web development, HTML/CSS, JavaScript, and modern frameworks",
+                "grade": "A",
+                "credits": 3
+            }
+        ],
+        "academic_projects": [
+            {
+                "title": "Face Recognition Attendance System",
+                "description": "Capstone project achieving 95% accuracy using OpenCV and dlib for automated attendance tracking",
+                "technologies": ["Python", "OpenCV", "dlib", "SQLite"],
+                "grade": "A+",
+                "year": "2023"
+            },
+            {
+                "title": "E-commerce Database Design",
+                "description": "Comprehensive database design project for online retail system with advanced queries",
+                "technologies": ["MySQL", "Database Design", "SQL"],
+                "grade": "A",
+                "year": "2022"
+            },
+            {
+                "title": "Machine Learning Portfolio",
+                "description": "Collection of ML projects including classification, regression, and clustering algorithms",
+                "technologies": ["Python", "Scikit-learn", "Pandas", "NumPy"],
+                "grade": "A+",
+                "year": "2022"
+            }
+        ],
+        "achievements": [
+            {
+                "title": "Dean's List",
+                "description": "Academic excellence recognition for maintaining high GPA",
+                "year": "2022-2023",
+                "icon": "fas fa-medal"
+            },
+            {
+                "title": "Best Capstone Project",
+                "description": "Recognition for outstanding final year project in Computer Vision",
+                "year": "2023",
+                "icon": "fas fa-trophy"
+            },
+            {
+                "title": "Technology Innovation Award",
+                "description": "Award for innovative application of AI in practical solutions",
+                "year": "2023",
+                "icon": "fas fa-award"
+            }
+        ],
+        "extracurricular": [
+            {
+                "activity": "Coding Club President",
+                "description": "Led programming workshops and coding competitions for 200+ students",
+                "year": "2022-2023",
+                "icon": "fas fa-users"
+            },
+            {
+                "activity": "Tech Symposium Organizer",
+                "description": "Organized annual technology symposium with industry speakers",
+                "year": "2022",
+                "icon": "fas fa-calendar-alt"
+            },
+            {
+                "activity": "Research Assistant",
+                "description": "Assisted faculty in computer vision research projects",
+                "year": "2022-2023",
+                "icon": "fas fa-microscope"
+            }
+        ]
+    }
+]
+
 # LANGUAGES
 LANGUAGES = {
     "Gujarati": "Native",
@@ -121,6 +627,19 @@ SOCIAL_LINKS = {
     "phone": f"tel:{PHONE}"
 }
 
+# CONTACT FORM (Subjects offered in the contact form; the first entry is the placeholder)
+CONTACT_SUBJECTS = [
+    "Select a subject...",
+    "💼 Job Opportunity",
+    "🤝 Collaboration Proposal",
+    "📊 Data Science Project",
+    "🔧 Technical Consultation",
+    "🎓 Academic/Research Inquiry",
+    "💬 General Question",
+    "🚀 Startup/Freelance Project",
+    "Other"
+]
+
 # QUICK STATS (Based on your actual achievements)
 STATS = {
     "projects_completed": "4+",
@@ -139,6 +658,57 @@ PROFICIENCY = {
     "Tableau": "Advanced",
 }
 
+# LAZY SECTIONS (Skills, experience, education and contact render when the visitor scrolls or navigates to them)
+LAZY_SECTIONS = True  # Set to False to render every section on the first page load
+
+# METRICS (Per-section render counters and latency histograms in Prometheus text format)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))  # e.g. 9464 serves http://127.0.0.1:9464/metrics; 0 disables
+METRICS_FILE = os.getenv("METRICS_FILE", "")  # e.g. a node_exporter textfile collector path; empty disables
+METRICS_FILE_INTERVAL = 15  # Seconds between metrics file writes
+
+# WEB VITALS (LCP, CLS, INP, FCP and navigation timings reported by visitors' browsers; see ?debug=vitals)
+WEB_VITALS_REPORTING = True  # Set to False to stop collecting real-user metrics
+WEB_VITALS_BATCH_SECONDS = 30  # Minimum seconds between batches sent by one browser
+
+# CONTACT FORM DELIVERY (Messages are saved to a SQLite outbox and emailed by a background worker; see contact_outbox.py)
+CONTACT_OUTBOX_PATH = str(Path(__file__).parent / os.getenv("CONTACT_OUTBOX_PATH", "contact_outbox.sqlite3"))  # Relative paths are resolved against this folder
+CONTACT_RECIPIENT = os.getenv("CONTACT_RECIPIENT", EMAIL)  # Where contact messages are sent
+SMTP_HOST = os.getenv("SMTP_HOST", "")  # Empty keeps messages in the outbox without sending them
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USERNAME = os.getenv("SMTP_USERNAME", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") == "1"
+SMTP_SENDER = os.getenv("SMTP_SENDER", "")  # From address; defaults to CONTACT_RECIPIENT
+CONTACT_SMTP_POOL_SIZE = 2  # SMTP connections kept open, and messages sent at once
+CONTACT_BATCH_SIZE = 20  # Messages claimed per delivery round
+CONTACT_POLL_SECONDS = 15  # How often the worker looks for retries that have fallen due
+CONTACT_MAX_ATTEMPTS = 8  # Attempts before a message is marked failed
+CONTACT_RETRY_BASE_SECONDS = 30  # Backoff after the first failure; doubles with every attempt
+CONTACT_RETRY_MAX_SECONDS = 3600  # Longest backoff
+
+# CONTACT FORM RATE LIMITS (Token buckets per session and per client address, plus site-wide limits)
+CONTACT_SESSION_BURST = 3  # Messages one session can send back to back
+CONTACT_SESSION_PER_HOUR = 6  # Rate one session's allowance refills at
+CONTACT_ADDRESS_BURST = 10  # Messages one client address can send back to back (shared by a NAT or office)
+CONTACT_ADDRESS_PER_HOUR = 30
+CONTACT_GLOBAL_PER_MINUTE = 60  # Submissions accepted per minute across all visitors
+CONTACT_MAX_CONCURRENT = 8  # Submissions processed at once
+CONTACT_TRUST_FORWARDED_FOR = os.getenv("CONTACT_TRUST_FORWARDED_FOR", "") == "1"  # Set to 1 behind a reverse proxy
+
+# IMAGE BATCHES (Responsive copies optimize_image.py builds for every image in a folder, e.g. a gallery)
+IMAGE_BATCH_OUTPUT = "static/img/gallery"  # Served at app/static/img/gallery/ when static serving is on
+IMAGE_BATCH_WIDTHS = (320, 640, 1280)  # Widths in pixels; sources are never upscaled
+IMAGE_BATCH_FORMATS = None  # e.g. ["WEBP", "JPEG"]; None builds every format Pillow can encode (AVIF, WebP, JPEG)
+IMAGE_BATCH_QUALITY = 80  # Encoder quality (1-100)
+
+# IMAGE METADATA (Image dimensions and formats read from file headers, kept in a SQLite index; see image_metadata.py)
+IMAGE_METADATA_INDEX = str(Path(__file__).parent / os.getenv("IMAGE_METADATA_INDEX", "image_metadata.sqlite3"))  # Relative paths are resolved against this folder
+
+# MEMORY TRACKING (Sampled tracemalloc snapshots; slows allocations, so off unless MEMORY_TRACKING=1)
+MEMORY_TRACKING = os.getenv("MEMORY_TRACKING", "") == "1"
+MEMORY_SAMPLE_EVERY = 50  # Snapshot one rerun in this many
+MEMORY_TOP_SITES = 10  # Allocation sites shown per report
+
 # COLOR SCHEME (You can customize these colors)
 # NOTES:
 # - Make sure all URLs are valid and accessible
@@ -0,0 +1,575 @@
+"""
+Portfolio Contact Outbox
+========================
+
+Durable, asynchronous delivery of contact form messages.
+
+Submitting the form only inserts a row into a SQLite outbox (WAL journal, so
+the insert never waits for the worker's reads) and returns. A background
+worker claims due messages in batches and emails them to the site owner over
+pooled SMTP connections. A message that fails is retried with exponential
+backoff and jitter until ``max_attempts``, then marked ``failed`` and kept.
+The form therefore responds in the time of one local insert, whether the mail
+relay is fast, slow or down, and no message is lost when the app restarts:
+claimed messages that were never confirmed become due again once their lease
+runs out. Delivery is at least once.
+
+Without ``SMTP_HOST`` messages are only stored. For local testing, run a
+debugging SMTP server that prints every message instead of sending it::
+
+    pip install aiosmtpd
+    python -m aiosmtpd -n -l localhost:1025
+    SMTP_HOST=localhost SMTP_PORT=1025 SMTP_STARTTLS=0 streamlit run app.py
+
+Usage:
+    python contact_outbox.py            # show the outbox status
+    python contact_outbox.py --send     # deliver the due messages once
+    python contact_outbox.py --retry    # make failed messages due again
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import sys
+import time
+import queue
+import random
+import sqlite3
+import smtplib
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import formataddr, make_msgid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    company TEXT NOT NULL DEFAULT '',
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+# Seconds a claimed message stays reserved for the worker that claimed it;
+# afterwards it is due again, so messages claimed before a crash are not lost
+CLAIM_LEASE_SECONDS = 300
+
+class OutboxMessage(NamedTuple):
+    """A queued contact form message."""
+    id: int
+    created_at: float
+    name: str
+    email: str
+    company: str
+    subject: str
+    message: str
+    attempts: int
+
+class SmtpSettings(NamedTuple):
+    """Where and as whom the worker sends mail."""
+    host: str
+    port: int = 587
+    username: str = ""
+    password: str = ""
+    starttls: bool = True
+    sender: str = ""
+    recipient: str = ""
+    timeout: float = 10.0
+
+def smtp_settings_from_config() -> SmtpSettings:
+    """SMTP settings from ``config.py`` (and the environment variables it reads)."""
+    import config
+
+    return SmtpSettings(
+        host=config.SMTP_HOST,
+        port=config.SMTP_PORT,
+        username=config.SMTP_USERNAME,
+        password=config.SMTP_PASSWORD,
+        starttls=config.SMTP_STARTTLS,
+        sender=config.SMTP_SENDER,
+        recipient=config.CONTACT_RECIPIENT,
+    )
+
+def retry_delay(attempts: int, base: float, cap: float) -> float:
+    """
+    Backoff before the next attempt: exponential, capped, with jitter.
+
+    Args:
+        attempts (int): Attempts made so far (at least 1)
+        base (float): Delay after the first failure, in seconds
+        cap (float): Longest delay, in seconds
+
+    Returns:
+        float: Seconds to wait, between half and all of ``base * 2 ** (attempts - 1)``
+    """
+    delay = min(cap, base * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+# Outbox
+# ======
+
+class ContactOutbox:
+    """
+    SQLite table of contact messages waiting to be delivered.
+
+    Safe to share between threads: each thread gets its own connection.
+    Several processes may use the same file; claims are made in ``BEGIN
+    IMMEDIATE`` transactions, so two workers never claim the same message.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._wake = threading.Event()
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        # WAL: readers and the single writer do not block each other; NORMAL is durable under WAL
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        yield connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction, taking the write lock up front."""
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def enqueue(self, name: str, email: str, company: str, subject: str, message: str) -> int:
+        """
+        Queue a message for delivery and wake the worker.
+
+        Args:
+            name (str): Sender's name
+            email (str): Sender's email address (used as Reply-To)
+            company (str): Sender's company, may be empty
+            subject (str): Selected subject
+            message (str): Message text
+
+        Returns:
+            int: Outbox id of the message
+
+        Raises:
+            sqlite3.Error: If the outbox cannot be written
+        """
+        now = time.time()
+        try:
+            with self._connection() as connection:
+                cursor = connection.execute(
+                    "INSERT INTO outbox (created_at, name, email, company, subject, message, next_attempt_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (now, name, email, company, subject, message, now),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Could not save contact message to {self.path}: {e}")
+            raise
+        self._wake.set()
+        return cursor.lastrowid
+
+    def claim_due(self, limit: int, lease: float = CLAIM_LEASE_SECONDS) -> List[OutboxMessage]:
+        """
+        Reserve up to ``limit`` due messages, oldest first.
+
+        Args:
+            limit (int): Largest number of messages to claim
+            lease (float): Seconds before an unconfirmed claim expires
+
+        Returns:
+            List[OutboxMessage]: Claimed messages
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT id, created_at, name, email, company, subject, message, attempts FROM outbox "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            if rows:
+                connection.executemany(
+                    "UPDATE outbox SET next_attempt_at = ? WHERE id = ?", [(now + lease, row["id"]) for row in rows]
+                )
+        return [OutboxMessage(*row) for row in rows]
+
+    def mark_sent(self, ids: Sequence[int]) -> None:
+        """Record successful deliveries."""
+        if not ids:
+            return
+        now = time.time()
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE outbox SET status = 'sent', sent_at = ?, attempts = attempts + 1, last_error = NULL "
+                "WHERE id = ?",
+                [(now, message_id) for message_id in ids],
+            )
+
+    def mark_failed(self, message: OutboxMessage, error: str, max_attempts: int, base: float, cap: float) -> bool:
+        """
+        Record a failed delivery and schedule the retry.
+
+        Args:
+            message (OutboxMessage): The message that could not be sent
+            error (str): Error description, kept for inspection
+            max_attempts (int): Attempts after which the message is given up
+            base (float): Backoff after the first failure, in seconds
+            cap (float): Longest backoff, in seconds
+
+        Returns:
+            bool: True if the message will be retried, False if it was given up
+        """
+        attempts = message.attempts + 1
+        retry = attempts < max_attempts
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                (
+                    "pending" if retry else "failed", attempts, error[:500],
+                    time.time() + retry_delay(attempts, base, cap), message.id,
+                ),
+            )
+        return retry
+
+    def retry_failed(self) -> int:
+        """Make every failed message due again with a fresh attempt count; returns how many."""
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE status = 'failed'",
+                (time.time(),),
+            )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Outbox status.
+
+        Returns:
+            Dict[str, Any]: Message count per status, and the age in seconds
+            of the oldest message still pending
+        """
+        with self._connection() as connection:
+            counts = dict(connection.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+            oldest = connection.execute("SELECT MIN(created_at) FROM outbox WHERE status = 'pending'").fetchone()[0]
+        return {
+            "pending": counts.get("pending", 0),
+            "sent": counts.get("sent", 0),
+            "failed": counts.get("failed", 0),
+            "oldest_pending_seconds": round(time.time() - oldest, 1) if oldest else None,
+        }
+
+    def wait_for_messages(self, timeout: float) -> None:
+        """Block until a message is enqueued in this process or ``timeout`` passes."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def wake(self) -> None:
+        """Wake a worker blocked in :meth:`wait_for_messages`."""
+        self._wake.set()
+
+# SMTP Delivery
+# =============
+
+def build_email(message: OutboxMessage, settings: SmtpSettings) -> EmailMessage:
+    """
+    Turn a contact message into the email sent to the site owner.
+
+    Args:
+        message (OutboxMessage): Queued message
+        settings (SmtpSettings): Sender and recipient addresses
+
+    Returns:
+        EmailMessage: Plain-text email with the visitor as Reply-To
+    """
+    # Header values are collapsed to one line; the visitor controls them
+    name = " ".join(message.name.split())
+    subject = " ".join(message.subject.split())
+
+    email = EmailMessage()
+    email["From"] = formataddr(("Portfolio contact form", settings.sender or settings.recipient))
+    email["To"] = settings.recipient
+    email["Reply-To"] = formataddr((name, message.email.strip()))
+    email["Subject"] = f"[Portfolio] {subject} from {name}"
+    email["Message-ID"] = make_msgid(idstring=f"contact-{message.id}")
+    email.set_content(
+        f"Name: {name}\n"
+        f"Email: {message.email}\n"
+        f"Company: {message.company or 'Not specified'}\n"
+        f"Subject: {subject}\n"
+        f"Sent: {time.strftime('%Y-%m-%d %H:%M:%S %Z', time.localtime(message.created_at))}\n\n"
+        f"{message.message}\n"
+    )
+    return email
+
+class SmtpPool:
+    """
+    Reusable, authenticated SMTP connections.
+
+    A connection is opened on first use and returned to the pool after each
+    message, so a batch pays the TCP, TLS and login handshakes once per
+    connection rather than once per message. Connections idle for longer
+    than ``idle_timeout`` are closed instead of reused (relays drop them).
+    """
+
+    def __init__(self, settings: SmtpSettings, size: int = 2, idle_timeout: float = 60.0):
+        self.settings = settings
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+    def _open(self) -> smtplib.SMTP:
+        settings = self.settings
+        connection = smtplib.SMTP(settings.host, settings.port, timeout=settings.timeout)
+        try:
+            if settings.starttls:
+                connection.starttls()
+            if settings.username:
+                connection.login(settings.username, settings.password)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def _close(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection; it goes back to the pool unless sending failed.
+
+        Yields:
+            smtplib.SMTP: A connected (and logged in) client
+        """
+        connection = None
+        while connection is None:
+            try:
+                candidate, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._open()
+                break
+            if time.monotonic() - idle_since < self.idle_timeout:
+                connection = candidate
+            else:
+                self._close(candidate)
+
+        try:
+            yield connection
+        except BaseException:
+            self._close(connection)
+            raise
+        if self._idle.qsize() < self.size:
+            self._idle.put((connection, time.monotonic()))
+        else:
+            self._close(connection)
+
+    def send(self, email: EmailMessage) -> None:
+        """Send one email, retrying once on a fresh connection if a pooled one went stale."""
+        try:
+            with self.connection() as connection:
+                connection.send_message(email)
+        except smtplib.SMTPServerDisconnected:
+            with self.connection() as connection:
+                connection.send_message(email)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(connection)
+
+def deliver_due(
+    outbox: ContactOutbox,
+    pool: SmtpPool,
+    batch_size: int = 20,
+    max_attempts: int = 8,
+    retry_base: float = 30.0,
+    retry_cap: float = 3600.0
+) -> Dict[str, int]:
+    """
+    Claim one batch of due messages and send it over the pool's connections.
+
+    Args:
+        outbox (ContactOutbox): Outbox to deliver from
+        pool (SmtpPool): SMTP connections; up to ``pool.size`` messages are sent at once
+        batch_size (int): Largest number of messages to claim
+        max_attempts (int): Attempts after which a message is given up
+        retry_base (float): Backoff after the first failure, in seconds
+        retry_cap (float): Longest backoff, in seconds
+
+    Returns:
+        Dict[str, int]: Number of messages ``sent``, ``retrying`` and ``failed``
+    """
+    messages = outbox.claim_due(batch_size)
+    result = {"sent": 0, "retrying": 0, "failed": 0}
+    if not messages:
+        return result
+
+    def send(message: OutboxMessage) -> Optional[str]:
+        try:
+            pool.send(build_email(message, pool.settings))
+            return None
+        except (smtplib.SMTPException, OSError, ValueError) as e:
+            return f"{type(e).__name__}: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(1, min(pool.size, len(messages)))) as executor:
+        errors = list(executor.map(send, messages))
+
+    outbox.mark_sent([message.id for message, error in zip(messages, errors) if error is None])
+    result["sent"] = errors.count(None)
+    for message, error in zip(messages, errors):
+        if error is None:
+            continue
+        if outbox.mark_failed(message, error, max_attempts, retry_base, retry_cap):
+            result["retrying"] += 1
+            logger.warning(f"Contact message {message.id} not sent (attempt {message.attempts + 1}): {error}")
+        else:
+            result["failed"] += 1
+            logger.error(f"Contact message {message.id} given up after {message.attempts + 1} attempts: {error}")
+    return result
+
+# Worker
+# ======
+
+class OutboxWorker(threading.Thread):
+    """Daemon thread delivering the outbox whenever messages arrive or fall due."""
+
+    def __init__(
+        self,
+        outbox: ContactOutbox,
+        pool: SmtpPool,
+        poll_interval: float = 15.0,
+        batch_size: int = 20,
+        max_attempts: int = 8,
+        retry_base: float = 30.0,
+        retry_cap: float = 3600.0
+    ):
+        super().__init__(name="contact-outbox", daemon=True)
+        self.outbox = outbox
+        self.pool = pool
+        self.poll_interval = poll_interval
+        self.options = dict(batch_size=batch_size, max_attempts=max_attempts, retry_base=retry_base, retry_cap=retry_cap)
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                result = deliver_due(self.outbox, self.pool, **self.options)
+            except sqlite3.Error as e:
+                logger.error(f"Contact outbox unavailable: {e}")
+                result = {"sent": 0}
+            if result["sent"]:
+                logger.info(f"Sent {result['sent']} contact message(s)")
+            # A full batch may mean more is due; otherwise sleep until a new message or the next poll
+            if result["sent"] < self.options["batch_size"]:
+                self.outbox.wait_for_messages(self.poll_interval)
+        self.pool.close()
+
+    def stop(self) -> None:
+        """Stop after the current batch."""
+        self._stop_event.set()
+        self.outbox.wake()
+
+_worker_lock = threading.Lock()
+_worker: Optional[OutboxWorker] = None
+
+def start_worker(outbox: ContactOutbox, settings: SmtpSettings, pool_size: int = 2, **options: Any) -> Optional[OutboxWorker]:
+    """
+    Start the delivery worker for ``outbox`` once per process.
+
+    Args:
+        outbox (ContactOutbox): Outbox to deliver from
+        settings (SmtpSettings): SMTP relay; without a host no worker is started
+        pool_size (int): SMTP connections kept open
+        **options: Further :class:`OutboxWorker` arguments
+
+    Returns:
+        Optional[OutboxWorker]: The running worker, or None if SMTP is not configured
+    """
+    global _worker
+    if not settings.host or not settings.recipient:
+        logger.info("SMTP_HOST not set; contact messages are kept in the outbox")
+        return None
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = OutboxWorker(outbox, SmtpPool(settings, size=pool_size), **options)
+            _worker.start()
+            logger.info(f"Delivering contact messages via {settings.host}:{settings.port}")
+        return _worker
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    from config import (
+        CONTACT_OUTBOX_PATH, CONTACT_SMTP_POOL_SIZE, CONTACT_MAX_ATTEMPTS,
+        CONTACT_RETRY_BASE_SECONDS, CONTACT_RETRY_MAX_SECONDS
+    )
+
+    parser = argparse.ArgumentParser(description="Inspect and deliver the contact form outbox.")
+    parser.add_argument("--send", action="store_true", help="deliver the due messages once, then exit")
+    parser.add_argument("--retry", action="store_true", help="make failed messages due again")
+    args = parser.parse_args(argv)
+
+    outbox = ContactOutbox(CONTACT_OUTBOX_PATH)
+    if args.retry:
+        print(f"🔁 {outbox.retry_failed()} failed message(s) queued again")
+    if args.send:
+        settings = smtp_settings_from_config()
+        if not settings.host:
+            print("❌ SMTP_HOST is not set")
+            return 1
+        pool = SmtpPool(settings, size=CONTACT_SMTP_POOL_SIZE)
+        try:
+            result = deliver_due(
+                outbox, pool, batch_size=1000, max_attempts=CONTACT_MAX_ATTEMPTS,
+                retry_base=CONTACT_RETRY_BASE_SECONDS, retry_cap=CONTACT_RETRY_MAX_SECONDS
+            )
+        finally:
+            pool.close()
+        print(f"📨 Sent {result['sent']}, retrying {result['retrying']}, failed {result['failed']}")
+
+    stats = outbox.stats()
+    oldest = f" (oldest {stats['oldest_pending_seconds']:.0f}s)" if stats["oldest_pending_seconds"] is not None else ""
+    print(f"📬 {CONTACT_OUTBOX_PATH}: {stats['pending']} pending{oldest}, {stats['sent']} sent, {stats['failed']} failed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
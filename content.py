@@ -0,0 +1,304 @@
+"""
+Portfolio Content Records
+=========================
+
+Typed, read-only view of the portfolio content defined in ``config.py``.
+
+The content is converted once, when this module is first imported, into
+frozen dataclass records with ``__slots__`` and tuples instead of lists. The
+resulting ``CONTENT`` object is shared by every session and every rerun, so
+rendering a section allocates no content data, and ``sections.py``,
+``app.py``, ``skill_search.py`` and ``export_static.py`` all render from the
+same canonical source.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import logging
+from dataclasses import dataclass, fields, is_dataclass
+from types import ModuleType
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+
+import config
+
+logger = logging.getLogger(__name__)
+
+Record = TypeVar("Record")
+
+# About Section
+# =============
+
+@dataclass(frozen=True)
+class IconText:
+    """An icon next to a line of text (achievement badges, fun facts)."""
+    __slots__ = ("icon", "text")
+    icon: str
+    text: str
+
+@dataclass(frozen=True)
+class Counter:
+    """An animated counter shown under the about text."""
+    __slots__ = ("value", "label")
+    value: Union[int, float]
+    label: str
+
+@dataclass(frozen=True)
+class CoreValue:
+    """A card in the "My Core Values" grid."""
+    __slots__ = ("title", "icon", "description")
+    title: str
+    icon: str
+    description: str
+
+@dataclass(frozen=True)
+class Certification:
+    """A certification badge."""
+    __slots__ = ("name", "issuer", "year", "icon")
+    name: str
+    issuer: str
+    year: str
+    icon: str
+
+# Skills Section
+# ==============
+
+@dataclass(frozen=True)
+class Skill:
+    """A single skill card."""
+    __slots__ = ("name", "icon", "proficiency", "experience", "projects", "description", "badge")
+    name: str
+    icon: str
+    proficiency: int
+    experience: str
+    projects: str
+    description: str
+    badge: str
+
+@dataclass(frozen=True)
+class SkillCategory:
+    """A skill category and its skills, in display order."""
+    __slots__ = ("name", "description", "icon", "color", "skills")
+    name: str
+    description: str
+    icon: str
+    color: str
+    skills: Tuple[Skill, ...]
+
+# Projects Section
+# ================
+
+@dataclass(frozen=True)
+class Project:
+    """A project card."""
+    __slots__ = ("title", "description", "technologies", "github", "demo", "features")
+    title: str
+    description: str
+    technologies: Tuple[str, ...]
+    github: str
+    demo: Optional[str]
+    features: Tuple[str, ...]
+
+# Experience Section
+# ==================
+
+@dataclass(frozen=True)
+class KeyMetric:
+    """A headline number shown in a position's achievements."""
+    __slots__ = ("metric", "value", "description")
+    metric: str
+    value: str
+    description: str
+
+@dataclass(frozen=True)
+class Experience:
+    """A position on the experience timeline."""
+    __slots__ = (
+        "title", "company", "duration", "description", "achievements", "technologies",
+        "company_logo", "company_color", "location", "employment_type", "current", "website", "key_metrics"
+    )
+    title: str
+    company: str
+    duration: str
+    description: str
+    achievements: Tuple[str, ...]
+    technologies: Tuple[str, ...]
+    company_logo: str
+    company_color: str
+    location: str
+    employment_type: str
+    current: bool
+    website: str
+    key_metrics: Tuple[KeyMetric, ...]
+
+# Education Section
+# =================
+
+@dataclass(frozen=True)
+class Course:
+    """A course in the coursework grid."""
+    __slots__ = ("name", "code", "description", "grade", "credits")
+    name: str
+    code: str
+    description: str
+    grade: str
+    credits: int
+
+@dataclass(frozen=True)
+class AcademicProject:
+    """An academic project card."""
+    __slots__ = ("title", "description", "technologies", "grade", "year")
+    title: str
+    description: str
+    technologies: Tuple[str, ...]
+    grade: str
+    year: str
+
+@dataclass(frozen=True)
+class AcademicAchievement:
+    """An academic achievement card."""
+    __slots__ = ("title", "description", "icon", "year")
+    title: str
+    description: str
+    icon: str
+    year: str
+
+@dataclass(frozen=True)
+class Activity:
+    """An extracurricular activity card."""
+    __slots__ = ("activity", "description", "icon", "year")
+    activity: str
+    description: str
+    icon: str
+    year: str
+
+@dataclass(frozen=True)
+class Education:
+    """A degree with its coursework, projects and activities."""
+    __slots__ = (
+        "degree", "major", "institution", "location", "year", "duration", "gpa", "gpa_scale",
+        "relevant_courses", "thesis", "degree_type", "institution_logo", "institution_color",
+        "institution_website", "status", "coursework", "academic_projects", "achievements", "extracurricular"
+    )
+    degree: str
+    major: str
+    institution: str
+    location: str
+    year: str
+    duration: str
+    gpa: str
+    gpa_scale: str
+    relevant_courses: Tuple[str, ...]
+    thesis: str
+    degree_type: str
+    institution_logo: str
+    institution_color: str
+    institution_website: str
+    status: str
+    coursework: Tuple[Course, ...]
+    academic_projects: Tuple[AcademicProject, ...]
+    achievements: Tuple[AcademicAchievement, ...]
+    extracurricular: Tuple[Activity, ...]
+
+# Content
+# =======
+
+@dataclass(frozen=True)
+class Content:
+    """All structured portfolio content."""
+    __slots__ = (
+        "achievements", "fun_facts", "animated_stats", "core_values", "interests", "certifications",
+        "skill_categories", "projects", "experience", "education"
+    )
+    achievements: Tuple[IconText, ...]
+    fun_facts: Tuple[IconText, ...]
+    animated_stats: Tuple[Counter, ...]
+    core_values: Tuple[CoreValue, ...]
+    interests: Tuple[str, ...]
+    certifications: Tuple[Certification, ...]
+    skill_categories: Tuple[SkillCategory, ...]
+    projects: Tuple[Project, ...]
+    experience: Tuple[Experience, ...]
+    education: Tuple[Education, ...]
+
+    def skill_category(self, name: str) -> Optional[SkillCategory]:
+        """Return the skill category called ``name``, if any."""
+        for category in self.skill_categories:
+            if category.name == name:
+                return category
+        return None
+
+    def project_pages(self, per_page: int) -> Tuple[Tuple[Project, ...], ...]:
+        """Split the projects into consecutive pages of ``per_page`` cards."""
+        per_page = max(1, per_page)
+        return tuple(self.projects[start:start + per_page] for start in range(0, len(self.projects), per_page))
+
+def _convert(value: Any, annotation: Any, path: str) -> Any:
+    """Convert plain config data to the type named by a record field annotation."""
+    if is_dataclass(annotation):
+        return build_record(annotation, value, path)
+    if get_origin(annotation) is tuple:
+        item_type = get_args(annotation)[0]
+        return tuple(_convert(item, item_type, f"{path}[{i}]") for i, item in enumerate(value))
+    return value
+
+def build_record(cls: Type[Record], data: Mapping[str, Any], path: str = "") -> Record:
+    """
+    Build a record, and the records nested in it, from a config dict.
+
+    Args:
+        cls (Type[Record]): Record class
+        data (Mapping[str, Any]): Plain dict from ``config.py``
+        path (str): Location of ``data`` in the config, used in error messages
+
+    Returns:
+        Record: The frozen record
+
+    Raises:
+        ValueError: If ``data`` has missing or unknown keys
+    """
+    path = path or cls.__name__
+    hints = get_type_hints(cls)
+    names = {field.name for field in fields(cls)}
+
+    missing = names - data.keys()
+    unknown = data.keys() - names
+    if missing or unknown:
+        raise ValueError(
+            f"Invalid {cls.__name__} at {path}: missing {sorted(missing)}, unknown {sorted(unknown)}"
+        )
+
+    return cls(**{name: _convert(data[name], hints[name], f"{path}.{name}") for name in names})
+
+def load_content(source: ModuleType = config) -> Content:
+    """
+    Convert the content defined in a config module into records.
+
+    Args:
+        source (ModuleType): Module defining the content (``config`` by default)
+
+    Returns:
+        Content: The frozen content records
+    """
+    data: Dict[str, Any] = {
+        "achievements": source.ACHIEVEMENTS,
+        "fun_facts": source.FUN_FACTS,
+        "animated_stats": source.ANIMATED_STATS,
+        "core_values": source.CORE_VALUES,
+        "interests": source.INTERESTS,
+        "certifications": source.CERTIFICATIONS,
+        "skill_categories": [{"name": name, **category} for name, category in source.SKILL_CATEGORIES.items()],
+        "projects": source.PROJECTS,
+        "experience": source.EXPERIENCE_DETAILS,
+        "education": source.EDUCATION_DETAILS,
+    }
+    content = build_record(Content, data, source.__name__)
+    logger.info(
+        f"Loaded content: {sum(len(category.skills) for category in content.skill_categories)} skills, "
+        f"{len(content.projects)} projects, {len(content.experience)} positions, {len(content.education)} degrees"
+    )
+    return content
+
+# Loaded once per process and shared read-only by every session
+CONTENT = load_content()
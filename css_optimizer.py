@@ -0,0 +1,293 @@
+"""
+Portfolio Stylesheet Optimizer
+==============================
+
+Trims ``style.css`` to the rules the page can use and splits out the rules
+needed to paint the navbar and hero.
+
+- :func:`purge_css` drops every selector naming a class or id that the page
+  never emits. Names are collected the way PurgeCSS does it: every word in
+  the modules that build the markup (``PAGE_SOURCES``) counts as used, plus
+  the classes ``sections.content_classes`` derives from content. Streamlit's
+  own widget classes (``stButton``, ``st-key-...``) are always kept, and so
+  are ``@keyframes`` that a kept rule still animates with (the last
+  definition of each name only, which is the one browsers apply).
+- :func:`critical_css` keeps the rules whose selectors only name classes and
+  ids found in the given markup, plus global rules (``:root``, ``body``,
+  headings), ``@import`` and ``@font-face``.
+
+Both work on minified CSS (see ``assets.minify_css``): comments are gone, and
+quoted strings are respected.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+ROOT = Path(__file__).parent
+
+# Modules whose text can end up in the page's markup or class lists
+PAGE_SOURCES = [
+    ROOT / "app.py",
+    ROOT / "sections.py",
+    ROOT / "config.py",
+    *sorted((ROOT / "js").glob("*.js")),
+]
+
+# Classes Streamlit puts on its own elements
+SAFELIST_PATTERN = re.compile(r'st[A-Z]\w*|st-[\w-]+')
+
+# At-rules holding nested rules rather than declarations
+_GROUPING_RULES = ("@media", "@supports", "@layer", "@container", "@document")
+
+_WORD_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+_NAME_PATTERN = re.compile(r'[.#](-?[A-Za-z_][\w-]*)')
+_ATTRIBUTE_PATTERN = re.compile(r'\[[^\]]*\]')
+_HTML_ATTRIBUTE_PATTERN = re.compile(r'\b(class|id)\s*=\s*["\']([^"\']*)["\']')
+_ANIMATION_PATTERN = re.compile(r'animation(?:-name)?\s*:([^;}]*)')
+
+class CssBlock(NamedTuple):
+    """
+    One top-level item of a stylesheet.
+
+    ``body`` is None for statements such as ``@import``. ``children`` is set
+    instead of ``body`` for grouping rules such as ``@media``.
+    """
+    prelude: str
+    body: Optional[str] = None
+    children: Optional[List["CssBlock"]] = None
+
+# Parsing
+# =======
+
+def _scan(css: str, start: int, stops: str) -> int:
+    """Index of the first character in ``stops`` at or after ``start``, skipping quoted strings."""
+    i = start
+    while i < len(css):
+        char = css[i]
+        if char in "\"'":
+            i += 1
+            while i < len(css) and css[i] != char:
+                i += 2 if css[i] == "\\" else 1
+        elif char in stops:
+            return i
+        i += 1
+    return len(css)
+
+def _block_end(css: str, start: int) -> int:
+    """Index of the ``}`` closing the block whose ``{`` is at ``start - 1``."""
+    depth = 1
+    i = start
+    while depth:
+        i = _scan(css, i, "{}")
+        if i >= len(css):
+            return len(css)
+        depth += 1 if css[i] == "{" else -1
+        i += 1
+    return i - 1
+
+def parse_stylesheet(css: str) -> List[CssBlock]:
+    """
+    Split a minified stylesheet into blocks, parsing grouping rules recursively.
+
+    Args:
+        css (str): Minified CSS
+
+    Returns:
+        List[CssBlock]: Blocks in source order
+    """
+    blocks = []
+    i = 0
+    while i < len(css):
+        stop = _scan(css, i, "{;}")
+        prelude = css[i:stop].strip()
+        if stop >= len(css) or css[stop] != "{":
+            if prelude:
+                blocks.append(CssBlock(prelude))
+            i = stop + 1
+            continue
+
+        end = _block_end(css, stop + 1)
+        body = css[stop + 1:end]
+        if prelude.lower().startswith(_GROUPING_RULES):
+            blocks.append(CssBlock(prelude, children=parse_stylesheet(body)))
+        else:
+            blocks.append(CssBlock(prelude, body=body))
+        i = end + 1
+    return blocks
+
+def serialize(blocks: Iterable[CssBlock]) -> str:
+    """Write blocks back out as minified CSS."""
+    parts = []
+    for block in blocks:
+        if block.children is not None:
+            parts.append(f"{block.prelude}{{{serialize(block.children)}}}")
+        elif block.body is None:
+            parts.append(f"{block.prelude};")
+        else:
+            parts.append(f"{block.prelude}{{{block.body}}}")
+    return "".join(parts)
+
+def split_selectors(prelude: str) -> List[str]:
+    """Split a selector list on its top-level commas (not those inside ``:is(...)``)."""
+    selectors = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [selector for selector in selectors if selector]
+
+def selector_names(selector: str) -> Set[str]:
+    """
+    Classes and ids an element must carry for ``selector`` to match.
+
+    Names inside attribute selectors and functional pseudo-classes such as
+    ``:not(.x)`` are ignored: they do not have to be present.
+
+    Args:
+        selector (str): A single selector
+
+    Returns:
+        Set[str]: Class and id names, without ``.`` or ``#``
+    """
+    selector = _ATTRIBUTE_PATTERN.sub("", selector)
+    while "(" in selector:
+        start = selector.rindex("(")
+        end = selector.find(")", start)
+        selector = selector[:start] + selector[end + 1 if end >= 0 else len(selector):]
+    return set(_NAME_PATTERN.findall(selector))
+
+def _is_keyframes(block: CssBlock) -> bool:
+    return block.prelude.lower().startswith(("@keyframes", "@-webkit-keyframes"))
+
+def _keyframes_name(block: CssBlock) -> str:
+    return block.prelude.split(None, 1)[1].strip() if " " in block.prelude else ""
+
+def _animation_names(blocks: Iterable[CssBlock]) -> Set[str]:
+    """Words used in the ``animation`` declarations of style rules."""
+    names: Set[str] = set()
+    for block in blocks:
+        if block.children is not None:
+            names |= _animation_names(block.children)
+        elif block.body is not None and not _is_keyframes(block):
+            for value in _ANIMATION_PATTERN.findall(block.body):
+                names.update(_WORD_PATTERN.findall(value))
+    return names
+
+def _filter_rules(blocks: Sequence[CssBlock], keep_selector: Callable[[str], bool]) -> List[CssBlock]:
+    """Keep the selectors ``keep_selector`` accepts, and every at-rule that is not a grouping rule."""
+    kept = []
+    for block in blocks:
+        if block.children is not None:
+            children = _filter_rules(block.children, keep_selector)
+            if any(child.body is not None or child.children for child in children):
+                kept.append(block._replace(children=children))
+        elif block.prelude.startswith("@"):
+            kept.append(block)
+        else:
+            selectors = [selector for selector in split_selectors(block.prelude) if keep_selector(selector)]
+            if selectors:
+                kept.append(block._replace(prelude=",".join(selectors)))
+    return kept
+
+def _drop_unused_keyframes(blocks: List[CssBlock]) -> List[CssBlock]:
+    """Remove ``@keyframes`` no rule animates with, and earlier duplicates of a name."""
+    used = _animation_names(blocks)
+    last = {}
+
+    def find_last(items: Sequence[CssBlock], path: tuple) -> None:
+        for index, block in enumerate(items):
+            if block.children is not None:
+                find_last(block.children, path + (index,))
+            elif _is_keyframes(block):
+                last[(block.prelude.split(None, 1)[0], _keyframes_name(block))] = path + (index,)
+
+    def prune(items: Sequence[CssBlock], path: tuple) -> List[CssBlock]:
+        kept = []
+        for index, block in enumerate(items):
+            if block.children is not None:
+                kept.append(block._replace(children=prune(block.children, path + (index,))))
+            elif _is_keyframes(block):
+                name = _keyframes_name(block)
+                if name in used and last[(block.prelude.split(None, 1)[0], name)] == path + (index,):
+                    kept.append(block)
+            else:
+                kept.append(block)
+        return kept
+
+    find_last(blocks, ())
+    return prune(blocks, ())
+
+# Used Names
+# ==========
+
+def source_words(paths: Sequence[Path] = PAGE_SOURCES) -> Set[str]:
+    """
+    Every word in the given files; a class or id not among them is never emitted.
+
+    Args:
+        paths (Sequence[Path]): Files to scan
+
+    Returns:
+        Set[str]: Words made of letters, digits, ``_`` and ``-``
+    """
+    words: Set[str] = set()
+    for path in paths:
+        words.update(_WORD_PATTERN.findall(path.read_text(encoding="utf-8")))
+    return words
+
+def html_names(html: str) -> Set[str]:
+    """Class and id names used in ``class``/``id`` attributes of an HTML fragment."""
+    names: Set[str] = set()
+    for _, value in _HTML_ATTRIBUTE_PATTERN.findall(html):
+        names.update(value.split())
+    return names
+
+# Optimization
+# ============
+
+def purge_css(css: str, used: Set[str]) -> str:
+    """
+    Drop selectors naming classes or ids that are not in ``used``.
+
+    Args:
+        css (str): Minified CSS
+        used (Set[str]): Class and id names the page can emit
+
+    Returns:
+        str: Minified CSS without the unused rules
+    """
+    def keep(selector: str) -> bool:
+        return all(name in used or SAFELIST_PATTERN.fullmatch(name) for name in selector_names(selector))
+
+    blocks = _filter_rules(parse_stylesheet(css), keep)
+    return serialize(_drop_unused_keyframes(blocks))
+
+def critical_css(css: str, names: Set[str]) -> str:
+    """
+    Extract the rules needed to paint the markup that uses ``names``.
+
+    Args:
+        css (str): Minified (normally purged) CSS
+        names (Set[str]): Class and id names of the above-the-fold markup
+
+    Returns:
+        str: Minified CSS: global rules, ``@import``/``@font-face``, and the
+        selectors whose classes and ids are all in ``names``
+    """
+    def keep(selector: str) -> bool:
+        return selector_names(selector) <= names
+
+    blocks = _filter_rules(parse_stylesheet(css), keep)
+    return serialize(_drop_unused_keyframes(blocks))
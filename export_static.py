@@ -0,0 +1,657 @@
+"""
+Portfolio Static Export
+=======================
+
+Renders the whole portfolio to a plain ``index.html`` plus content-hashed
+assets, so the site can be served by any static file server or CDN without
+running Streamlit.
+
+The page is assembled from the same ``sections.py`` builders and the same
+``config.py`` data as ``app.main()``, in the same order. Widgets that need a
+server degrade to client-side behaviour (``js/static_site.js``):
+
+- Skills filter buttons and search box filter the cards in the browser
+- Experience and education checkboxes show and hide blocks in the browser
+- Expanders become ``<details>`` elements
+- Projects after the first page are written as separate HTML fragments and
+  fetched by the "Load more" button
+- The contact form opens the visitor's mail client
+
+Every export writes ``export-manifest.json`` listing the files it wrote. A
+later export into the same folder removes only the files an earlier export
+wrote and this one did not; anything else in the folder is left alone, and a
+non-empty folder without that manifest is refused unless ``--force`` is given.
+
+Usage:
+    python export_static.py [--output dist] [--force]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import sections
+from content import CONTENT, Project, Skill
+from build_icons import FONT_AWESOME_CDN_URL, ICON_STYLESHEET
+from build_fonts import FONT_DIR, font_face_css, font_preload_html, google_fonts_url, load_manifest, stylesheet_fonts
+from assets import attach_image_urls, hashed_name, minify_css, minify_js
+from css_optimizer import PAGE_SOURCES, critical_css, html_names, purge_css, source_words
+from templates import Markup, Template
+from utils import PerformanceTimer, build_image_derivatives, format_bytes
+from config import (
+    NAME, TITLE, EMAIL, PHONE, LOCATION, PROFILE_PHOTO_SOURCE, BIO,
+    PROJECTS_PER_PAGE, LANGUAGES, SOCIAL_LINKS, STATS, CONTACT_SUBJECTS
+)
+
+ROOT = Path(__file__).parent
+STYLESHEET = ROOT / "style.css"
+RESUME_FILE = ROOT / "Aarya_Mody_Resume.pdf"
+SCRIPTS = [ROOT / "js" / "runtime.js", ROOT / "js" / "static_site.js"]
+
+# Assets are written to <output>/assets and linked relative to index.html
+ASSET_DIR_NAME = "assets"
+
+# Lists the files an export wrote, so the next export can remove the stale ones
+EXPORT_MANIFEST_NAME = "export-manifest.json"
+
+# Layout rules standing in for Streamlit's page container, columns and widgets
+EXPORT_CSS = """
+.export-page { max-width: 1200px; margin: 0 auto; padding: 0 1rem 2rem; }
+.export-row { display: grid; gap: 1rem; align-items: start; margin-bottom: 1rem; }
+.export-col { min-width: 0; }
+@media (max-width: 640px) { .export-row { grid-template-columns: 1fr !important; } }
+.export-page details { border: 1px solid var(--color-border, #e2e8f0); border-radius: 0.5rem; padding: 0.75rem 1rem; margin: 0.75rem 0; }
+.export-page summary { cursor: pointer; font-weight: 600; }
+.export-toggles { display: flex; flex-wrap: wrap; gap: 1.5rem; margin: 1rem 0; }
+.skills-filter { display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1rem; }
+.skills-filter button { border: 1px solid var(--color-border, #e2e8f0); border-radius: 0.5rem; padding: 0.4rem 1rem; background: #fff; cursor: pointer; }
+.skills-filter button.active { background: var(--color-primary, #2563eb); color: #fff; }
+.export-page input[type=text], .export-page input[type=email], .export-page select, .export-page textarea { width: 100%; padding: 0.5rem; margin: 0.25rem 0 0.75rem; border: 2px solid var(--color-border, #e2e8f0); border-radius: 0.5rem; font: inherit; box-sizing: border-box; }
+.export-load-more { display: block; margin: 0 auto; border: none; cursor: pointer; font: inherit; }
+.export-form button { width: 100%; padding: 0.75rem; border: none; border-radius: 0.5rem; color: #fff; font-weight: 600; background: linear-gradient(135deg, var(--color-primary, #2563eb), var(--color-accent, #3b82f6)); cursor: pointer; }
+[hidden] { display: none !important; }
+"""
+
+class StaticSite:
+    """Writes hashed assets into an output folder and remembers their URLs."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        self.asset_dir = output_dir / ASSET_DIR_NAME
+        self.written: List[Path] = []
+
+    def write_asset(self, data: bytes, filename: str) -> str:
+        """
+        Write an asset under its content-hashed name.
+
+        Args:
+            data (bytes): File contents
+            filename (str): Public file name
+
+        Returns:
+            str: URL relative to ``index.html``
+        """
+        name = hashed_name(filename, data)
+        target = self.asset_dir / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        self.written.append(target)
+        return f"{ASSET_DIR_NAME}/{name}"
+
+    def write_image(self, source_path: Path) -> Optional[Dict[str, Any]]:
+        """Build the responsive derivatives of an image and return its manifest with URLs."""
+        image_dir = self.asset_dir / "img"
+        manifest = build_image_derivatives(str(source_path), str(image_dir))
+        if manifest is None:
+            return None
+        derivative_dir = image_dir / manifest['source_hash'][:16]
+        self.written.append(derivative_dir / "manifest.json")
+        self.written.extend(
+            derivative_dir / variant['file'] for variants in manifest['formats'].values() for variant in variants
+        )
+        return attach_image_urls(manifest, f"{ASSET_DIR_NAME}/img")
+
+# Layout helpers
+# ==============
+
+# Blocks passed to the helpers are HTML; labels and summaries are text
+EXPORT_ROW_TEMPLATE = Template(
+    '<div class="export-row" style="grid-template-columns: {widths}">{cells}</div>', "export_row"
+)
+EXPORT_COLUMN_TEMPLATE = Template('<div class="export-col">{block}</div>', "export_column")
+DETAILS_TEMPLATE = Template("<details{group}{open}><summary>{summary}</summary>{body}</details>", "details")
+DETAILS_GROUP_TEMPLATE = Template(' data-group="{group}"', "details_group")
+CHECKBOX_TEMPLATE = Template(
+    '<label><input type="checkbox" id="{element_id}"{checked}{toggles}> {label}</label>', "checkbox"
+)
+CHECKBOX_TOGGLES_TEMPLATE = Template(' data-toggle-details="{group}"', "checkbox_toggles")
+OPEN_ATTRIBUTE = Markup(" open")
+CHECKED_ATTRIBUTE = Markup(" checked")
+NO_ATTRIBUTE = Markup("")
+
+def columns(blocks: Sequence[str], weights: Optional[Sequence[float]] = None) -> str:
+    """
+    Lay blocks out side by side, like ``st.columns``.
+
+    Args:
+        blocks (Sequence[str]): HTML of each column
+        weights (Optional[Sequence[float]]): Relative column widths (equal by default)
+
+    Returns:
+        str: Grid HTML
+    """
+    weights = weights or [1] * len(blocks)
+    widths = " ".join(f"{weight}fr" for weight in weights)
+    cells = EXPORT_COLUMN_TEMPLATE.render_joined("block", map(Markup, blocks))
+    return EXPORT_ROW_TEMPLATE.render(widths=widths, cells=cells)
+
+def grid(blocks: Sequence[str], per_row: int) -> str:
+    """Distribute blocks over ``per_row`` columns in reading order, like the app's card grids."""
+    per_row = max(1, min(per_row, len(blocks)))
+    cells = ["".join(blocks[i::per_row]) for i in range(per_row)]
+    return columns(cells)
+
+def details(summary: str, body: str, group: str = "", open_: bool = False) -> str:
+    """Collapsible block standing in for ``st.expander``."""
+    return DETAILS_TEMPLATE.render(
+        group=DETAILS_GROUP_TEMPLATE.render(group=group) if group else NO_ATTRIBUTE,
+        open=OPEN_ATTRIBUTE if open_ else NO_ATTRIBUTE,
+        summary=summary,
+        body=Markup(body),
+    )
+
+def checkbox(label: str, element_id: str, checked: bool = False, toggles: str = "") -> str:
+    """Checkbox standing in for ``st.checkbox``."""
+    return CHECKBOX_TEMPLATE.render(
+        element_id=element_id,
+        checked=CHECKED_ATTRIBUTE if checked else NO_ATTRIBUTE,
+        toggles=CHECKBOX_TOGGLES_TEMPLATE.render(group=toggles) if toggles else NO_ATTRIBUTE,
+        label=label,
+    )
+
+# Page sections
+# =============
+
+def hero_html(site: StaticSite) -> str:
+    """Hero section with the resume link and the responsive profile photo."""
+    resume_link = ""
+    if RESUME_FILE.exists():
+        resume_url = site.write_asset(RESUME_FILE.read_bytes(), RESUME_FILE.name)
+        resume_link = sections.resume_link_html(resume_url, RESUME_FILE.name, "📄 Download Resume")
+
+    image = site.write_image(ROOT / PROFILE_PHOTO_SOURCE)
+    if image:
+        picture = sections.profile_picture_html(image, NAME)
+    else:
+        picture = (
+            '<div class="profile-wrapper"><div class="profile-image-container">'
+            + sections.PROFILE_IMAGE_ERROR_HTML + "</div></div>"
+        )
+
+    content = sections.hero_content_html(NAME, TITLE, LOCATION, STATS, SOCIAL_LINKS, resume_link)
+    return (
+        '<div class="hero-section" id="about">'
+        + columns([content, picture], [3, 2])
+        + sections.SCROLL_INDICATOR_HTML
+        + "</div>"
+    )
+
+def about_html() -> str:
+    """About section: text, badges, counters, values and expanders."""
+    side = (
+        sections.EXPERIENCE_COUNTER_HTML
+        + '<div class="achievement-badges fade-in-right"><h4>Key Achievements</h4>'
+        + "".join(sections.achievement_badges_html(CONTENT.achievements)) + "</div>"
+        + '<div class="fun-facts fade-in-right"><h4>Fun Facts</h4>'
+        + "".join(sections.fun_facts_html(CONTENT.fun_facts)) + "</div>"
+    )
+    stats = sections.animated_stats_html(CONTENT.animated_stats)
+
+    return (
+        '<div class="section about-section fade-in" id="about-detailed">'
+        + sections.ABOUT_HERO_HTML
+        + columns([sections.ABOUT_TEXT_HTML + sections.MISSION_HTML, side], [2, 1])
+        + '<div class="stats-animation fade-in-up">' + columns(stats) + "</div>"
+        + '<div class="fade-in-up"><h3 style="text-align: center; margin-bottom: 30px;">My Core Values</h3>'
+        + '<div class="values-grid">' + "".join(sections.value_cards_html(CONTENT.core_values)) + "</div></div>"
+        + '<div class="fade-in-up">'
+        + details("🎯 Interests & Hobbies", sections.interests_html(CONTENT.interests))
+        + details("🏆 Certifications & Learning", "".join(sections.certifications_html(CONTENT.certifications)))
+        + details("💡 Professional Philosophy", sections.PHILOSOPHY_HTML)
+        + "</div>"
+        + "<div class='section'><h3>Quick Stats</h3></div>"
+        + columns(sections.quick_stats_html(STATS))
+        + "</div>"
+    )
+
+FILTER_BUTTON_TEMPLATE = Template(
+    '<button type="button" data-filter="{option}"{active}>{option}</button>', "filter_button"
+)
+ACTIVE_CLASS_ATTRIBUTE = Markup(' class="active"')
+EXPORT_SKILL_TEMPLATE = Template('<div class="export-skill" data-search="{search}">{card}</div>', "export_skill")
+EXPORT_SKILL_CATEGORY_TEMPLATE = Template(
+    '<div class="export-skill-category" data-category="{category.name}">{summary}'
+    '<div class="skills-grid">{cards}</div></div>',
+    "export_skill_category",
+)
+
+def search_text(category: str, skill: Skill) -> str:
+    """Lowercase text the browser matches search queries against, like the app's skill index."""
+    return f"{skill.name}\n{skill.description}\n{category}".lower()
+
+def skills_html() -> str:
+    """Skills section with every card rendered; filtering happens in the browser."""
+    filter_buttons = "".join(
+        FILTER_BUTTON_TEMPLATE.render(option=option, active=ACTIVE_CLASS_ATTRIBUTE if option == "All" else NO_ATTRIBUTE)
+        for option in ["All", *(category.name for category in CONTENT.skill_categories)]
+    )
+
+    categories = []
+    for category in CONTENT.skill_categories:
+        cards = [
+            EXPORT_SKILL_TEMPLATE.render(
+                search=search_text(category.name, skill), card=sections.skill_card_html(category.name, skill)
+            )
+            for skill in category.skills
+        ]
+        categories.append(EXPORT_SKILL_CATEGORY_TEMPLATE.render(
+            category=category,
+            summary=sections.skill_category_summary_html(category),
+            cards=grid(cards, 3),
+        ))
+
+    return (
+        '<div class="section skills-section fade-in" id="skills">'
+        + sections.SKILLS_HEADER_HTML
+        + f'<div class="skills-filter">{filter_buttons}</div>'
+        + '<input type="text" id="skill-search" aria-label="Search for a specific technology" '
+        + 'placeholder="🔍 Search for a specific technology... e.g., Python, React, SQL">'
+        + "".join(categories)
+        + '<p class="export-skills-empty" hidden>No skills match your search.</p>'
+        + '<div class="export-skills-summary fade-in-up">'
+        + '<h3 style="text-align: center; margin: 40px 0 30px 0;">Overall Proficiency Summary</h3>'
+        + columns(sections.skills_summary_html(CONTENT.skill_categories)) + "</div>"
+        + "</div>"
+    )
+
+def project_rows_html(projects: Sequence[Project]) -> str:
+    """Project cards, two per row."""
+    cards = [sections.project_card_html(project) for project in projects]
+    return "".join(columns(cards[i:i + 2]) for i in range(0, len(cards), 2))
+
+LOAD_MORE_TEMPLATE = Template(
+    '<button type="button" class="btn export-load-more" data-pages="{pages}">Load more projects</button>', "load_more"
+)
+
+def projects_html(site: StaticSite) -> str:
+    """
+    Projects section with the first page of cards inline.
+
+    Every further page is written as its own HTML fragment, so ``index.html``
+    stays the same size however many projects there are; the "Load more"
+    button fetches the next fragment.
+    """
+    pages = CONTENT.project_pages(PROJECTS_PER_PAGE)
+    first_page = project_rows_html(pages[0]) if pages else ""
+    more_urls = [
+        site.write_asset(project_rows_html(page).encode("utf-8"), f"projects-{number}.html")
+        for number, page in enumerate(pages[1:], start=2)
+    ]
+    load_more = LOAD_MORE_TEMPLATE.render(pages=json.dumps(more_urls)) if more_urls else ""
+    return (
+        '<div class="section fade-in" id="projects"><h2 class="section-title">Projects</h2>'
+        + f'<div class="export-projects">{first_page}</div>'
+        + load_more
+        + "</div>"
+    )
+
+EXPORT_EXPERIENCE_TEMPLATE = Template(
+    '<div class="export-experience" data-current="{current}">{item}{achievements}</div>', "export_experience"
+)
+
+def experience_html() -> str:
+    """Experience timeline with client-side filters."""
+    toggles = (
+        checkbox("Show Current Position", "show-current", checked=True)
+        + checkbox("Show Past Positions", "show-past", checked=True)
+        + checkbox("Show All Details", "show-details", toggles="experience-details")
+    )
+    items = "".join(
+        EXPORT_EXPERIENCE_TEMPLATE.render(
+            current=str(exp.current).lower(),
+            item=sections.experience_item_html(exp),
+            achievements=details(
+                f"📈 Key Achievements at {exp.company}", sections.experience_achievements_html(exp), "experience-details"
+            ),
+        )
+        for exp in CONTENT.experience
+    )
+
+    return (
+        '<div class="section experience-section fade-in" id="experience">'
+        + sections.EXPERIENCE_HEADER_HTML
+        + f'<div class="experience-filters export-toggles">{toggles}</div>'
+        + f'<div class="experience-timeline">{items}</div>'
+        + '<div class="experience-summary fade-in-up">'
+        + columns(sections.experience_summary_html(CONTENT.experience)) + "</div>"
+        + "</div>"
+    )
+
+def education_html() -> str:
+    """Education cards, coursework, projects, achievements and languages."""
+    toggles = (
+        checkbox("Show Detailed Coursework", "show-coursework", toggles="coursework")
+        + checkbox("Show Academic Projects", "show-projects", toggles="academic-projects")
+        + checkbox("Show All Achievements", "show-achievements", toggles="achievements")
+    )
+
+    cards = []
+    for edu in CONTENT.education:
+        coursework = (
+            sections.COURSEWORK_OPEN_HTML + "".join(sections.course_cards_html(edu.coursework)) + "</div></div>"
+            + columns(sections.course_stats_html(edu.coursework))
+        )
+        projects = (
+            sections.ACADEMIC_PROJECTS_OPEN_HTML
+            + "".join(sections.academic_project_cards_html(edu.academic_projects)) + "</div>"
+        )
+        achievements = (
+            sections.ACADEMIC_ACHIEVEMENTS_OPEN_HTML
+            + "".join(sections.academic_achievement_cards_html(edu.achievements))
+            + sections.EXTRACURRICULAR_OPEN_HTML
+            + "".join(sections.activity_cards_html(edu.extracurricular)) + "</div></div></div>"
+        )
+        cards.append(
+            sections.education_card_html(edu)
+            + details("📚 Detailed Coursework & Grades", coursework, "coursework")
+            + details("🔬 Academic Projects & Research", projects, "academic-projects")
+            + details("🏆 Achievements & Extracurricular Activities", achievements, "achievements")
+        )
+
+    return (
+        '<div class="section education-section fade-in" id="education">'
+        + sections.EDUCATION_HEADER_HTML
+        + f'<div class="education-filters export-toggles">{toggles}</div>'
+        + "".join(cards)
+        + '<div class="education-summary fade-in-up">'
+        + columns(sections.education_summary_html(CONTENT.education)) + "</div>"
+        + '<div class="languages-section fade-in-up"><h3>Languages</h3>'
+        + columns(sections.language_cards_html(LANGUAGES)) + "</div>"
+        + "</div>"
+    )
+
+SUBJECT_PLACEHOLDER_TEMPLATE = Template('<option value="" selected>{subject}</option>', "subject_placeholder")
+SUBJECT_OPTION_TEMPLATE = Template("<option>{subject}</option>", "subject_option")
+CONTACT_FORM_TEMPLATE = Template(
+    '<form class="export-form" action="mailto:{email}" method="post" enctype="text/plain">{names}'
+    '<label>Company/Organization<input type="text" name="company" placeholder="Your company or organization (optional)"></label>'
+    '<label>Subject *<select name="subject" required>{subjects}</select></label>'
+    '<label>Message *<textarea name="message" rows="5" minlength="10" required '
+    'placeholder="Tell me about your project, requirements, timeline, or any questions you have..."></textarea></label>'
+    '<button type="submit">Send Message</button></form>',
+    "contact_form",
+)
+
+def contact_html() -> str:
+    """Contact section; the form hands the message to the visitor's mail client."""
+    # The first subject is the placeholder and cannot be submitted
+    subjects = SUBJECT_PLACEHOLDER_TEMPLATE.render(subject=CONTACT_SUBJECTS[0]) + SUBJECT_OPTION_TEMPLATE.render_joined(
+        "subject", CONTACT_SUBJECTS[1:]
+    )
+    form = CONTACT_FORM_TEMPLATE.render(
+        email=EMAIL,
+        names=columns([
+            '<label>Full Name *<input type="text" name="name" placeholder="Enter your full name" required></label>',
+            '<label>Email Address *<input type="email" name="email" placeholder="your.email@example.com" required></label>',
+        ]),
+        subjects=Markup(subjects),
+    )
+
+    left = sections.CONTACT_FORM_INTRO_HTML + form + sections.ALTERNATIVE_CONTACT_HTML
+    right = (
+        sections.contact_info_html(EMAIL, PHONE, LOCATION)
+        + sections.social_media_html(SOCIAL_LINKS, EMAIL, PHONE)
+        + sections.COLLABORATION_HTML
+    )
+    return (
+        '<div class="section contact-section fade-in" id="contact">'
+        + sections.CONTACT_HEADER_HTML
+        + sections.AVAILABILITY_HTML
+        + columns([left, right], [3, 2])
+        + "</div>"
+    )
+
+# Page
+# ====
+
+GOOGLE_FONTS_TEMPLATE = Template(
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+    '<link rel="stylesheet" href="{url}" media="print" onload="this.media=\'all\'">',
+    "google_fonts",
+)
+FONT_FACES_TEMPLATE = Template("{preloads}\n<style>{font_faces}</style>", "font_faces")
+
+def fonts_head_html(site: StaticSite, css: str) -> str:
+    """
+    Preloads and ``@font-face`` rules for the fonts built by ``build_fonts.py``.
+
+    Falls back to a Google Fonts link (the weights ``css`` uses) when the
+    fonts have not been built.
+
+    Args:
+        site (StaticSite): Output folder the font files are written to
+        css (str): The page's minified stylesheet
+
+    Returns:
+        str: HTML for ``<head>``
+    """
+    fonts = load_manifest()
+    if not fonts:
+        used_fonts, _ = stylesheet_fonts(css)
+        return GOOGLE_FONTS_TEMPLATE.render(url=google_fonts_url(used_fonts))
+
+    urls = {font["file"]: site.write_asset((FONT_DIR / font["file"]).read_bytes(), font["file"]) for font in fonts}
+    url_for = lambda font: urls[font["file"]]
+    return FONT_FACES_TEMPLATE.render(
+        preloads=Markup(font_preload_html(fonts, url_for)), font_faces=Markup(font_face_css(fonts, url_for))
+    )
+
+SCRIPT_TEMPLATE = Template('<script src="{url}" defer></script>', "script")
+
+# The stylesheet and the sections are trusted HTML; the name, the description and URLs are escaped
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{name} | Portfolio</title>
+<meta name="description" content="{description}">
+<meta property="og:title" content="{name} | Portfolio">
+<meta property="og:description" content="{description}">
+{fonts}
+<link rel="stylesheet" href="{icons_url}">
+<style>{critical_css}</style>
+<link rel="stylesheet" href="{stylesheet_url}" media="print" onload="this.media='all'">
+<noscript><link rel="stylesheet" href="{stylesheet_url}"></noscript>
+{scripts}
+</head>
+<body>
+<main class="export-page">
+{body}
+</main>
+</body>
+</html>
+""", "page")
+
+def build_page(site: StaticSite) -> str:
+    """
+    Assemble ``index.html`` and write the assets it links to.
+
+    Args:
+        site (StaticSite): Output folder the assets are written to
+
+    Returns:
+        str: The complete HTML document
+    """
+    hero = hero_html(site)
+
+    # Purge the stylesheet (this module emits the export-* classes), inline the
+    # navbar and hero rules and load the full stylesheet without blocking rendering
+    used = source_words([*PAGE_SOURCES, Path(__file__)]) | sections.content_classes(CONTENT, LANGUAGES)
+    css = purge_css(minify_css(STYLESHEET.read_text(encoding="utf-8") + EXPORT_CSS), used)
+    critical = critical_css(css, html_names(sections.NAVBAR_HTML + hero))
+    # Icons built by build_icons.py; the Font Awesome CDN until they have been built
+    icons_url = (
+        site.write_asset(ICON_STYLESHEET.read_bytes(), ICON_STYLESHEET.name)
+        if ICON_STYLESHEET.exists() else FONT_AWESOME_CDN_URL
+    )
+    stylesheet_url = site.write_asset(css.encode("utf-8"), STYLESHEET.name)
+    fonts_html = fonts_head_html(site, css)
+    script_urls = [
+        site.write_asset(minify_js(script.read_text(encoding="utf-8")).encode("utf-8"), script.name)
+        for script in SCRIPTS
+    ]
+    scripts = SCRIPT_TEMPLATE.render_joined("url", script_urls)
+
+    body = (
+        sections.NAVBAR_HTML
+        + hero
+        + about_html()
+        + skills_html()
+        + projects_html(site)
+        + experience_html()
+        + education_html()
+        + contact_html()
+        + sections.footer_html(NAME, EMAIL, PHONE, LOCATION, SOCIAL_LINKS, STATS)
+    )
+
+    return PAGE_TEMPLATE.render(
+        name=NAME,
+        description=" ".join(BIO.split()),
+        fonts=Markup(fonts_html),
+        icons_url=icons_url,
+        critical_css=Markup(critical),
+        stylesheet_url=stylesheet_url,
+        scripts=scripts,
+        body=Markup(body),
+    )
+
+def previous_export(output_dir: Path) -> List[Path]:
+    """
+    Files written by the last export into ``output_dir``.
+
+    Args:
+        output_dir (Path): Destination folder
+
+    Returns:
+        List[Path]: Files listed in its export manifest (empty for a new or empty folder)
+
+    Raises:
+        FileExistsError: If the folder holds other files and no export manifest
+    """
+    manifest_path = output_dir / EXPORT_MANIFEST_NAME
+    if not output_dir.exists() or not any(output_dir.iterdir()):
+        return []
+    try:
+        files = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise FileExistsError(f"{output_dir} is not empty and has no readable {EXPORT_MANIFEST_NAME}") from e
+
+    previous = []
+    for name in files:
+        path = (output_dir / name).resolve()
+        # Never follow a manifest entry out of the folder
+        if path.is_relative_to(output_dir.resolve()):
+            previous.append(path)
+    return previous
+
+def remove_stale_files(output_dir: Path, stale: Sequence[Path]) -> int:
+    """Delete files an earlier export wrote and this one did not, then their empty folders."""
+    removed = 0
+    folders = set()
+    for path in stale:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+        folders.update(parent for parent in path.parents if parent.is_relative_to(output_dir) and parent != output_dir)
+    # Deepest first, so a folder is emptied before its parent is tried
+    for folder in sorted(folders, key=lambda folder: len(folder.parts), reverse=True):
+        try:
+            folder.rmdir()
+        except OSError:
+            pass
+    return removed
+
+def export_site(output_dir: Path, force: bool = False) -> Path:
+    """
+    Render the portfolio into ``output_dir``.
+
+    Files written by an earlier export and not by this one are removed, so
+    stale hashed assets never linger; nothing else in the folder is touched.
+
+    Args:
+        output_dir (Path): Destination folder
+        force (bool): Export into a non-empty folder that holds no earlier export
+
+    Returns:
+        Path: Path of the written ``index.html``
+
+    Raises:
+        FileExistsError: If ``output_dir`` holds other files, no earlier export and
+            ``force`` is not set
+    """
+    output_dir = output_dir.resolve()
+    try:
+        previous = previous_export(output_dir)
+    except FileExistsError:
+        if not force:
+            raise
+        previous = []
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    site = StaticSite(output_dir)
+    with PerformanceTimer("Static export"):
+        index = output_dir / "index.html"
+        index.write_text(build_page(site), encoding="utf-8")
+
+    written = {index, *(path.resolve() for path in site.written)}
+    removed = remove_stale_files(output_dir, [path for path in previous if path not in written])
+    manifest = {"files": sorted(path.relative_to(output_dir).as_posix() for path in written)}
+    (output_dir / EXPORT_MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    print(f"✅ Exported {index} ({format_bytes(index.stat().st_size)})")
+    for asset in sorted(written - {index}):
+        print(f"   {asset.relative_to(output_dir)} ({format_bytes(asset.stat().st_size)})")
+    if removed:
+        print(f"🧹 Removed {removed} stale files from the previous export")
+    return index
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site.")
+    parser.add_argument("--output", default="dist", help="Output folder (default: dist)")
+    parser.add_argument("--force", action="store_true",
+                        help=f"export into a non-empty folder without an {EXPORT_MANIFEST_NAME}")
+    args = parser.parse_args(argv)
+
+    output_dir = Path(args.output).resolve()
+    if output_dir == ROOT or ROOT.is_relative_to(output_dir):
+        print(f"❌ Refusing to export into {output_dir}: it contains the project")
+        return 1
+
+    try:
+        export_site(output_dir, force=args.force)
+    except FileExistsError as e:
+        print(f"❌ Refusing to export: {e}; pass --force to export into it anyway")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""
+Portfolio Image Metadata
+========================
+
+Dimensions, format, mode and orientation of images, read from their headers
+and remembered in an on-disk index.
+
+- :func:`probe_image` opens an image lazily: Pillow parses the header (and,
+  for JPEG, WebP and AVIF, the EXIF block next to it) without decoding any
+  pixels.
+- :class:`MetadataIndex` keeps every probe in a SQLite table keyed by path,
+  and trusts a row for as long as the file's size, modification time and
+  inode are unchanged. Rows are mirrored in memory, so a lookup costs one
+  ``stat``; files that are not images are remembered too, and are not
+  re-opened either.
+- :meth:`MetadataIndex.scan` lists the images in a folder with
+  ``os.scandir`` and probes only new or changed files, writing them back in
+  one transaction. Re-scanning a large folder costs a ``stat`` per file.
+
+``utils.get_image_info`` reads through :func:`default_index`, whose file is
+``config.IMAGE_METADATA_INDEX``.
+
+Usage:
+    python image_metadata.py FOLDER [FOLDER ...] [--index image_metadata.sqlite3]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    path TEXT PRIMARY KEY,
+    file_size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    format TEXT,
+    mode TEXT,
+    orientation INTEGER NOT NULL DEFAULT 1
+) WITHOUT ROWID;
+"""
+
+COLUMNS = "path, file_size, mtime_ns, inode, width, height, format, mode, orientation"
+
+# Files :meth:`MetadataIndex.scan` considers
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif", ".bmp", ".tif", ".tiff", ".ico"})
+
+# EXIF tag holding the orientation (1 = upright; 5-8 swap width and height)
+EXIF_ORIENTATION = 0x0112
+
+# Metadata
+# ========
+
+class ImageMetadata(NamedTuple):
+    """What the header of an image file says about it."""
+    path: str
+    file_size: int
+    mtime_ns: int
+    inode: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    format: Optional[str] = None
+    mode: Optional[str] = None
+    orientation: int = 1
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the file could be read as an image."""
+        return self.width is not None
+
+    @property
+    def size(self) -> Optional[Tuple[int, int]]:
+        """Stored width and height."""
+        return (self.width, self.height) if self.is_valid else None
+
+    @property
+    def display_size(self) -> Optional[Tuple[int, int]]:
+        """Width and height once the EXIF orientation is applied, as browsers show it."""
+        if not self.is_valid:
+            return None
+        return (self.height, self.width) if self.orientation in (5, 6, 7, 8) else (self.width, self.height)
+
+    @property
+    def aspect_ratio(self) -> Optional[float]:
+        """Displayed width over height, rounded to two decimals."""
+        if not self.is_valid:
+            return None
+        width, height = self.display_size
+        return round(width / height, 2) if height > 0 else 0
+
+    def as_info(self) -> Dict[str, Any]:
+        """The dictionary ``utils.get_image_info`` returns."""
+        aspect_ratio = None
+        if self.is_valid:
+            aspect_ratio = round(self.width / self.height, 2) if self.height > 0 else 0
+        return {
+            'exists': True,
+            'size': self.size,
+            'format': self.format,
+            'mode': self.mode,
+            'file_size': self.file_size,
+            'dimensions': f"{self.width}x{self.height}" if self.is_valid else None,
+            'aspect_ratio': aspect_ratio,
+            'orientation': self.orientation,
+            'display_size': self.display_size,
+            'is_valid': self.is_valid,
+        }
+
+def _orientation(img: Image.Image) -> int:
+    """EXIF orientation from data the header already holds; never decodes pixels."""
+    exif = img.info.get("exif")
+    if exif:
+        tags = Image.Exif()
+        tags.load(exif)
+    elif hasattr(img, "tag_v2"):
+        # TIFF keeps EXIF tags in the header itself
+        tags = img.tag_v2
+    else:
+        return 1
+    orientation = tags.get(EXIF_ORIENTATION, 1)
+    return orientation if isinstance(orientation, int) and 1 <= orientation <= 8 else 1
+
+def probe_image(path: str, stat: Optional[os.stat_result] = None) -> Optional[ImageMetadata]:
+    """
+    Read an image's metadata from its header.
+
+    Args:
+        path (str): Path to the image
+        stat (Optional[os.stat_result]): The file's ``stat``, if already known
+
+    Returns:
+        Optional[ImageMetadata]: Metadata (``is_valid`` is False if the file
+        is not a readable image), or None if the file does not exist
+    """
+    try:
+        stat = stat or os.stat(path)
+    except OSError:
+        return None
+
+    metadata = ImageMetadata(path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+            return metadata._replace(
+                width=width, height=height, format=img.format, mode=img.mode, orientation=_orientation(img)
+            )
+    except Exception as e:
+        logger.error(f"Error getting image info for {path}: {e}")
+        return metadata
+
+# Index
+# =====
+
+class MetadataIndex:
+    """
+    Persistent cache of :func:`probe_image` results.
+
+    Safe to share between threads (each thread gets its own connection) and
+    between processes using the same file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._rows: Optional[Dict[str, ImageMetadata]] = None
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # A connection must not cross a fork, e.g. into a process pool worker
+        pid, connection = getattr(self._local, "connection", (None, None))
+        if pid != os.getpid():
+            connection = self._connect()
+            self._local.connection = (os.getpid(), connection)
+        yield connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction, taking the write lock up front."""
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _cached(self) -> Dict[str, ImageMetadata]:
+        """In-memory copy of the table, read on first use."""
+        if self._rows is None:
+            with self._connection() as connection:
+                rows = connection.execute(f"SELECT {COLUMNS} FROM images").fetchall()
+            with self._lock:
+                if self._rows is None:
+                    self._rows = {row[0]: ImageMetadata(*row) for row in rows}
+        return self._rows
+
+    def _lookup(self, path: str, stat: os.stat_result) -> Tuple[ImageMetadata, bool]:
+        """Metadata for a file, and whether it was just probed (and still needs saving)."""
+        metadata = self._cached().get(path)
+        if (
+            metadata is not None
+            and metadata.file_size == stat.st_size
+            and metadata.mtime_ns == stat.st_mtime_ns
+            and metadata.inode == stat.st_ino
+        ):
+            self.hits += 1
+            return metadata, False
+        self.misses += 1
+        return probe_image(path, stat), True
+
+    def _store(self, probed: Sequence[ImageMetadata]) -> None:
+        with self._lock:
+            self._cached().update((metadata.path, metadata) for metadata in probed)
+        with self._transaction() as connection:
+            connection.executemany(f"INSERT OR REPLACE INTO images ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", probed)
+
+    def get(self, path: str) -> Optional[ImageMetadata]:
+        """
+        Metadata of one file, probed only if it changed since it was last seen.
+
+        Args:
+            path (str): Path to the image
+
+        Returns:
+            Optional[ImageMetadata]: Metadata, or None if the file does not exist
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        metadata, probed = self._lookup(path, stat)
+        if probed:
+            try:
+                self._store([metadata])
+            except sqlite3.Error as e:
+                logger.warning(f"Could not save image metadata to {self.path}: {e}")
+        return metadata
+
+    def scan(self, directory: str, recursive: bool = True, include_invalid: bool = False) -> List[ImageMetadata]:
+        """
+        Metadata of every image in a folder, probing only new or changed files.
+
+        Args:
+            directory (str): Folder to list
+            recursive (bool): Include sub-folders
+            include_invalid (bool): Also return files with an image extension
+                that could not be read
+
+        Returns:
+            List[ImageMetadata]: Metadata sorted by path
+        """
+        found: List[ImageMetadata] = []
+        probed: List[ImageMetadata] = []
+        pending = [os.path.abspath(directory)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError as e:
+                logger.warning(f"Cannot list {e.filename}: {e.strerror}")
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if recursive:
+                                pending.append(entry.path)
+                            continue
+                        if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    metadata, was_probed = self._lookup(entry.path, stat)
+                    if was_probed:
+                        probed.append(metadata)
+                    if metadata.is_valid or include_invalid:
+                        found.append(metadata)
+
+        if probed:
+            try:
+                self._store(probed)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not save image metadata to {self.path}: {e}")
+        found.sort(key=lambda metadata: metadata.path)
+        return found
+
+    def prune(self) -> int:
+        """Drop the rows of files that no longer exist; returns how many were dropped."""
+        missing = [path for path in list(self._cached()) if not os.path.exists(path)]
+        if missing:
+            with self._lock:
+                for path in missing:
+                    self._rows.pop(path, None)
+            with self._transaction() as connection:
+                connection.executemany("DELETE FROM images WHERE path = ?", [(path,) for path in missing])
+        return len(missing)
+
+    def stats(self) -> Dict[str, int]:
+        """Indexed files and this process's lookup hits and misses."""
+        return {"indexed": len(self._cached()), "hits": self.hits, "misses": self.misses}
+
+_default_index: Optional[MetadataIndex] = None
+_default_lock = threading.Lock()
+
+def default_index() -> MetadataIndex:
+    """The index at ``config.IMAGE_METADATA_INDEX``, opened on first use."""
+    global _default_index
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                import config
+
+                _default_index = MetadataIndex(config.IMAGE_METADATA_INDEX)
+    return _default_index
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="List the images in folders with their dimensions, from the metadata index.")
+    parser.add_argument("folders", nargs="+", help="folders to scan (recursively)")
+    parser.add_argument("--index", help="index file (default: config.IMAGE_METADATA_INDEX)")
+    parser.add_argument("--prune", action="store_true", help="drop index rows of files that no longer exist")
+    parser.add_argument("--quiet", action="store_true", help="print only the summary")
+    args = parser.parse_args(argv)
+
+    index = MetadataIndex(args.index) if args.index else default_index()
+    for folder in args.folders:
+        start_time = time.perf_counter()
+        images = index.scan(folder)
+        elapsed = time.perf_counter() - start_time
+        if not args.quiet:
+            for metadata in images:
+                width, height = metadata.display_size
+                print(f"   {width:>5}x{height:<5} {metadata.format:<5} {os.path.relpath(metadata.path, folder)}")
+        print(f"🖼️  {folder}: {len(images)} images in {elapsed * 1000:.1f} ms")
+
+    if args.prune:
+        print(f"🧹 Dropped {index.prune()} missing files")
+    stats = index.stats()
+    print(f"📇 {stats['indexed']} files indexed; {stats['hits']} unchanged, {stats['misses']} probed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+// Client runtime of the portfolio page.
+// In the app, components/runtime/index.html loads this file into the page
+// once and connects to it on every rerun (see client_runtime.py); the static
+// export includes it directly. It drives:
+// - the reveal effects and number counters (IntersectionObserver)
+// - the hero parallax (passive scroll listener, at most one update per frame)
+// - the typewriter title and the profile image fade-in
+// - smooth scrolling for in-page links
+// - lazy sections: a placeholder near the viewport, or whose navbar link is
+//   clicked, presses its "Load section" button (see render_lazy_section in app.py)
+// - Web Vitals (LCP, FCP, CLS, INP) and navigation timings, attributed to page
+//   sections and sent back to the app in batches (see add_client_runtime in app.py)
+(function () {
+    'use strict';
+
+    if (window.portfolioRuntime) {
+        return;
+    }
+
+    const doc = document;
+    const REVEAL_SELECTOR = '.fade-in, .fade-in-up, .fade-in-left, .fade-in-right';
+    const COUNTER_SELECTOR = '.counter-number, .stat-number-animated';
+    const PARALLAX_FACTOR = 0.2;
+    const COUNTER_DURATION = 2000;
+    const TYPEWRITER_DELAY = 500;
+    const TYPEWRITER_INTERVAL = 100;
+    const PROFILE_LOADER_TIMEOUT = 1000;
+
+    let options = { lazySections: true };
+    let sendValue = function () {};
+
+    // Elements already wired up, so rescans after each render are cheap
+    const seen = new WeakSet();
+
+    function once(element) {
+        if (seen.has(element)) {
+            return false;
+        }
+        seen.add(element);
+        return true;
+    }
+
+    // Reveal effects and counters
+    function animateNumber(element) {
+        const isCounter = element.classList.contains('counter-number');
+        const target = isCounter
+            ? parseInt(element.getAttribute('data-target'), 10)
+            : parseFloat(element.style.getPropertyValue('--target'));
+        if (isNaN(target)) {
+            return;
+        }
+
+        const start = performance.now();
+        function step(now) {
+            const progress = Math.min((now - start) / COUNTER_DURATION, 1);
+            const value = progress < 1 ? target * progress : target;
+            if (isCounter) {
+                element.textContent = Math.floor(value) + '+';
+            } else {
+                element.style.setProperty('--num', Math.floor(value * 10) / 10);
+            }
+            if (progress < 1) {
+                requestAnimationFrame(step);
+            }
+        }
+        requestAnimationFrame(step);
+    }
+
+    const reveal = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (!entry.isIntersecting) {
+                return;
+            }
+            reveal.unobserve(entry.target);
+            if (entry.target.matches(COUNTER_SELECTOR)) {
+                animateNumber(entry.target);
+            } else {
+                entry.target.classList.add('visible');
+            }
+        });
+    }, { threshold: 0.1 });
+
+    // Hero parallax, only while the hero is on screen
+    let hero = null;
+    let heroVisible = false;
+    let parallaxQueued = false;
+    let scrollTop = 0;
+
+    const heroObserver = new IntersectionObserver(function (entries) {
+        heroVisible = entries[entries.length - 1].isIntersecting;
+    });
+
+    function updateParallax() {
+        parallaxQueued = false;
+        if (hero) {
+            hero.style.backgroundPosition = 'center ' + scrollTop * PARALLAX_FACTOR + 'px';
+        }
+    }
+
+    // Streamlit scrolls an inner container rather than the window; scroll
+    // events do not bubble, so listen in the capture phase
+    function onScroll(event) {
+        if (!heroVisible || parallaxQueued) {
+            return;
+        }
+        const target = event.target;
+        scrollTop = target === doc || target === doc.documentElement ? window.scrollY : target.scrollTop;
+        parallaxQueued = true;
+        requestAnimationFrame(updateParallax);
+    }
+
+    // Typewriter title
+    function typewriter(element) {
+        const text = element.textContent;
+        element.textContent = '';
+        let index = 0;
+
+        function type() {
+            if (index < text.length) {
+                element.textContent += text.charAt(index);
+                index++;
+                setTimeout(type, TYPEWRITER_INTERVAL);
+            }
+        }
+        setTimeout(type, TYPEWRITER_DELAY);
+    }
+
+    // Lazy sections
+    function loadSection(sectionId) {
+        if (!options.lazySections) {
+            return;
+        }
+        const button = doc.querySelector('.st-key-lazy_load_' + sectionId + ' button');
+        if (button && !button.disabled) {
+            button.click();
+        }
+    }
+
+    const lazy = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+                lazy.unobserve(entry.target);
+                loadSection(entry.target.dataset.lazySection);
+            }
+        });
+    }, { rootMargin: '0px 0px 600px 0px' });
+
+    // Smooth scrolling for in-page links; a link to a lazy section loads it
+    function onClick(event) {
+        const link = event.target.closest && event.target.closest('a[href^="#"]');
+        if (!link) {
+            return;
+        }
+        const sectionId = link.getAttribute('href').slice(1);
+        if (!sectionId) {
+            return;
+        }
+        loadSection(sectionId);
+
+        const target = doc.getElementById(sectionId);
+        if (target) {
+            event.preventDefault();
+            target.scrollIntoView({ behavior: 'smooth' });
+        }
+    }
+
+    // Web Vitals
+    // Values are queued as [metric, value, section] and sent at most once per
+    // options.webVitals.interval, and right away when the page is hidden. LCP,
+    // CLS and INP keep changing while the page is open, so they are reported
+    // once, when the visitor first interacts (LCP) or leaves the page.
+    const vitals = {
+        started: false,
+        queue: [],
+        batch: 0,
+        session: Math.random().toString(36).slice(2, 10),
+        lastSent: 0,
+        timer: null,
+        lcp: null,
+        lcpReported: false,
+        cls: { value: 0, section: 'page' },
+        clsWindow: { value: 0, first: 0, last: 0, largest: 0, section: 'page' },
+        interactions: new Map(),
+        finalized: false
+    };
+
+    function deviceClass() {
+        const width = window.innerWidth;
+        return width < 768 ? 'mobile' : width < 1024 ? 'tablet' : 'desktop';
+    }
+
+    // The section containing the element, else the last section starting above it
+    function sectionOf(element) {
+        if (!element || !element.getBoundingClientRect) {
+            return 'page';
+        }
+        const sections = (options.webVitals && options.webVitals.sections) || {};
+        const top = element.getBoundingClientRect().top;
+        let section = 'page';
+        let sectionTop = -Infinity;
+        for (const name in sections) {
+            const anchor = doc.querySelector(sections[name]);
+            if (!anchor) {
+                continue;
+            }
+            if (anchor.contains(element)) {
+                return name;
+            }
+            const anchorTop = anchor.getBoundingClientRect().top;
+            if (anchorTop <= top && anchorTop > sectionTop && getComputedStyle(anchor).position !== 'fixed') {
+                section = name;
+                sectionTop = anchorTop;
+            }
+        }
+        return section;
+    }
+
+    function report(metric, value, section) {
+        vitals.queue.push([metric, Math.round(value * 10000) / 10000, section]);
+        scheduleFlush();
+    }
+
+    function flush() {
+        clearTimeout(vitals.timer);
+        vitals.timer = null;
+        if (!vitals.queue.length) {
+            return;
+        }
+        vitals.batch++;
+        vitals.lastSent = Date.now();
+        sendValue({ id: vitals.session + '-' + vitals.batch, device: deviceClass(), metrics: vitals.queue.splice(0) });
+    }
+
+    function scheduleFlush() {
+        if (vitals.timer === null) {
+            const interval = (options.webVitals && options.webVitals.interval) || 0;
+            const wait = Math.max(0, vitals.lastSent + interval - Date.now());
+            vitals.timer = setTimeout(flush, wait);
+        }
+    }
+
+    function reportLcp() {
+        if (vitals.lcp && !vitals.lcpReported) {
+            vitals.lcpReported = true;
+            report('LCP', vitals.lcp.value, vitals.lcp.section);
+        }
+    }
+
+    // INP: the longest interaction, ignoring one in every 50 (the 98th percentile)
+    function reportInp() {
+        const durations = Array.from(vitals.interactions.values()).sort(function (a, b) {
+            return b.duration - a.duration;
+        });
+        if (durations.length) {
+            const worst = durations[Math.min(durations.length - 1, Math.floor(durations.length / 50))];
+            report('INP', worst.duration, worst.section);
+        }
+    }
+
+    function finalize() {
+        if (doc.visibilityState !== 'hidden') {
+            return;
+        }
+        if (!vitals.finalized) {
+            vitals.finalized = true;
+            reportLcp();
+            report('CLS', vitals.cls.value, vitals.cls.section);
+            reportInp();
+        }
+        flush();
+    }
+
+    function observe(type, callback, init) {
+        try {
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(callback);
+            }).observe(Object.assign({ type: type, buffered: true }, init));
+        } catch (error) {
+            // Entry type not supported by this browser
+        }
+    }
+
+    function onLayoutShift(entry) {
+        if (entry.hadRecentInput) {
+            return;
+        }
+        // Session windows: shifts less than 1s apart, at most 5s long; CLS is the largest window
+        const current = vitals.clsWindow;
+        if (!current.value || entry.startTime - current.last > 1000 || entry.startTime - current.first > 5000) {
+            current.value = 0;
+            current.first = entry.startTime;
+            current.largest = 0;
+        }
+        current.value += entry.value;
+        current.last = entry.startTime;
+        if (entry.value > current.largest) {
+            current.largest = entry.value;
+            const source = entry.sources && entry.sources.find(function (item) {
+                return item.node;
+            });
+            current.section = source ? sectionOf(source.node) : 'page';
+        }
+        if (current.value > vitals.cls.value) {
+            vitals.cls = { value: current.value, section: current.section };
+        }
+    }
+
+    function onEvent(entry) {
+        if (!entry.interactionId) {
+            return;
+        }
+        const previous = vitals.interactions.get(entry.interactionId);
+        if (!previous || entry.duration > previous.duration) {
+            vitals.interactions.set(entry.interactionId, { duration: entry.duration, section: sectionOf(entry.target) });
+        }
+    }
+
+    function reportNavigation() {
+        const navigation = performance.getEntriesByType('navigation')[0];
+        if (navigation) {
+            report('TTFB', navigation.responseStart, 'page');
+            report('DCL', navigation.domContentLoadedEventEnd, 'page');
+            report('LOAD', navigation.loadEventEnd, 'page');
+        }
+    }
+
+    function startVitals() {
+        vitals.started = true;
+
+        observe('paint', function (entry) {
+            if (entry.name === 'first-contentful-paint') {
+                report('FCP', entry.startTime, 'page');
+            }
+        });
+        observe('largest-contentful-paint', function (entry) {
+            if (!vitals.lcpReported) {
+                vitals.lcp = { value: entry.startTime, section: sectionOf(entry.element) };
+            }
+        });
+        observe('layout-shift', onLayoutShift);
+        observe('event', onEvent, { durationThreshold: 40 });
+
+        // The largest paint is final once the visitor interacts
+        ['keydown', 'pointerdown'].forEach(function (type) {
+            window.addEventListener(type, reportLcp, { once: true, capture: true });
+        });
+        doc.addEventListener('visibilitychange', finalize);
+
+        if (doc.readyState === 'complete') {
+            reportNavigation();
+        } else {
+            window.addEventListener('load', function () {
+                setTimeout(reportNavigation, 0);
+            }, { once: true });
+        }
+    }
+
+    // Wire up the elements added since the last scan
+    function scan() {
+        scanQueued = false;
+
+        doc.querySelectorAll(REVEAL_SELECTOR + ', ' + COUNTER_SELECTOR).forEach(function (element) {
+            if (once(element)) {
+                reveal.observe(element);
+            }
+        });
+
+        const currentHero = doc.querySelector('.hero-section');
+        if (currentHero !== hero) {
+            if (hero) {
+                heroObserver.unobserve(hero);
+            }
+            hero = currentHero;
+            if (hero) {
+                heroObserver.observe(hero);
+            }
+        }
+
+        doc.querySelectorAll('.typewriter-text').forEach(function (element) {
+            if (once(element)) {
+                typewriter(element);
+            }
+        });
+
+        doc.querySelectorAll('.profile-image').forEach(function (image) {
+            if (!once(image)) {
+                return;
+            }
+            if (image.complete) {
+                image.classList.add('loaded');
+            } else {
+                image.addEventListener('load', function () {
+                    image.classList.add('loaded');
+                }, { once: true });
+            }
+        });
+
+        const loader = doc.getElementById('imageLoader');
+        if (loader && once(loader)) {
+            setTimeout(function () {
+                loader.style.display = 'none';
+            }, PROFILE_LOADER_TIMEOUT);
+        }
+
+        doc.querySelectorAll('[data-lazy-section]').forEach(function (placeholder) {
+            if (once(placeholder)) {
+                lazy.observe(placeholder);
+            }
+        });
+    }
+
+    // Streamlit adds and replaces elements on every rerun; rescan at most once per frame
+    let scanQueued = false;
+    function queueScan() {
+        if (!scanQueued) {
+            scanQueued = true;
+            requestAnimationFrame(scan);
+        }
+    }
+
+    new MutationObserver(queueScan).observe(doc.body, { childList: true, subtree: true });
+    doc.addEventListener('scroll', onScroll, { capture: true, passive: true });
+    doc.addEventListener('click', onClick, true);
+    queueScan();
+
+    window.portfolioRuntime = {
+        // Called by the component on every rerun: new options and the channel back to Python
+        connect: function (channel) {
+            options = Object.assign({}, options, channel.options || {});
+            if (channel.send) {
+                sendValue = channel.send;
+            }
+            if (options.webVitals && !vitals.started) {
+                startVitals();
+            }
+            queueScan();
+        },
+        // Send a JSON value to Python; it becomes the component's return value (and reruns the app)
+        send: function (value) {
+            sendValue(value);
+        }
+    };
+})();
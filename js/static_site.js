@@ -0,0 +1,114 @@
+// Client-side behaviour for the static export (export_static.py).
+// Replaces the Streamlit widgets that need a server: the skills filter and
+// search, the projects "Load more" button, and the experience and education
+// toggles.
+document.addEventListener('DOMContentLoaded', function () {
+    // Skills filter buttons and search box
+    const skillsSection = document.getElementById('skills');
+    if (skillsSection) {
+        const buttons = skillsSection.querySelectorAll('[data-filter]');
+        const search = skillsSection.querySelector('#skill-search');
+        const categories = skillsSection.querySelectorAll('.export-skill-category');
+        const summary = skillsSection.querySelector('.export-skills-summary');
+        const empty = skillsSection.querySelector('.export-skills-empty');
+        let selected = 'All';
+
+        function applySkillFilter() {
+            const query = search ? search.value.trim().toLowerCase() : '';
+            let shown = 0;
+
+            categories.forEach(function (category) {
+                const inCategory = selected === 'All' || category.dataset.category === selected;
+                let visibleSkills = 0;
+
+                category.querySelectorAll('.export-skill').forEach(function (skill) {
+                    const visible = inCategory && (!query || skill.dataset.search.includes(query));
+                    skill.hidden = !visible;
+                    if (visible) {
+                        visibleSkills++;
+                    }
+                });
+
+                category.hidden = visibleSkills === 0;
+                shown += visibleSkills;
+            });
+
+            if (summary) {
+                summary.hidden = !(selected === 'All' && !query);
+            }
+            if (empty) {
+                empty.hidden = shown > 0;
+            }
+        }
+
+        buttons.forEach(function (button) {
+            button.addEventListener('click', function () {
+                selected = button.dataset.filter;
+                buttons.forEach(function (other) {
+                    other.classList.toggle('active', other === button);
+                });
+                applySkillFilter();
+            });
+        });
+
+        if (search) {
+            search.addEventListener('input', applySkillFilter);
+        }
+    }
+
+    // "Load more" fetches the next page of project cards and appends it
+    const loadMore = document.querySelector('.export-load-more');
+    const projectList = document.querySelector('.export-projects');
+    if (loadMore && projectList) {
+        const pages = JSON.parse(loadMore.dataset.pages);
+
+        loadMore.addEventListener('click', function () {
+            const next = pages.shift();
+            loadMore.disabled = true;
+
+            fetch(next)
+                .then(function (response) {
+                    if (!response.ok) {
+                        throw new Error(response.status + ' ' + next);
+                    }
+                    return response.text();
+                })
+                .then(function (html) {
+                    projectList.insertAdjacentHTML('beforeend', html);
+                    loadMore.hidden = pages.length === 0;
+                })
+                .catch(function (error) {
+                    pages.unshift(next);
+                    console.error('Could not load projects:', error);
+                })
+                .finally(function () {
+                    loadMore.disabled = false;
+                });
+        });
+    }
+
+    // Experience filters
+    const showCurrent = document.getElementById('show-current');
+    const showPast = document.getElementById('show-past');
+
+    function applyExperienceFilter() {
+        document.querySelectorAll('.export-experience').forEach(function (item) {
+            const current = item.dataset.current === 'true';
+            item.hidden = current ? !showCurrent.checked : !showPast.checked;
+        });
+    }
+
+    if (showCurrent && showPast) {
+        showCurrent.addEventListener('change', applyExperienceFilter);
+        showPast.addEventListener('change', applyExperienceFilter);
+    }
+
+    // "Show all" checkboxes open or close the matching <details> blocks
+    document.querySelectorAll('[data-toggle-details]').forEach(function (toggle) {
+        toggle.addEventListener('change', function () {
+            document.querySelectorAll('details[data-group="' + toggle.dataset.toggleDetails + '"]').forEach(function (details) {
+                details.open = toggle.checked;
+            });
+        });
+    });
+});
@@ -0,0 +1,435 @@
+"""
+Portfolio Memory Tracking
+=========================
+
+Allocation tracking for the running app, built on sampled ``tracemalloc``
+snapshots, plus a command line tool that sizes how many sessions a container
+can hold.
+
+In the app (``MEMORY_TRACKING=1``):
+
+- Every ``MEMORY_SAMPLE_EVERY``-th rerun is bracketed by two snapshots; the
+  diff gives the top allocation sites of that rerun
+- The first sampled rerun becomes the baseline; later samples are diffed
+  against it, so sites that keep growing over thousands of reruns stand out
+- Traced memory above the baseline, divided by the active sessions, plus the
+  deep size of each session's ``st.session_state``, estimates the memory
+  retained per session
+- Open the app with ``?debug=memory`` to see the report
+
+``tracemalloc`` slows down every allocation while it traces, so tracking is
+off by default and snapshots are only taken on sampled reruns. Snapshots are
+process-wide: allocations of other sessions rerunning at the same time show
+up in a rerun's diff.
+
+Usage:
+    python memory_tracker.py [--sessions 20] [--reruns 200] [--memory-limit-mb 512]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import gc
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+import tracemalloc
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from utils import format_bytes, measure_memory_usage
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parent
+APP_SCRIPT = ROOT / "app.py"
+
+# Allocations made by tracemalloc itself and the import system are noise in every diff
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# Session state sizes remembered for the footprint estimate
+MAX_TRACKED_SESSIONS = 1000
+
+# Objects visited by deep_sizeof before it gives up
+DEEP_SIZEOF_LIMIT = 100_000
+
+# Snapshots
+# =========
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Snapshot the traced allocations, without tracemalloc's own."""
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+def short_path(filename: str) -> str:
+    """Shorten a source path to the project or to ``site-packages/...``."""
+    try:
+        return str(Path(filename).relative_to(ROOT))
+    except ValueError:
+        marker = "site-packages" + os.sep
+        return filename.split(marker, 1)[1] if marker in filename else filename
+
+def top_sites(diff: Sequence[tracemalloc.StatisticDiff], limit: int) -> List[Dict[str, Any]]:
+    """
+    Describe the allocation sites that grew the most.
+
+    Args:
+        diff (Sequence[tracemalloc.StatisticDiff]): ``Snapshot.compare_to`` result
+        limit (int): Number of sites to keep
+
+    Returns:
+        List[Dict[str, Any]]: Site, size change, current size and block count change
+    """
+    sites = []
+    for stat in diff[:limit]:
+        frame = stat.traceback[0]
+        sites.append({
+            'site': f"{short_path(frame.filename)}:{frame.lineno}",
+            'size_diff': stat.size_diff,
+            'size': stat.size,
+            'count_diff': stat.count_diff,
+        })
+    return sites
+
+def growing(diff: Sequence[tracemalloc.StatisticDiff]) -> List[tracemalloc.StatisticDiff]:
+    """Only the sites that hold more memory than before, largest growth first."""
+    return sorted((stat for stat in diff if stat.size_diff > 0), key=lambda stat: stat.size_diff, reverse=True)
+
+def deep_sizeof(obj: Any, limit: int = DEEP_SIZEOF_LIMIT) -> int:
+    """
+    Estimate the bytes held by an object and everything it references.
+
+    Containers, instance ``__dict__`` and ``__slots__`` are followed; modules,
+    classes and functions are shared by the whole process and are not.
+
+    Args:
+        obj (Any): Root object, e.g. a session state dict
+        limit (int): Maximum number of objects to visit
+
+    Returns:
+        int: Total ``sys.getsizeof`` of the objects reached
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < limit:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, (type, type(sys), type(deep_sizeof))):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        if hasattr(item, "__dict__"):
+            stack.append(vars(item))
+        for slot in getattr(type(item), "__slots__", ()):
+            if isinstance(slot, str) and hasattr(item, slot):
+                stack.append(getattr(item, slot))
+    return total
+
+def count_active_sessions() -> Optional[int]:
+    """Number of browser sessions connected to this Streamlit server, if running in one."""
+    try:
+        from streamlit.runtime import Runtime
+
+        # The session manager has no public accessor; fall back to None if it changes
+        return Runtime.instance()._session_mgr.num_active_sessions()
+    except Exception:
+        return None
+
+# Tracker
+# =======
+
+class MemoryTracker:
+    """
+    Process-wide sampled allocation tracking for app reruns.
+
+    Wrap each rerun in :meth:`track_rerun`; it yields True on the reruns that
+    are sampled. Nothing is snapshotted while ``tracemalloc`` is not tracing.
+    """
+
+    def __init__(self, sample_every: int = 50, top: int = 10, frames: int = 1):
+        self.sample_every = max(1, sample_every)
+        self.top = top
+        self.frames = frames
+        self.reruns = 0
+        self.sampled = 0
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.baseline_traced = 0
+        self.latest: Optional[tracemalloc.Snapshot] = None
+        self.last_rerun: List[Dict[str, Any]] = []
+        self.session_state_bytes: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether ``tracemalloc`` is tracing."""
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        """Start tracing allocations (no-op if already tracing)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            logger.info(f"Memory tracking started: sampling 1 in {self.sample_every} reruns")
+
+    def stop(self) -> None:
+        """Stop tracing and drop the snapshots."""
+        tracemalloc.stop()
+        with self._lock:
+            self.baseline = self.latest = None
+            self.last_rerun = []
+
+    @contextmanager
+    def track_rerun(self) -> Iterator[bool]:
+        """
+        Bracket one rerun; snapshots it if it is sampled.
+
+        Yields:
+            bool: True if this rerun is sampled
+        """
+        with self._lock:
+            self.reruns += 1
+            sampled = self.enabled and self.reruns % self.sample_every == 0
+        if not sampled:
+            yield False
+            return
+
+        before = take_snapshot()
+        try:
+            yield True
+        finally:
+            after = take_snapshot()
+            traced = tracemalloc.get_traced_memory()[0]
+            last_rerun = top_sites(after.compare_to(before, "lineno"), self.top)
+            with self._lock:
+                self.sampled += 1
+                self.last_rerun = last_rerun
+                self.latest = after
+                if self.baseline is None:
+                    self.baseline, self.baseline_traced = after, traced
+
+    def reset_baseline(self) -> None:
+        """Make the current allocations the baseline for leak diffs."""
+        snapshot = take_snapshot()
+        with self._lock:
+            self.baseline = snapshot
+            self.baseline_traced = tracemalloc.get_traced_memory()[0]
+
+    def record_session(self, session_id: str, session_state: Dict[str, Any]) -> None:
+        """Remember the deep size of one session's state (call on sampled reruns)."""
+        size = deep_sizeof(session_state)
+        with self._lock:
+            self.session_state_bytes[session_id] = size
+            self.session_state_bytes.move_to_end(session_id)
+            while len(self.session_state_bytes) > MAX_TRACKED_SESSIONS:
+                self.session_state_bytes.popitem(last=False)
+
+    def leak_report(self) -> List[Dict[str, Any]]:
+        """Allocation sites that grew the most between the baseline and the latest sample."""
+        with self._lock:
+            baseline, latest = self.baseline, self.latest
+        if baseline is None or latest is None or baseline is latest:
+            return []
+        return top_sites(growing(latest.compare_to(baseline, "lineno")), self.top)
+
+    def session_estimate(self, active_sessions: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Estimate the memory retained per session.
+
+        Args:
+            active_sessions (Optional[int]): Connected sessions; looked up from
+                the Streamlit runtime when omitted
+
+        Returns:
+            Dict[str, Any]: Traced growth since the baseline, active sessions,
+            growth per session and mean session state size (bytes)
+        """
+        if active_sessions is None:
+            active_sessions = count_active_sessions()
+        with self._lock:
+            sizes = list(self.session_state_bytes.values())
+            baseline_traced = self.baseline_traced if self.baseline is not None else None
+
+        growth = None
+        if baseline_traced is not None and self.enabled:
+            growth = tracemalloc.get_traced_memory()[0] - baseline_traced
+
+        return {
+            'active_sessions': active_sessions,
+            'traced_growth': growth,
+            'growth_per_session': round(growth / active_sessions) if growth is not None and active_sessions else None,
+            'session_state_mean': round(sum(sizes) / len(sizes)) if sizes else None,
+            'session_state_max': max(sizes) if sizes else None,
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """Everything the tracker knows, for ``?debug=memory``."""
+        traced = tracemalloc.get_traced_memory() if self.enabled else None
+        return {
+            'enabled': self.enabled,
+            'reruns': self.reruns,
+            'sampled_reruns': self.sampled,
+            'traced_current': traced[0] if traced else None,
+            'traced_peak': traced[1] if traced else None,
+            'last_rerun_top_sites': self.last_rerun,
+            'growth_since_baseline_top_sites': self.leak_report(),
+            'per_session': self.session_estimate(),
+            'process': measure_memory_usage(),
+        }
+
+# Shared by every session of the running process
+memory_tracker = MemoryTracker()
+
+# Container Sizing
+# ================
+
+def process_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (psutil or /proc)."""
+    rss = measure_memory_usage()['memory_info'].get('rss')
+    if rss is not None:
+        return rss
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+def container_memory_limit() -> Optional[int]:
+    """Memory limit of the container from cgroup v2 or v1, in bytes."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            value = Path(path).read_text().strip()
+        except OSError:
+            continue
+        # "max" or a huge v1 value mean no limit
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value)
+    return None
+
+def load_session(at: Any) -> Any:
+    """Run a new AppTest session with every lazy section loaded."""
+    for section_id in ("skills", "experience", "education", "contact"):
+        at.session_state[f"lazy_loaded_{section_id}"] = True
+    return at.run()
+
+def measure_sessions(sessions: int, reruns: int, top: int) -> Dict[str, Any]:
+    """
+    Measure per-session footprint and rerun growth by driving ``app.py`` headlessly.
+
+    Args:
+        sessions (int): Sessions to open and keep alive at the same time
+        reruns (int): Reruns replayed in one session to look for growth
+        top (int): Allocation sites to list
+
+    Returns:
+        Dict[str, Any]: Per-session bytes, growth per rerun and top growth sites
+    """
+    from streamlit.testing.v1 import AppTest
+    from content import CONTENT
+
+    def new_session():
+        return AppTest.from_file(str(APP_SCRIPT), default_timeout=60)
+
+    # Warm up imports and process-wide caches so they are not billed to sessions
+    load_session(new_session())
+    gc.collect()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    rss_before = process_rss()
+
+    open_sessions = [load_session(new_session()) for _ in range(sessions)]
+    gc.collect()
+    traced_sessions = tracemalloc.get_traced_memory()[0] - traced_before
+    session_state = [deep_sizeof({key: at.session_state[key] for key in at.session_state}) for at in open_sessions]
+    del open_sessions
+    gc.collect()
+
+    # Replay reruns in one session; what is still allocated afterwards keeps growing per rerun
+    options = ["All", *(category.name for category in CONTENT.skill_categories)]
+    at = load_session(new_session())
+    for i in range(10):
+        at.button(key=f"filter_{options[i % len(options)]}").click().run()
+    gc.collect()
+    start = take_snapshot()
+    traced_start = tracemalloc.get_traced_memory()[0]
+    for i in range(reruns):
+        at.button(key=f"filter_{options[i % len(options)]}").click().run()
+    gc.collect()
+    growth = tracemalloc.get_traced_memory()[0] - traced_start
+    growth_sites = top_sites(growing(take_snapshot().compare_to(start, "lineno")), top)
+
+    per_session = round(traced_sessions / sessions) if sessions else 0
+    limit = container_memory_limit()
+    rss = process_rss()
+    return {
+        'sessions': sessions,
+        'per_session_traced': per_session,
+        'per_session_state_mean': round(sum(session_state) / len(session_state)) if session_state else 0,
+        'reruns': reruns,
+        'growth_per_rerun': round(growth / reruns) if reruns else 0,
+        'growth_top_sites': growth_sites,
+        'rss_before_sessions': rss_before,
+        'rss': rss,
+        'container_limit': limit,
+        'estimated_capacity': (limit - rss_before) // per_session if limit and rss_before and per_session > 0 else None,
+    }
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Measure per-session memory and rerun growth of app.py.")
+    parser.add_argument("--sessions", type=int, default=20, help="sessions kept open at once (default: 20)")
+    parser.add_argument("--reruns", type=int, default=200, help="reruns replayed to look for leaks (default: 200)")
+    parser.add_argument("--top", type=int, default=10, help="allocation sites to list (default: 10)")
+    parser.add_argument("--memory-limit-mb", type=int, help="container memory limit; read from cgroups when omitted")
+    parser.add_argument("--output", type=Path, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.sessions < 1 or args.reruns < 1:
+        parser.error("--sessions and --reruns must be at least 1")
+
+    # AppTest resolves static assets and .streamlit/config.toml from the working directory
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    tracemalloc.start(1)
+
+    report = measure_sessions(args.sessions, args.reruns, args.top)
+    if args.memory_limit_mb:
+        report['container_limit'] = args.memory_limit_mb * 1024 * 1024
+        if report['rss_before_sessions'] and report['per_session_traced'] > 0:
+            report['estimated_capacity'] = (
+                (report['container_limit'] - report['rss_before_sessions']) // report['per_session_traced']
+            )
+
+    print(f"🧠 Per session: {format_bytes(report['per_session_traced'])} traced, "
+          f"{format_bytes(report['per_session_state_mean'])} of session state ({args.sessions} sessions)")
+    print(f"🔁 Growth per rerun: {format_bytes(max(0, report['growth_per_rerun']))} over {args.reruns} reruns")
+    for site in report['growth_top_sites']:
+        print(f"   {site['size_diff']:>+10,} B  {site['count_diff']:>+6} blocks  {site['site']}")
+    if report['estimated_capacity'] is not None:
+        print(f"📦 About {report['estimated_capacity']:,} sessions fit in {format_bytes(report['container_limit'])} "
+              f"(process at {format_bytes(report['rss_before_sessions'])} before sessions)")
+    else:
+        print("📦 No container memory limit found; pass --memory-limit-mb to estimate capacity")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"✅ Report written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
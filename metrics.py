@@ -0,0 +1,336 @@
+"""
+Portfolio Render Metrics
+========================
+
+In-process counters and latency histograms for the sections of the page,
+exposed in the Prometheus text exposition format (version 0.0.4).
+
+Every section function in ``app.py`` is wrapped with
+``utils.section_timings.timed``. :func:`install` subscribes to those timings
+and records, labelled by ``section``:
+
+- ``portfolio_section_renders_total``: number of renders
+- ``portfolio_section_render_seconds``: histogram of render times
+
+``portfolio_contact_rejections_total`` counts contact form submissions shed
+by the rate limits, labelled by ``reason``.
+
+It also subscribes to ``utils.web_vitals``, the real-user metrics the
+browser reports, labelled by ``metric``, ``section`` and ``device``:
+
+- ``portfolio_web_vital_seconds``: LCP, FCP, INP and navigation timings
+- ``portfolio_web_vital_layout_shift``: CLS
+
+The text can be scraped from a local HTTP endpoint (``METRICS_PORT``) and/or
+written to a file every ``METRICS_FILE_INTERVAL`` seconds (``METRICS_FILE``),
+for example into the directory of node_exporter's textfile collector. The
+p95 render time per section is then::
+
+    histogram_quantile(0.95, sum by (section, le) (rate(portfolio_section_render_seconds_bucket[5m])))
+
+and the p75 LCP per device class::
+
+    histogram_quantile(0.75, sum by (device, le) (rate(portfolio_web_vital_seconds_bucket{metric="LCP"}[1h])))
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import os
+import bisect
+import logging
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Sequence, Tuple
+
+from utils import WEB_VITALS, section_timings, web_vitals
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds, from a cached fragment (well under a millisecond)
+# to a cold section render
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Web Vitals buckets: around the "good" and "poor" thresholds of each metric
+WEB_VITAL_BUCKETS = (0.05, 0.1, 0.2, 0.5, 0.8, 1.0, 1.8, 2.5, 3.0, 4.0, 6.0, 10.0)
+LAYOUT_SHIFT_BUCKETS = (0.01, 0.05, 0.1, 0.15, 0.25, 0.5, 1.0)
+
+# A sample: metric name suffix, labels, value
+Sample = Tuple[str, Dict[str, str], float]
+
+# Metric Types
+# ============
+
+def format_value(value: float) -> str:
+    """Format a sample value or bucket bound for the exposition format."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+class Counter:
+    """A monotonically increasing count per combination of label values."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the count for ``label_values``."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def samples(self) -> List[Sample]:
+        """Current samples, one per combination of label values."""
+        with self._lock:
+            values = dict(self._values)
+        return [("", dict(zip(self.label_names, labels)), value) for labels, value in sorted(values.items())]
+
+class Histogram:
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket (last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation for ``label_values``."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self) -> List[Sample]:
+        """Cumulative ``_bucket`` samples plus ``_sum`` and ``_count`` per label values."""
+        with self._lock:
+            series = {labels: (list(counts), total) for labels, (counts, total) in self._series.items()}
+
+        samples: List[Sample] = []
+        for labels, (counts, total) in sorted(series.items()):
+            label_map = dict(zip(self.label_names, labels))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                samples.append(("_bucket", {**label_map, "le": format_value(bound)}, cumulative))
+            samples.append(("_sum", label_map, total))
+            samples.append(("_count", label_map, cumulative))
+        return samples
+
+class MetricsRegistry:
+    """The metrics of the process, rendered together in the exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def exposition(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text, ending with a newline
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.samples():
+                label_text = ",".join(f'{key}="{escape_label(val)}"' for key, val in labels.items())
+                name = metric.name + suffix
+                lines.append(f"{name}{{{label_text}}} {format_value(value)}" if label_text else f"{name} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+# Shared by every session of the running process
+REGISTRY = MetricsRegistry()
+
+SECTION_RENDERS = REGISTRY.counter(
+    "portfolio_section_renders_total", "Number of times each page section was rendered.", ("section",)
+)
+SECTION_RENDER_SECONDS = REGISTRY.histogram(
+    "portfolio_section_render_seconds", "Time taken to render each page section.", ("section",)
+)
+
+CONTACT_REJECTIONS = REGISTRY.counter(
+    "portfolio_contact_rejections_total", "Contact form submissions rejected by the rate limits.", ("reason",)
+)
+WEB_VITAL_SECONDS = REGISTRY.histogram(
+    "portfolio_web_vital_seconds", "Web Vitals and navigation timings reported by visitors' browsers.",
+    ("metric", "section", "device"), WEB_VITAL_BUCKETS
+)
+WEB_VITAL_LAYOUT_SHIFT = REGISTRY.histogram(
+    "portfolio_web_vital_layout_shift", "Cumulative layout shift reported by visitors' browsers.",
+    ("metric", "section", "device"), LAYOUT_SHIFT_BUCKETS
+)
+
+def record_section(name: str, duration_ms: float) -> None:
+    """``utils.section_timings`` listener feeding the section metrics."""
+    SECTION_RENDERS.inc(name)
+    SECTION_RENDER_SECONDS.observe(duration_ms / 1000, name)
+
+def record_web_vital(metric: str, section: str, device: str, value: float) -> None:
+    """``utils.web_vitals`` listener feeding the Web Vitals histograms."""
+    if WEB_VITALS[metric][0] == "ms":
+        WEB_VITAL_SECONDS.observe(value / 1000, metric, section, device)
+    else:
+        WEB_VITAL_LAYOUT_SHIFT.observe(value, metric, section, device)
+
+# Exporters
+# =========
+
+def write_metrics_file(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """
+    Write the exposition text to ``path``.
+
+    The text goes to a temporary file that then replaces ``path``, so a
+    collector never reads a half-written file.
+
+    Args:
+        path (str): Target file
+        registry (MetricsRegistry): Metrics to write
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temp_path.write_text(registry.exposition(), encoding="utf-8")
+    os.replace(temp_path, target)
+
+class MetricsFileWriter(threading.Thread):
+    """Daemon thread writing the metrics file every ``interval`` seconds."""
+
+    def __init__(self, path: str, interval: float, registry: MetricsRegistry = REGISTRY):
+        super().__init__(name="metrics-file-writer", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                write_metrics_file(self.path, self.registry)
+            except OSError as e:
+                logger.error(f"Error writing metrics file {self.path}: {e}")
+
+    def stop(self) -> None:
+        """Stop after writing the file one last time."""
+        self._stopped.set()
+        write_metrics_file(self.path, self.registry)
+
+def start_http_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    Serve the exposition text at ``http://<host>:<port>/metrics`` from a daemon thread.
+
+    Args:
+        port (int): Port to listen on
+        host (str): Interface to bind; local only by default
+        registry (MetricsRegistry): Metrics to serve
+
+    Returns:
+        ThreadingHTTPServer: The running server (call ``shutdown()`` to stop it)
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.exposition().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"Metrics request: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+_install_lock = threading.Lock()
+_installed = False
+
+def install(port: int = 0, file_path: str = "", interval: float = 15.0) -> None:
+    """
+    Start recording section and Web Vitals metrics and start the configured exporters.
+
+    Safe to call more than once; only the first call has an effect.
+
+    Args:
+        port (int): Port for the ``/metrics`` endpoint; 0 disables it
+        file_path (str): File to write the metrics to; empty disables it
+        interval (float): Seconds between file writes
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        _installed = True
+
+    section_timings.add_listener(record_section)
+    web_vitals.add_listener(record_web_vital)
+
+    if port:
+        try:
+            start_http_server(port)
+            logger.info(f"Serving metrics at http://127.0.0.1:{port}/metrics")
+        except OSError as e:
+            logger.error(f"Could not serve metrics on port {port}: {e}")
+
+    if file_path:
+        MetricsFileWriter(file_path, interval).start()
+        logger.info(f"Writing metrics to {file_path} every {interval:g}s")
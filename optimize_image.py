@@ -1,55 +1,399 @@
 """
-Image Optimization Script
-This script optimizes your profile photo for better web performance.
+Portfolio Image Optimizer
+=========================
+
+Builds web-ready copies of images.
+
+- With no arguments, optimizes the profile photo (``IMG_4921.PNG`` to
+  ``profile_photo_optimized.jpg``).
+- Given image files or folders, builds every configured width and format
+  (``config.IMAGE_BATCH_*``) of each image with
+  ``utils.build_image_derivatives``, into ``<output>/<source hash>/``.
+
+Batches are incremental. ``batch-manifest.json`` in the output folder
+records each source's size, modification time and derivative manifest, and
+the settings they were built with:
+
+- a source whose size and modification time match (and whose derivatives
+  are still on disk) is skipped without being opened
+- a source that was touched, copied or renamed is hashed, and its existing
+  derivatives are reused if its content is unchanged
+- only new or edited images are decoded and encoded, spread over a process
+  pool with one worker per core
+
+Adding one photo to a gallery of hundreds therefore costs a ``stat`` per
+photo plus the encoding of the new one.
+
+Usage:
+    python optimize_image.py
+    python optimize_image.py SOURCE [SOURCE ...] [--output static/img/gallery]
+                             [--widths 320 640 1280] [--formats WEBP JPEG]
+                             [--quality 80] [--workers N] [--force]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
 """
 
-from PIL import Image
 import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from config import IMAGE_BATCH_FORMATS, IMAGE_BATCH_OUTPUT, IMAGE_BATCH_QUALITY, IMAGE_BATCH_WIDTHS
+from utils import build_image_derivatives, get_file_hash, image_derivative_settings, supported_image_formats
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parent
+
+BATCH_MANIFEST_NAME = "batch-manifest.json"
+
+# Files picked up when a folder is given as a source
+SOURCE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif", ".bmp", ".tif", ".tiff"})
+
+# Profile Photo
+# =============
 
 def optimize_profile_photo():
     """Optimize the profile photo for web use"""
-    
+
     input_path = "IMG_4921.PNG"
     output_path = "profile_photo_optimized.jpg"
-    
+
     if not os.path.exists(input_path):
         print(f"❌ Image not found: {input_path}")
         return
-    
+
     try:
         # Open the image
         img = Image.open(input_path)
         print(f"📸 Original image: {img.size}, {img.format}")
-        
+
         # Convert to RGB if needed
         if img.mode in ("RGBA", "P"):
             img = img.convert("RGB")
-        
+
         # Resize to optimal size for web (300x300 for profile photos)
         # Maintain aspect ratio
         img.thumbnail((400, 400), Image.Resampling.LANCZOS)
-        
+
         # Save optimized version
         img.save(output_path, "JPEG", quality=85, optimize=True)
-        
+
         # Check file sizes
         original_size = os.path.getsize(input_path) / 1024  # KB
         optimized_size = os.path.getsize(output_path) / 1024  # KB
-        
+
         print(f"✅ Optimized image: {img.size}")
         print(f"📁 Original size: {original_size:.1f} KB")
         print(f"📁 Optimized size: {optimized_size:.1f} KB")
         print(f"💾 Size reduction: {((original_size - optimized_size) / original_size * 100):.1f}%")
-        
+
         # Update config to use optimized image
         config_content = """
 # Update your config.py with this line:
 PROFILE_PHOTO = "profile_photo_optimized.jpg"
 """
         print(config_content)
-        
+
     except Exception as e:
         print(f"❌ Error optimizing image: {e}")
 
+# Batches
+# =======
+
+class BatchSettings(NamedTuple):
+    """Widths, formats and quality every image of a batch is built with."""
+    widths: Tuple[int, ...]
+    formats: Tuple[str, ...]
+    quality: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The settings as stored in manifests (see ``utils.build_image_derivatives``)."""
+        return image_derivative_settings(self.widths, self.formats, self.quality)
+
+class BatchResult(NamedTuple):
+    """Outcome of :func:`run_batch`."""
+    built: List[str]
+    unchanged: int
+    failed: List[str]
+    workers: int
+    seconds: float
+
+def batch_settings(
+    widths: Optional[Sequence[int]] = None,
+    formats: Optional[Sequence[str]] = None,
+    quality: Optional[int] = None
+) -> BatchSettings:
+    """Settings from the arguments, falling back to ``config.IMAGE_BATCH_*``."""
+    formats = formats or IMAGE_BATCH_FORMATS or supported_image_formats()
+    return BatchSettings(
+        widths=tuple(widths or IMAGE_BATCH_WIDTHS),
+        formats=tuple(fmt.upper() for fmt in formats),
+        quality=quality if quality is not None else IMAGE_BATCH_QUALITY,
+    )
+
+def find_sources(paths: Iterable[os.PathLike], exclude: Optional[Path] = None) -> List[Path]:
+    """
+    Expand files and folders into the list of source images.
+
+    Args:
+        paths (Iterable[os.PathLike]): Image files, or folders searched recursively
+        exclude (Optional[Path]): Folder to leave out, e.g. the output folder
+
+    Returns:
+        List[Path]: Source images in a stable order, without duplicates
+    """
+    excluded = exclude.resolve() if exclude else None
+    sources: Dict[Path, None] = {}
+    for path in map(Path, paths):
+        if path.is_dir():
+            for candidate in sorted(path.rglob("*")):
+                if candidate.suffix.lower() not in SOURCE_EXTENSIONS or not candidate.is_file():
+                    continue
+                if excluded and excluded in candidate.resolve().parents:
+                    continue
+                sources[candidate] = None
+        else:
+            sources[path] = None
+    return list(sources)
+
+def load_batch_manifest(output_dir: Path) -> Dict[str, Any]:
+    """The manifest of the previous batch in ``output_dir``, or an empty one."""
+    manifest_path = output_dir / BATCH_MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning(f"Ignoring unreadable batch manifest {manifest_path}")
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_batch_manifest(output_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Write the batch manifest atomically."""
+    manifest_path = output_dir / BATCH_MANIFEST_NAME
+    temp_path = manifest_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(temp_path, manifest_path)
+
+def _source_id(source: Path) -> str:
+    """Key of a source in the batch manifest."""
+    return source.resolve().as_posix()
+
+def plan_batch(
+    sources: Sequence[Path],
+    previous: Dict[str, Any],
+    settings: BatchSettings,
+    output_dir: Path
+) -> Tuple[List[Tuple[Path, os.stat_result]], Dict[str, Dict[str, Any]]]:
+    """
+    Split sources into those to build and those the previous batch still covers.
+
+    Args:
+        sources (Sequence[Path]): Source images
+        previous (Dict[str, Any]): Manifest of the previous batch (empty to check everything)
+        settings (BatchSettings): Settings of this batch
+        output_dir (Path): Output folder
+
+    Returns:
+        Tuple: ``(source, stat)`` pairs to build, and the unchanged entries by source id
+    """
+    entries = previous.get("sources", {}) if previous.get("settings") == settings.as_dict() else {}
+    pending = []
+    unchanged = {}
+    for source in sources:
+        try:
+            stat = source.stat()
+        except OSError as e:
+            logger.error(f"Cannot read image {source}: {e}")
+            continue
+
+        source_id = _source_id(source)
+        entry = entries.get(source_id)
+        if (
+            entry is not None
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and (output_dir / entry["image"]["source_hash"][:16] / "manifest.json").exists()
+        ):
+            unchanged[source_id] = entry
+        else:
+            pending.append((source, stat))
+    return pending, unchanged
+
+def group_duplicates(
+    pending: Sequence[Tuple[Path, os.stat_result]]
+) -> List[List[Tuple[Path, os.stat_result]]]:
+    """
+    Group pending sources with identical content so each image is encoded once.
+
+    Only sources that share a file size are hashed; a source that cannot be
+    hashed stays in a group of its own and fails on its own.
+
+    Args:
+        pending (Sequence[Tuple[Path, os.stat_result]]): Sources to build
+
+    Returns:
+        List[List[Tuple[Path, os.stat_result]]]: Groups in first-seen order
+    """
+    by_size: Dict[int, List[Tuple[Path, os.stat_result]]] = {}
+    for item in pending:
+        by_size.setdefault(item[1].st_size, []).append(item)
+
+    groups: Dict[Any, List[Tuple[Path, os.stat_result]]] = {}
+    for size, items in by_size.items():
+        for item in items:
+            content_hash = get_file_hash(str(item[0]), "sha256") if len(items) > 1 else None
+            key = (size, content_hash) if content_hash else item[0]
+            groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+def _build_source(source: str, output_dir: str, settings: BatchSettings) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Build one source's derivatives (runs in a pool worker)."""
+    start_time = time.perf_counter()
+    manifest = build_image_derivatives(
+        source, output_dir, widths=settings.widths, formats=settings.formats, quality=settings.quality
+    )
+    return manifest, time.perf_counter() - start_time
+
+def run_batch(
+    sources: Sequence[Path],
+    output_dir: Path,
+    settings: BatchSettings,
+    workers: Optional[int] = None,
+    force: bool = False,
+    on_result: Optional[Callable[[Path, Optional[Dict[str, Any]], float], None]] = None
+) -> BatchResult:
+    """
+    Build the derivatives of every new or changed source and update the batch manifest.
+
+    Args:
+        sources (Sequence[Path]): Source images
+        output_dir (Path): Folder holding one sub-folder per source hash
+        settings (BatchSettings): Widths, formats and quality
+        workers (Optional[int]): Worker processes (default: one per core)
+        force (bool): Ignore the previous batch and check every source by content hash
+        on_result (Optional[Callable]): Called with each built source, its
+            manifest (None on failure) and the seconds it took
+
+    Returns:
+        BatchResult: Built and failed sources, the number left unchanged, the
+        workers used and the wall time
+    """
+    start_time = time.perf_counter()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    previous = load_batch_manifest(output_dir)
+    pending, entries = plan_batch(sources, {} if force else previous, settings, output_dir)
+    unchanged = len(entries)
+
+    built: List[str] = []
+    failed: List[str] = []
+
+    def record(source: Path, stat: os.stat_result, manifest: Optional[Dict[str, Any]], seconds: float) -> None:
+        if manifest is None:
+            failed.append(str(source))
+        else:
+            built.append(str(source))
+            entries[_source_id(source)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "image": manifest}
+        if on_result:
+            on_result(source, manifest, seconds)
+
+    groups = group_duplicates(pending)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(groups)))
+    if workers == 1:
+        # Not worth starting a pool
+        for group in groups:
+            manifest, seconds = _build_source(str(group[0][0]), str(output_dir), settings)
+            for source, stat in group:
+                record(source, stat, manifest, seconds)
+    elif groups:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_build_source, str(group[0][0]), str(output_dir), settings): group
+                for group in groups
+            }
+            for future in as_completed(futures):
+                group = futures[future]
+                try:
+                    manifest, seconds = future.result()
+                except Exception as e:
+                    logger.error(f"Error optimizing image {group[0][0]}: {e}")
+                    manifest, seconds = None, 0.0
+                for source, stat in group:
+                    record(source, stat, manifest, seconds)
+
+    # Sources outside this run keep their entries; those that no longer exist drop out of the manifest
+    previous_entries = previous.get("sources", {}) if previous.get("settings") == settings.as_dict() else {}
+    run_ids = {_source_id(source) for source in sources}
+    for source_id, entry in previous_entries.items():
+        if source_id not in run_ids and os.path.exists(source_id):
+            entries[source_id] = entry
+    if entries != previous_entries or previous.get("settings") != settings.as_dict():
+        save_batch_manifest(output_dir, {"settings": settings.as_dict(), "sources": dict(sorted(entries.items()))})
+
+    return BatchResult(
+        built=built,
+        unchanged=unchanged,
+        failed=failed,
+        workers=workers if pending else 0,
+        seconds=time.perf_counter() - start_time,
+    )
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Optimize the profile photo, or build responsive copies of many images.")
+    parser.add_argument("sources", nargs="*", type=Path, help="image files or folders (default: the profile photo only)")
+    parser.add_argument("--output", type=Path, default=ROOT / IMAGE_BATCH_OUTPUT,
+                        help=f"folder for the copies and {BATCH_MANIFEST_NAME} (default: {IMAGE_BATCH_OUTPUT})")
+    parser.add_argument("--widths", type=int, nargs="+", help="widths in pixels (default: config.IMAGE_BATCH_WIDTHS)")
+    parser.add_argument("--formats", nargs="+", help="output formats, e.g. AVIF WEBP JPEG (default: every supported format)")
+    parser.add_argument("--quality", type=int, help="encoder quality 1-100 (default: config.IMAGE_BATCH_QUALITY)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--force", action="store_true", help="ignore the previous batch and check every image by content hash")
+    args = parser.parse_args(argv)
+
+    if not args.sources:
+        optimize_profile_photo()
+        return 0
+
+    if args.quality is not None and not 1 <= args.quality <= 100:
+        parser.error("--quality must be between 1 and 100")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    settings = batch_settings(args.widths, args.formats, args.quality)
+    sources = find_sources(args.sources, exclude=args.output)
+    if not sources:
+        print("❌ No images found")
+        return 1
+
+    print(f"🖼️  {len(sources)} images; widths {', '.join(map(str, settings.widths))}; "
+          f"{', '.join(settings.formats)} at quality {settings.quality}")
+
+    def report(source: Path, manifest: Optional[Dict[str, Any]], seconds: float) -> None:
+        print(f"   {'✅' if manifest else '❌'} {source} ({seconds:.2f}s)")
+
+    result = run_batch(sources, args.output, settings, workers=args.workers, force=args.force, on_result=report)
+
+    print(f"📁 {len(result.built)} built, {result.unchanged} unchanged, {len(result.failed)} failed "
+          f"-> {args.output}/{BATCH_MANIFEST_NAME}")
+    if result.workers:
+        print(f"⚙️  {result.workers} worker{'s' if result.workers > 1 else ''}")
+    print(f"⏱️  Done in {result.seconds * 1000:.0f} ms")
+    return 1 if result.failed else 0
+
 if __name__ == "__main__":
-    optimize_profile_photo()
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Portfolio Rate Limiting
+=======================
+
+Token buckets and concurrency limits that shed abusive traffic before it
+costs anything.
+
+- :class:`RateLimiter` keeps one token bucket per key (a session id, a client
+  address) in a shared, lock-protected table. A bucket that has refilled
+  completely holds no information, so it expires and is dropped; the table
+  is also capped, evicting the least recently used keys first.
+- :class:`ConcurrencyLimiter` bounds how many requests run at once and
+  refuses, rather than queues, the rest.
+- :class:`SubmissionGuard` combines them for the contact form: a bucket per
+  session, a bucket per client address, a global bucket and a global
+  concurrency limit. Each check is a dictionary lookup and a little
+  arithmetic under a lock, so a rejected submission costs next to nothing.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class RateDecision(NamedTuple):
+    """Outcome of a rate limit check."""
+    allowed: bool
+    reason: str = ""
+    retry_after: float = 0.0
+
+ALLOWED = RateDecision(True)
+
+# Token Buckets
+# =============
+
+class RateLimiter:
+    """
+    Token buckets per key.
+
+    Each key may spend up to ``capacity`` tokens in a burst; tokens come back
+    at ``rate`` per second. Buckets are created full on first use.
+    """
+
+    def __init__(self, capacity: float, rate: float, max_keys: int = 100_000, clock=time.monotonic):
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> [tokens, updated]; least recently used first
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """Seconds after which an untouched bucket is full again, and can be forgotten."""
+        return self.capacity / self.rate
+
+    def acquire(self, key: str, cost: float = 1.0) -> float:
+        """
+        Take ``cost`` tokens from the bucket of ``key`` if it has them.
+
+        Args:
+            key (str): Bucket key, e.g. a session id
+            cost (float): Tokens to take
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the seconds until
+            the bucket holds enough
+        """
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.capacity, now]
+                self._evict(now)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return 0.0
+            return (cost - bucket[0]) / self.rate
+
+    def _evict(self, now: float) -> None:
+        """Drop expired buckets from the old end, then the oldest ones while over ``max_keys``."""
+        buckets = self._buckets
+        ttl = self.ttl
+        while buckets:
+            key, (_, updated) = next(iter(buckets.items()))
+            if now - updated < ttl and len(buckets) <= self.max_keys:
+                break
+            del buckets[key]
+
+    def sweep(self) -> int:
+        """Forget every expired bucket; returns how many were dropped."""
+        now = self._clock()
+        with self._lock:
+            before = len(self._buckets)
+            self._evict(now)
+            return before - len(self._buckets)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+# Concurrency
+# ===========
+
+class ConcurrencyLimiter:
+    """Bounds the number of operations in flight; excess callers are refused, not queued."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free."""
+        with self._lock:
+            if self._active >= self.limit:
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        """Give back a slot taken with :meth:`try_acquire`."""
+        with self._lock:
+            self._active -= 1
+
+    @property
+    def active(self) -> int:
+        """Operations currently holding a slot."""
+        return self._active
+
+# Contact Form
+# ============
+
+class SubmissionGuard:
+    """
+    Admission control for form submissions.
+
+    A submission must get a token from its session's bucket, its client
+    address's bucket and the global bucket, in that order, and then a slot
+    of the global concurrency limit. Tokens taken before a later check fails
+    are not returned: every attempt counts, which is what slows a flood.
+    """
+
+    def __init__(
+        self,
+        session_burst: int,
+        session_per_hour: float,
+        address_burst: int,
+        address_per_hour: float,
+        global_per_minute: float,
+        max_concurrent: int,
+        max_keys: int = 100_000
+    ):
+        self.sessions = RateLimiter(session_burst, session_per_hour / 3600, max_keys)
+        self.addresses = RateLimiter(address_burst, address_per_hour / 3600, max_keys)
+        self.site = RateLimiter(global_per_minute, global_per_minute / 60)
+        self.concurrency = ConcurrencyLimiter(max_concurrent)
+        self.rejected: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def check(self, session_id: str, address: Optional[str]) -> RateDecision:
+        """
+        Decide whether a submission may be processed, spending its tokens.
+
+        Args:
+            session_id (str): Streamlit session id
+            address (Optional[str]): Client address, if known
+
+        Returns:
+            RateDecision: ``allowed``, or the failed check (``"session"``,
+            ``"address"`` or ``"global"``) and the seconds until it would pass
+        """
+        checks = (("session", self.sessions, session_id), ("address", self.addresses, address), ("global", self.site, "*"))
+        for reason, limiter, key in checks:
+            if key is None:
+                continue
+            retry_after = limiter.acquire(key)
+            if retry_after:
+                return self._reject(reason, retry_after)
+        return ALLOWED
+
+    @contextmanager
+    def admit(self, session_id: str, address: Optional[str]) -> Iterator[RateDecision]:
+        """
+        Check a submission and hold a concurrency slot while it is processed.
+
+        Yields:
+            RateDecision: Process the submission only if ``allowed``; a full
+            concurrency limit is reported as ``"busy"``
+        """
+        decision = self.check(session_id, address)
+        if not decision.allowed:
+            yield decision
+            return
+        if not self.concurrency.try_acquire():
+            yield self._reject("busy", 1.0)
+            return
+        try:
+            yield decision
+        finally:
+            self.concurrency.release()
+
+    def _reject(self, reason: str, retry_after: float) -> RateDecision:
+        with self._lock:
+            self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        logger.debug(f"Contact form submission rejected ({reason}); retry in {retry_after:.0f}s")
+        return RateDecision(False, reason, retry_after)
+
+    def stats(self) -> Dict[str, object]:
+        """Tracked keys, submissions in flight and rejections per reason."""
+        with self._lock:
+            rejected = dict(self.rejected)
+        return {
+            "sessions": len(self.sessions),
+            "addresses": len(self.addresses),
+            "in_flight": self.concurrency.active,
+            "rejected": rejected,
+        }
@@ -0,0 +1,339 @@
+"""
+Portfolio Rerun Benchmark
+=========================
+
+Drives ``app.py`` headlessly through Streamlit's app-testing harness
+(``streamlit.testing.v1.AppTest``) and measures what a page load and each
+interaction cost.
+
+Every scenario prepares a session (loading the lazy sections first where the
+interaction needs them), then times the run triggered by one interaction:
+
+- ``cold_load``: first run of a new session (lazy sections as placeholders)
+- ``full_load``: first run with every lazy section already loaded
+- ``filter_<category>``: each skills filter button
+- ``skill_search``: typing a query in the skills search box
+- ``experience_toggles`` / ``education_toggles``: the section checkboxes
+- ``contact_submit``: submitting a valid contact form
+
+For each scenario the report holds the wall time of the run, the time spent
+in each section (``utils.section_timings``), the number of elements the run
+produced, the bytes of HTML passed to ``st.markdown`` and the serialized size
+of the elements. AppTest reruns the whole script for every interaction, so
+figures for widgets inside ``@st.fragment`` sections are those of a full
+rerun: an upper bound on what the browser receives.
+
+Results are written as JSON; pass an earlier result with ``--compare`` to
+print the change per scenario.
+
+Usage:
+    python rerun_benchmark.py [--repeat 5] [--scenario NAME ...]
+                              [--output rerun_benchmark.json] [--compare OLD.json]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+import config
+from content import CONTENT
+from utils import section_timings
+
+ROOT = Path(__file__).parent
+APP_SCRIPT = ROOT / "app.py"
+DEFAULT_OUTPUT = ROOT / "rerun_benchmark.json"
+
+# Seconds AppTest waits for a single run
+RUN_TIMEOUT = 60
+
+LAZY_SECTION_IDS = ("skills", "experience", "education", "contact")
+
+# Prepares the session; returns the interaction to time
+Scenario = Callable[[AppTest], Callable[[AppTest], AppTest]]
+
+# Scenarios
+# =========
+
+def load_all_sections(at: AppTest) -> AppTest:
+    """Mark every lazy section as loaded and run the app once."""
+    for section_id in LAZY_SECTION_IDS:
+        at.session_state[f"lazy_loaded_{section_id}"] = True
+    return at.run()
+
+def cold_load(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """First run of a new session."""
+    return lambda app: app.run()
+
+def full_load(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """First run of a session that has every lazy section loaded."""
+    for section_id in LAZY_SECTION_IDS:
+        at.session_state[f"lazy_loaded_{section_id}"] = True
+    return lambda app: app.run()
+
+def skills_filter(option: str) -> Scenario:
+    """Scenario clicking the skills filter button for ``option``."""
+    def prepare(at: AppTest) -> Callable[[AppTest], AppTest]:
+        load_all_sections(at)
+        return lambda app: app.button(key=f"filter_{option}").click().run()
+    return prepare
+
+def skill_search(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """Type a (partial) query in the skills search box."""
+    load_all_sections(at)
+    return lambda app: app.text_input(key="skill_search").input("pyth").run()
+
+def experience_toggles(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """Hide past positions and show all details."""
+    load_all_sections(at)
+
+    def interact(app: AppTest) -> AppTest:
+        app.checkbox(key="show_past").uncheck()
+        app.checkbox(key="show_details").check()
+        return app.run()
+    return interact
+
+def education_toggles(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """Open the coursework, academic projects and achievements."""
+    load_all_sections(at)
+
+    def interact(app: AppTest) -> AppTest:
+        for key in ("show_coursework", "show_projects", "show_achievements"):
+            app.checkbox(key=key).check()
+        return app.run()
+    return interact
+
+def contact_submit(at: AppTest) -> Callable[[AppTest], AppTest]:
+    """Fill in and submit a valid contact form."""
+    load_all_sections(at)
+
+    def interact(app: AppTest) -> AppTest:
+        fields = {widget.label: widget for widget in app.text_input}
+        fields["Full Name *"].input("Benchmark Visitor")
+        fields["Email Address *"].input("visitor@example.com")
+        fields["Company/Organization"].input("Example Ltd")
+        subject = app.selectbox[0]
+        subject.select(subject.options[1])
+        app.text_area[0].input("Hello, this message is sent by the rerun benchmark.")
+        app.checkbox[-1].check()
+        return app.button[-1].click().run()
+    return interact
+
+def build_scenarios() -> Dict[str, Scenario]:
+    """All scenarios, in report order."""
+    scenarios: Dict[str, Scenario] = {
+        "cold_load": cold_load,
+        "full_load": full_load,
+    }
+    for option in ["All", *(category.name for category in CONTENT.skill_categories)]:
+        scenarios[f"filter_{option}"] = skills_filter(option)
+    scenarios["skill_search"] = skill_search
+    scenarios["experience_toggles"] = experience_toggles
+    scenarios["education_toggles"] = education_toggles
+    scenarios["contact_submit"] = contact_submit
+    return scenarios
+
+# Measurement
+# ===========
+
+def iter_elements(node: Any) -> Iterator[Any]:
+    """Yield every element (leaf node) of an AppTest element tree."""
+    children = getattr(node, "children", None)
+    if children is None:
+        yield node
+        return
+    for child in children.values():
+        yield from iter_elements(child)
+
+def payload_size(at: AppTest) -> Dict[str, int]:
+    """Count the elements of the last run and the bytes they carry."""
+    elements = list(iter_elements(at.main))
+    return {
+        "elements": len(elements),
+        "html_bytes": sum(len(markdown.value.encode("utf-8")) for markdown in at.markdown),
+        "delta_bytes": sum(element.proto.ByteSize() for element in elements if getattr(element, "proto", None) is not None),
+    }
+
+def run_scenario(name: str, prepare: Scenario, repeat: int) -> Dict[str, Any]:
+    """
+    Time one scenario.
+
+    Args:
+        name (str): Scenario name, used in error messages
+        prepare (Scenario): Scenario setup returning the interaction to time
+        repeat (int): Number of timed runs, each in a fresh session
+
+    Returns:
+        Dict[str, Any]: Wall time statistics, median section times and payload size
+
+    Raises:
+        RuntimeError: If the app raised an exception during the timed run
+    """
+    wall_ms: List[float] = []
+    sections_ms: Dict[str, List[float]] = {}
+    payload: Dict[str, int] = {}
+
+    for _ in range(repeat):
+        at = AppTest.from_file(str(APP_SCRIPT), default_timeout=RUN_TIMEOUT)
+        interact = prepare(at)
+
+        run_sections: Dict[str, float] = {}
+
+        def record(section: str, duration: float) -> None:
+            run_sections[section] = run_sections.get(section, 0.0) + duration
+
+        section_timings.add_listener(record)
+        try:
+            start_time = time.perf_counter()
+            interact(at)
+            wall_ms.append((time.perf_counter() - start_time) * 1000)
+        finally:
+            section_timings.remove_listener(record)
+
+        if at.exception:
+            raise RuntimeError(f"Scenario '{name}' raised: {at.exception[0].message}")
+        for section, duration in run_sections.items():
+            sections_ms.setdefault(section, []).append(duration)
+        payload = payload_size(at)
+
+    return {
+        "wall_ms": {
+            "min": round(min(wall_ms), 3),
+            "median": round(statistics.median(wall_ms), 3),
+            "max": round(max(wall_ms), 3),
+        },
+        "sections_ms": {section: round(statistics.median(values), 3) for section, values in sections_ms.items()},
+        **payload,
+    }
+
+def run_benchmark(scenario_names: Optional[Sequence[str]] = None, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Run the selected scenarios (all by default) and collect a report.
+
+    Args:
+        scenario_names (Optional[Sequence[str]]): Scenarios to run
+        repeat (int): Timed runs per scenario
+
+    Returns:
+        Dict[str, Any]: Report with environment metadata and per-scenario results
+
+    Raises:
+        ValueError: If a scenario name is unknown
+    """
+    scenarios = build_scenarios()
+    names = list(scenario_names or scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        raise ValueError(f"Unknown scenarios {unknown}; choose from {list(scenarios)}")
+
+    # Benchmark submissions go to a throwaway outbox and are never emailed
+    config.CONTACT_OUTBOX_PATH = str(Path(tempfile.mkdtemp(prefix="rerun_benchmark_")) / "contact_outbox.sqlite3")
+    config.SMTP_HOST = ""
+
+    # Warm-up: imports, the asset build and the fragment cache are per process
+    AppTest.from_file(str(APP_SCRIPT), default_timeout=RUN_TIMEOUT).run()
+
+    results = {}
+    for name in names:
+        results[name] = run_scenario(name, scenarios[name], repeat)
+        print(
+            f"⏱️  {name:<28} {results[name]['wall_ms']['median']:>9.1f}ms "
+            f"{results[name]['elements']:>5} elements {results[name]['html_bytes']:>8} B HTML"
+        )
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "scenarios": results,
+    }
+
+# Comparison
+# ==========
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Tuple[str, str, float, float]]:
+    """
+    List the change of each headline figure between two reports.
+
+    Args:
+        baseline (Dict[str, Any]): Earlier report
+        current (Dict[str, Any]): New report
+
+    Returns:
+        List[Tuple[str, str, float, float]]: ``(scenario, metric, before, after)``
+        for the scenarios present in both reports
+    """
+    rows = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        rows.append((name, "wall_ms", before["wall_ms"]["median"], result["wall_ms"]["median"]))
+        for metric in ("elements", "html_bytes", "delta_bytes"):
+            rows.append((name, metric, before[metric], result[metric]))
+    return rows
+
+def print_comparison(rows: Sequence[Tuple[str, str, float, float]]) -> None:
+    """Print the output of :func:`compare_reports` as a table."""
+    print("\n📊 Change against baseline")
+    for name, metric, before, after in rows:
+        change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+        print(f"   {name:<28} {metric:<12} {before:>12,.1f} → {after:>12,.1f}  {change}")
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark app.py reruns headlessly.")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per scenario (default: 5)")
+    parser.add_argument("--scenario", action="append", help="scenario to run; repeat to run several (default: all)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="where to write the JSON report")
+    parser.add_argument("--compare", type=Path, help="earlier JSON report to compare against")
+    parser.add_argument("--list", action="store_true", help="list the scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(build_scenarios()))
+        return 0
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    # AppTest resolves static assets and .streamlit/config.toml from the working directory
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    try:
+        report = run_benchmark(args.scenario, args.repeat)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"✅ Report written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print_comparison(compare_reports(baseline, report))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1259 @@
+"""
+Portfolio Section Renderers
+===========================
+
+Pure HTML builders for the sections of the portfolio page. Every function
+here takes read-only content (records from ``content.py`` or values from
+``config.py``) and returns the markup that ``app.py`` hands to ``st.markdown``. Nothing in this module talks
+to Streamlit, which keeps the builders cheap to cache with
+``utils.fragment_cache`` and easy to reuse outside a running app.
+
+Markup is written as :class:`templates.Template` objects, compiled once at
+import. Every value a builder passes in is HTML-escaped, so text from
+``content.py`` and ``config.py`` (``MAPE <5%``, ``Dean's List``) always reaches
+the page as text; the builders return :class:`templates.Markup`.
+
+Builders that render one block per item return a tuple of HTML strings so the
+caller can keep emitting one element per item.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from content import (
+    AcademicAchievement, AcademicProject, Activity, Certification, Content, CoreValue, Counter, Course,
+    Education, Experience, IconText, Project, Skill, SkillCategory
+)
+from templates import Markup, Template, join_markup
+
+# Navigation
+# ==========
+
+NAVBAR_HTML = """
+<div class="navbar flex-between">
+    <div class="logo">
+        <h2>Portfolio</h2>
+    </div>
+    <div class="nav-links">
+        <a href="#about">Home</a>
+        <a href="#about-detailed">About</a>
+        <a href="#skills">Skills</a>
+        <a href="#projects">Projects</a>
+        <a href="#experience">Experience</a>
+        <a href="#education">Education</a>
+        <a href="#contact">Contact</a>
+    </div>
+</div>
+"""
+
+# Lazy Sections
+# =============
+
+# Shown in place of a section that has not loaded yet (rendered by app.render_lazy_section).
+# It keeps the section's anchor id, so navbar links still scroll to it, and
+# js/runtime.js loads the section once the placeholder comes into view
+LAZY_PLACEHOLDER_TEMPLATE = Template("""
+    <div class="section lazy-placeholder" id="{section_id}" data-lazy-section="{section_id}">
+        <h2 class="section-title">{title}</h2>
+        <p class="lazy-placeholder-text">Loading…</p>
+    </div>
+    """, "lazy_placeholder")
+
+# Hero Section
+# ============
+
+HERO_CONTENT_TEMPLATE = Template("""
+    <div class="hero-content">
+        <h1 class="hero-name">{name}</h1>
+        <div class="typewriter">
+            <h3 class="hero-title typewriter-text">{title}</h3>
+        </div>
+        <div class="hero-location">
+            <span>📍</span> <span>{location}</span>
+        </div>
+        <div class="hero-tagline">
+            <strong>Transforming complex data into actionable insights</strong> through innovative AI solutions and cutting-edge analytics. Specialized in building intelligent systems that drive business growth and operational excellence.
+        </div>
+
+        <div class="hero-stats">
+            <div class="stat-item">
+                <span class="stat-number">{stats[projects_completed]}</span>
+                <span class="stat-label">Projects</span>
+            </div>
+            <div class="stat-item">
+                <span class="stat-number">{stats[best_accuracy]}</span>
+                <span class="stat-label">Best Accuracy</span>
+            </div>
+            <div class="stat-item">
+                <span class="stat-number">{stats[technologies]}</span>
+                <span class="stat-label">Technologies</span>
+            </div>
+        </div>
+
+        <div class="hero-actions">
+            <a href="#contact" class="hero-cta primary">Get In Touch</a>
+            <a href="#projects" class="hero-cta secondary">View Projects</a>
+        </div>
+
+        <div class="hero-download">
+            {resume_link}
+        </div>
+
+        <div class="hero-social-links">
+            <a href="{social_links[github]}" target="_blank" class="hero-social-icon" title="GitHub">
+                <i class="fab fa-github"></i>
+            </a>
+            <a href="{social_links[linkedin]}" target="_blank" class="hero-social-icon" title="LinkedIn">
+                <i class="fab fa-linkedin-in"></i>
+            </a>
+            <a href="{social_links[email]}" class="hero-social-icon" title="Email">
+                <i class="fas fa-envelope"></i>
+            </a>
+            <a href="{social_links[phone]}" class="hero-social-icon" title="Phone">
+                <i class="fas fa-phone"></i>
+            </a>
+        </div>
+    </div>
+    """, "hero_content")
+
+def hero_content_html(
+    name: str,
+    title: str,
+    location: str,
+    stats: Dict[str, str],
+    social_links: Dict[str, str],
+    resume_link: str
+) -> str:
+    """
+    Build the left-hand hero column.
+
+    Args:
+        name (str): Display name
+        title (str): Professional title shown with the typewriter effect
+        location (str): Location line
+        stats (Dict[str, str]): Quick stats from ``config.STATS``
+        social_links (Dict[str, str]): Links from ``config.SOCIAL_LINKS``
+        resume_link (str): Resume download anchor from :func:`resume_link_html`
+            (inserted as-is), or plain text
+
+    Returns:
+        str: Hero content HTML
+    """
+    return HERO_CONTENT_TEMPLATE.render(
+        name=name, title=title, location=location, stats=stats, social_links=social_links, resume_link=resume_link
+    )
+
+RESUME_LINK_TEMPLATE = Template('<a href="{url}" download="{file_name}" class="btn">{link_text}</a>', "resume_link")
+
+def resume_link_html(url: str, file_name: str, link_text: str) -> str:
+    """
+    Build the resume download anchor shown in the hero column.
+
+    Args:
+        url (str): URL of the published PDF
+        file_name (str): File name suggested to the browser
+        link_text (str): Link label
+
+    Returns:
+        str: Anchor HTML
+    """
+    return RESUME_LINK_TEMPLATE.render(url=url, file_name=file_name, link_text=link_text)
+
+# MIME types of the formats produced by utils.build_image_derivatives
+_IMAGE_MIME_TYPES = {'AVIF': 'image/avif', 'WEBP': 'image/webp', 'JPEG': 'image/jpeg'}
+
+PICTURE_SOURCE_TEMPLATE = Template('<source type="{type}" srcset="{srcset}" sizes="{sizes}">', "picture_source")
+
+PROFILE_PICTURE_TEMPLATE = Template("""
+    <div class="profile-wrapper">
+        <div class="profile-image-container">
+            <picture>
+                {sources}
+                <img class="profile-image" src="{image[url]}" srcset="{srcset}" sizes="{sizes}" width="{image[width]}" height="{image[height]}" alt="{alt}" decoding="async" fetchpriority="high">
+            </picture>
+        </div>
+    </div>
+    """, "profile_picture")
+
+def profile_picture_html(image: Dict[str, Any], alt: str, sizes: str = "320px") -> str:
+    """
+    Build the profile photo as a responsive ``<picture>``.
+
+    Args:
+        image (Dict[str, Any]): Manifest from ``assets.publish_image``
+        alt (str): Alternative text
+        sizes (str): ``sizes`` attribute for the rendered width
+
+    Returns:
+        str: Profile wrapper HTML with one ``<source>`` per modern format
+    """
+    formats = image['formats']
+    fallback_format = 'JPEG' if 'JPEG' in formats else next(iter(formats))
+    fallback = formats[fallback_format]
+    srcset = {
+        fmt: ", ".join(f"{variant['url']} {variant['width']}w" for variant in variants)
+        for fmt, variants in formats.items()
+    }
+    sources = join_markup(
+        PICTURE_SOURCE_TEMPLATE.render(type=_IMAGE_MIME_TYPES[fmt], srcset=srcset[fmt], sizes=sizes)
+        for fmt in formats if fmt != fallback_format
+    )
+
+    return PROFILE_PICTURE_TEMPLATE.render(
+        sources=sources, image=fallback[0], srcset=srcset[fallback_format], sizes=sizes, alt=alt
+    )
+
+PROFILE_WRAPPER_OPEN_HTML = """
+<div class="profile-wrapper">
+    <div class="profile-image-container">
+        <div class="image-loader" id="imageLoader">
+            <div class="loader-spinner"></div>
+            <p>Loading...</p>
+        </div>
+"""
+
+PROFILE_IMAGE_ERROR_HTML = """
+<div class="image-error-state">
+    <i class="fas fa-user-circle" style="font-size:4rem;color:#64748b;"></i>
+    <p style="color:#64748b;margin-top:10px;">Profile Image Unavailable</p>
+    <p style="color:#94a3b8;font-size:0.9rem;">Please check the image file</p>
+</div>
+"""
+
+PROFILE_WRAPPER_CLOSE_HTML = """
+    </div>
+</div>
+"""
+
+SCROLL_INDICATOR_HTML = """
+<div class="scroll-indicator">
+    <span>Scroll to explore</span>
+</div>
+"""
+
+# About Section
+# =============
+
+ABOUT_HERO_HTML = """
+<div class="about-hero fade-in-up">
+    <h2 class="section-title">About Me</h2>
+    <p class="about-intro">Welcome to my digital portfolio! I'm a passionate data scientist and Python developer with a mission to transform complex data into actionable insights that drive business success.</p>
+</div>
+"""
+
+ABOUT_TEXT_HTML = """
+<div class="about-text fade-in-left">
+    <p>With over a year of hands-on experience in data science and analytics, I've developed a deep passion for uncovering hidden patterns in data and building intelligent solutions that solve real-world problems. My journey began during my Bachelor's in Information Technology at Parul University, where I achieved an 8.73/10.0 GPA while specializing in machine learning and computer vision.</p>
+
+    <p>Throughout my career, I've worked on diverse projects ranging from sales forecasting using time series analysis to building facial recognition systems with 95% accuracy. My expertise spans across Python programming, machine learning algorithms, data visualization, and web development using modern frameworks like Streamlit and Flask.</p>
+
+    <p>Currently working as a Data Research Trainee at TRANSFORM Solutions, I focus on conducting comprehensive web research, data collection, and analysis using advanced tools like Excel and SQL. I'm also expanding my skill set in cloud technologies and advanced AI applications to stay at the forefront of technological innovation.</p>
+
+    <p>When I'm not coding or analyzing data, you'll find me exploring the latest tech trends, contributing to open-source projects, or enjoying a good cup of coffee while brainstorming the next big idea. I believe in continuous learning and am always excited to take on new challenges that push the boundaries of what's possible with data.</p>
+</div>
+"""
+
+MISSION_HTML = """
+<div class="mission-statement fade-in-up">
+    <h3>My Mission</h3>
+    <p class="mission-text">To leverage the power of data science and artificial intelligence to create innovative solutions that not only solve complex business problems but also contribute to making the world a more efficient and connected place.</p>
+</div>
+"""
+
+EXPERIENCE_COUNTER_HTML = """
+<div class="experience-counter fade-in-right">
+    <div class="counter-number" data-target="1">1+</div>
+    <div class="counter-label">Years Experience</div>
+</div>
+"""
+
+ACHIEVEMENT_BADGE_TEMPLATE = Template("""
+    <div class="achievement-badge">
+        <div class="achievement-icon"><i class="{achievement.icon}"></i></div>
+        <span>{achievement.text}</span>
+    </div>
+    """, "achievement_badge")
+
+def achievement_badges_html(achievements: Sequence[IconText]) -> Tuple[str, ...]:
+    """Build one badge per entry of the "Key Achievements" list."""
+    return ACHIEVEMENT_BADGE_TEMPLATE.render_each("achievement", achievements)
+
+FUN_FACT_TEMPLATE = Template("""
+    <div class="fun-fact">
+        <span class="fun-fact-icon">{fact.icon}</span>
+        <span class="fun-fact-text">{fact.text}</span>
+    </div>
+    """, "fun_fact")
+
+def fun_facts_html(fun_facts: Sequence[IconText]) -> Tuple[str, ...]:
+    """Build one block per entry of the "Fun Facts" list."""
+    return FUN_FACT_TEMPLATE.render_each("fact", fun_facts)
+
+ANIMATED_STAT_TEMPLATE = Template("""
+    <div class="stat-item-about">
+        <div class="stat-number-animated" style="--target: {stat.value};">{stat.value}</div>
+        <div class="stat-label">{stat.label}</div>
+    </div>
+    """, "animated_stat")
+
+def animated_stats_html(stats_data: Sequence[Counter]) -> Tuple[str, ...]:
+    """Build the animated counters shown under the about text."""
+    return ANIMATED_STAT_TEMPLATE.render_each("stat", stats_data)
+
+VALUE_CARD_TEMPLATE = Template("""
+    <div class="value-card">
+        <div class="value-icon">
+            <i class="{value.icon}"></i>
+        </div>
+        <h4 class="value-title">{value.title}</h4>
+        <p class="value-description">{value.description}</p>
+    </div>
+    """, "value_card")
+
+def value_cards_html(values: Sequence[CoreValue]) -> Tuple[str, ...]:
+    """Build one card per core value."""
+    return VALUE_CARD_TEMPLATE.render_each("value", values)
+
+SKILL_TAG_TEMPLATE = Template('<span class="skill-tag">{tag}</span>', "skill_tag")
+TECH_TAG_TEMPLATE = Template('<span class="tech-tag">{tag}</span>', "tech_tag")
+IMPACT_TAG_TEMPLATE = Template('<span class="impact-tag">{tag}</span>', "impact_tag")
+
+def _tags_html(template: Template, tags: Sequence[str]) -> Markup:
+    """Render one tag per entry, separated by spaces."""
+    return template.render_joined("tag", tags, " ")
+
+INTERESTS_TEMPLATE = Template("""
+    <p>Beyond my professional work, I'm passionate about:</p>
+    <div style="display: flex; flex-wrap: wrap; gap: 10px; margin-top: 15px;">
+        {tags}
+    </div>
+    """, "interests")
+
+def interests_html(interests: Sequence[str]) -> str:
+    """Build the tag cloud inside the "Interests & Hobbies" expander."""
+    return INTERESTS_TEMPLATE.render(tags=_tags_html(SKILL_TAG_TEMPLATE, interests))
+
+CERTIFICATION_TEMPLATE = Template("""
+    <div class="achievement-badge">
+        <div class="achievement-icon"><i class="{cert.icon}"></i></div>
+        <div>
+            <strong>{cert.name}</strong><br>
+            <small>{cert.issuer} • {cert.year}</small>
+        </div>
+    </div>
+    """, "certification")
+
+def certifications_html(certifications: Sequence[Certification]) -> Tuple[str, ...]:
+    """Build one badge per certification."""
+    return CERTIFICATION_TEMPLATE.render_each("cert", certifications)
+
+PHILOSOPHY_HTML = """
+<div class="expandable-content">
+    <p>I believe that technology should serve humanity, not the other way around. My approach to data science and development is grounded in these principles:</p>
+    <ul>
+        <li><strong>Ethical AI:</strong> Ensuring that AI systems are fair, transparent, and beneficial to society</li>
+        <li><strong>Data Privacy:</strong> Respecting user privacy and implementing robust security measures</li>
+        <li><strong>Continuous Learning:</strong> Staying updated with the latest technologies and best practices</li>
+        <li><strong>Collaborative Innovation:</strong> Working with diverse teams to create impactful solutions</li>
+        <li><strong>Problem-Solving:</strong> Focusing on real-world applications that make a difference</li>
+    </ul>
+</div>
+"""
+
+QUICK_STAT_TEMPLATE = Template("""
+    <div class="stat-card card">
+        <div class="stat-number">{value}</div>
+        <div class="stat-label">{label}</div>
+    </div>
+    """, "quick_stat")
+
+def quick_stats_html(stats: Dict[str, str]) -> Tuple[str, ...]:
+    """Build the four "Quick Stats" cards from ``config.STATS``."""
+    cards = [
+        (stats['projects_completed'], "Projects"),
+        (stats['years_experience'], "Years Experience"),
+        (stats['technologies'], "Technologies"),
+        (stats['best_accuracy'], "Best Model Accuracy"),
+    ]
+    return tuple(QUICK_STAT_TEMPLATE.render(value=value, label=label) for value, label in cards)
+
+# Skills Section
+# ==============
+
+SKILLS_HEADER_HTML = """
+<div class="skills-header">
+    <h2 class="section-title">Skills & Technologies</h2>
+    <p class="skills-intro">
+        A comprehensive overview of my technical skills, tools, and technologies I work with.
+        Each skill represents hands-on experience gained through projects, professional work, and continuous learning.
+    </p>
+</div>
+"""
+
+def _category_class(category: str) -> str:
+    """Turn a skill category name into its CSS modifier class."""
+    return category.lower().replace(' ', '').replace('/', '')
+
+SKILL_CATEGORY_SUMMARY_TEMPLATE = Template("""
+    <div class="category-summary {category_class}">
+        <div class="category-title">
+            <i class="{category.icon} category-icon"></i>
+            {category.name}
+        </div>
+        <p class="category-description">{category.description}</p>
+        <div class="category-stats">
+            <div class="category-stat">
+                <div class="category-stat-number">{skill_count}</div>
+                <div class="category-stat-label">Technologies</div>
+            </div>
+            <div class="category-stat">
+                <div class="category-stat-number">{advanced_count}</div>
+                <div class="category-stat-label">Advanced+</div>
+            </div>
+        </div>
+    </div>
+    """, "skill_category_summary")
+
+def skill_category_summary_html(category: SkillCategory) -> str:
+    """
+    Build the summary banner shown above a category's skill cards.
+
+    Args:
+        category (SkillCategory): Category with its (filtered) skills
+
+    Returns:
+        str: Category summary HTML
+    """
+    return SKILL_CATEGORY_SUMMARY_TEMPLATE.render(
+        category=category,
+        category_class=_category_class(category.name),
+        skill_count=len(category.skills),
+        advanced_count=sum(1 for skill in category.skills if skill.badge in ['Expert', 'Advanced'])
+    )
+
+SKILL_CARD_TEMPLATE = Template("""
+    <div class="skill-card {category_class} animate-in">
+        <div class="skill-header">
+            <i class="{skill.icon} skill-icon"></i>
+            <div>
+                <h3 class="skill-name">{skill.name}</h3>
+                <div class="skill-category">{category}</div>
+            </div>
+        </div>
+
+        <div class="skill-content">
+            <p class="skill-description">{skill.description}</p>
+
+            <div class="proficiency-container">
+                <div class="proficiency-label">
+                    <span>Proficiency</span>
+                    <span>{skill.badge}</span>
+                </div>
+                <div class="proficiency-bar">
+                    <div class="proficiency-fill" style="width: {skill.proficiency}%"></div>
+                </div>
+            </div>
+
+            <div class="skill-badge">
+                <i class="fas fa-star"></i>
+                {skill.badge}
+            </div>
+        </div>
+
+        <div class="skill-footer">
+            <div class="skill-experience">
+                <i class="fas fa-clock"></i>
+                {skill.experience}
+            </div>
+            <div class="skill-projects">
+                {skill.projects}
+            </div>
+        </div>
+    </div>
+    """, "skill_card")
+
+def skill_card_html(category: str, skill: Skill) -> str:
+    """
+    Build a single skill card.
+
+    Args:
+        category (str): Category the skill belongs to
+        skill (Skill): Skill record
+
+    Returns:
+        str: Skill card HTML
+    """
+    return SKILL_CARD_TEMPLATE.render(category=category, category_class=_category_class(category), skill=skill)
+
+SKILLS_SUMMARY_STAT_TEMPLATE = Template("""
+    <div class="stat-item-about">
+        <div class="stat-number-animated">{value}</div>
+        <div class="stat-label">{label}</div>
+    </div>
+    """, "skills_summary_stat")
+
+def skills_summary_html(categories: Sequence[SkillCategory]) -> Tuple[str, ...]:
+    """Build the four "Overall Proficiency Summary" counters."""
+    all_skills = [skill for category in categories for skill in category.skills]
+
+    expert_count = sum(1 for skill in all_skills if skill.badge == 'Expert')
+    advanced_count = sum(1 for skill in all_skills if skill.badge == 'Advanced')
+
+    counters = [
+        (len(all_skills), "Total Skills"),
+        (expert_count, "Expert Level"),
+        (advanced_count, "Advanced Level"),
+        (len(categories), "Categories"),
+    ]
+    return tuple(SKILLS_SUMMARY_STAT_TEMPLATE.render(value=value, label=label) for value, label in counters)
+
+# Projects Section
+# ================
+
+LIST_ITEM_TEMPLATE = Template('<li>{item}</li>', "list_item")
+DEMO_LINK_TEMPLATE = Template('<a href="{url}" target="_blank" class="btn btn-outline">Live Demo</a>', "demo_link")
+
+PROJECT_CARD_TEMPLATE = Template("""
+    <div class="card project-card">
+        <h3>{project.title}</h3>
+        <p>{project.description}</p>
+
+        <div class="project-tech">
+            {technologies}
+        </div>
+
+        <h4>Key Features</h4>
+        <ul>
+            {features}
+        </ul>
+
+        <div class="project-links">
+            <a href="{project.github}" target="_blank" class="btn">View on GitHub</a>
+            {demo_link}
+        </div>
+    </div>
+    """, "project_card")
+
+def project_card_html(project: Project) -> str:
+    """
+    Build a project card.
+
+    Args:
+        project (Project): Project record
+
+    Returns:
+        str: Project card HTML
+    """
+    return PROJECT_CARD_TEMPLATE.render(
+        project=project,
+        technologies=_tags_html(SKILL_TAG_TEMPLATE, project.technologies),
+        features=LIST_ITEM_TEMPLATE.render_joined("item", project.features, " "),
+        demo_link=DEMO_LINK_TEMPLATE.render(url=project.demo) if project.demo else ""
+    )
+
+# Experience Section
+# ==================
+
+EXPERIENCE_HEADER_HTML = """
+<div class="experience-header">
+    <h2 class="section-title">Professional Experience</h2>
+    <p class="experience-intro">
+        My professional journey showcasing roles, achievements, and the technologies I've worked with.
+        Each position has contributed to my growth as a data scientist and developer.
+    </p>
+</div>
+"""
+
+CURRENT_BADGE_HTML = Markup('<span class="current-badge">Current</span>')
+
+EXPERIENCE_ITEM_TEMPLATE = Template("""
+    <div class="timeline-item {timeline_class} fade-in-up">
+        <div class="timeline-marker">
+            <div class="timeline-dot" style="background-color: {exp.company_color};">
+                <i class="{exp.company_logo}" style="color: white;"></i>
+            </div>
+            <div class="timeline-line"></div>
+        </div>
+
+        <div class="timeline-content">
+            <div class="experience-card">
+                <div class="experience-header">
+                    <div class="experience-title-section">
+                        <h3 class="experience-title">{exp.title}</h3>
+                        <div class="experience-company">
+                            <a href="{exp.website}" target="_blank" class="company-link">
+                                <i class="{exp.company_logo} company-icon" style="color: {exp.company_color};"></i>
+                                {exp.company}
+                            </a>
+                            {current_badge}
+                        </div>
+                    </div>
+
+                    <div class="experience-meta">
+                        <div class="experience-duration">
+                            <i class="fas fa-calendar-alt"></i>
+                            {exp.duration}
+                        </div>
+                        <div class="experience-location">
+                            <i class="fas fa-map-marker-alt"></i>
+                            {exp.location}
+                        </div>
+                        <div class="experience-type">
+                            <i class="fas fa-briefcase"></i>
+                            {exp.employment_type}
+                        </div>
+                    </div>
+                </div>
+
+                <div class="experience-description">
+                    <p>{exp.description}</p>
+                </div>
+
+                <div class="experience-technologies">
+                    <h4><i class="fas fa-tools"></i> Technologies Used</h4>
+                    <div class="tech-tags">
+                        {technologies}
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, "experience_item")
+
+def experience_item_html(exp: Experience) -> str:
+    """
+    Build a timeline entry for one position.
+
+    Args:
+        exp (Experience): Position record
+
+    Returns:
+        str: Timeline item HTML
+    """
+    is_current = exp.current
+    timeline_class = "current" if is_current else "past"
+
+    return EXPERIENCE_ITEM_TEMPLATE.render(
+        exp=exp,
+        timeline_class=timeline_class,
+        current_badge=CURRENT_BADGE_HTML if is_current else "",
+        technologies=_tags_html(TECH_TAG_TEMPLATE, exp.technologies)
+    )
+
+ACHIEVEMENT_ITEM_TEMPLATE = Template('<li><i class="fas fa-check-circle"></i> {achievement}</li>', "achievement_item")
+
+METRIC_ITEM_TEMPLATE = Template("""
+                    <div class="metric-item">
+                        <div class="metric-value">{metric.value}</div>
+                        <div class="metric-label">{metric.metric}</div>
+                        <div class="metric-description">{metric.description}</div>
+                    </div>
+                    """, "metric_item")
+
+EXPERIENCE_ACHIEVEMENTS_TEMPLATE = Template("""
+    <div class="achievements-content">
+        <div class="achievements-grid">
+            <div class="achievements-list">
+                <h4>🏆 Major Accomplishments</h4>
+                <ul class="achievement-items">
+                    {achievements}
+                </ul>
+            </div>
+
+            <div class="metrics-section">
+                <h4>📊 Key Metrics</h4>
+                <div class="metrics-grid">
+                    {metrics}
+                </div>
+            </div>
+        </div>
+
+        <div class="experience-impact">
+            <h4>🎯 Impact & Learning</h4>
+            <p>This role significantly contributed to my development in:</p>
+            <div class="impact-areas">
+                {impact_tags}
+            </div>
+        </div>
+    </div>
+    """, "experience_achievements")
+
+def experience_achievements_html(exp: Experience) -> str:
+    """Build the contents of a position's "Key Achievements" expander."""
+    return EXPERIENCE_ACHIEVEMENTS_TEMPLATE.render(
+        achievements=ACHIEVEMENT_ITEM_TEMPLATE.render_joined("achievement", exp.achievements, " "),
+        metrics=METRIC_ITEM_TEMPLATE.render_joined("metric", exp.key_metrics, " "),
+        impact_tags=_tags_html(IMPACT_TAG_TEMPLATE, exp.technologies[:3])
+    )
+
+SUMMARY_STAT_TEMPLATE = Template("""
+    <div class="summary-stat">
+        <div class="summary-number">{value}</div>
+        <div class="summary-label">{label}</div>
+    </div>
+    """, "summary_stat")
+
+def summary_stats_html(counters: List[Tuple[Any, str]]) -> Tuple[str, ...]:
+    """Build ``summary-stat`` counters from ``(value, label)`` pairs."""
+    return tuple(SUMMARY_STAT_TEMPLATE.render(value=value, label=label) for value, label in counters)
+
+def experience_summary_html(experience_data: Sequence[Experience]) -> Tuple[str, ...]:
+    """Build the four counters under the experience timeline."""
+    all_technologies = set()
+    for exp in experience_data:
+        all_technologies.update(exp.technologies)
+
+    return summary_stats_html([
+        (len(experience_data), "Total Positions"),
+        (len([exp for exp in experience_data if exp.current]), "Current Role"),
+        (len(all_technologies), "Technologies Used"),
+        ("1+", "Years Experience"),
+    ])
+
+# Education Section
+# =================
+
+EDUCATION_HEADER_HTML = """
+<div class="education-header">
+    <h2 class="section-title">Education & Academic Background</h2>
+    <p class="education-intro">
+        My academic journey and educational achievements that provided the foundation for my
+        career in technology and data science.
+    </p>
+</div>
+"""
+
+EDUCATION_CARD_TEMPLATE = Template("""
+    <div class="education-card fade-in-up">
+        <div class="education-header-card">
+            <div class="education-institution">
+                <div class="institution-logo" style="background-color: {edu.institution_color};">
+                    <i class="{edu.institution_logo}"></i>
+                </div>
+                <div class="institution-details">
+                    <h3 class="institution-name">
+                        <a href="{edu.institution_website}" target="_blank" class="institution-link">
+                            {edu.institution}
+                        </a>
+                    </h3>
+                    <p class="institution-location">
+                        <i class="fas fa-map-marker-alt"></i>
+                        {edu.location}
+                    </p>
+                </div>
+            </div>
+
+            <div class="education-status">
+                <span class="status-badge graduated">{edu.status}</span>
+            </div>
+        </div>
+
+        <div class="education-content">
+            <div class="degree-info">
+                <h2 class="degree-title">{edu.degree}</h2>
+                <p class="degree-major">Major: {edu.major}</p>
+
+                <div class="education-meta">
+                    <div class="meta-item">
+                        <i class="fas fa-calendar-alt"></i>
+                        <span>{edu.year}</span>
+                    </div>
+                    <div class="meta-item">
+                        <i class="fas fa-clock"></i>
+                        <span>{edu.duration}</span>
+                    </div>
+                    <div class="meta-item gpa-highlight">
+                        <i class="fas fa-chart-line"></i>
+                        <span>GPA: {edu.gpa}/{edu.gpa_scale}</span>
+                    </div>
+                </div>
+            </div>
+
+            <div class="thesis-section">
+                <h4><i class="fas fa-graduation-cap"></i> Thesis Project</h4>
+                <p class="thesis-title">{edu.thesis}</p>
+                <p class="thesis-description">
+                    Final year capstone project demonstrating practical application of computer vision
+                    and machine learning techniques for real-world problem solving.
+                </p>
+            </div>
+        </div>
+    </div>
+    """, "education_card")
+
+def education_card_html(edu: Education) -> str:
+    """
+    Build the main card for one degree.
+
+    Args:
+        edu (Education): Degree record
+
+    Returns:
+        str: Education card HTML
+    """
+    return EDUCATION_CARD_TEMPLATE.render(edu=edu)
+
+COURSEWORK_OPEN_HTML = """
+<div class="coursework-content">
+    <h4>Core Courses & Academic Performance</h4>
+    <div class="coursework-grid">
+"""
+
+def _grade_class(grade: str) -> str:
+    """Turn a grade such as ``A+`` into its CSS class suffix."""
+    return grade.lower().replace('+', 'plus')
+
+COURSE_CARD_TEMPLATE = Template("""
+    <div class="course-card">
+        <div class="course-header">
+            <h5 class="course-name">{course.name}</h5>
+            <div class="course-grade grade-{grade_class}">{course.grade}</div>
+        </div>
+        <div class="course-code">{course.code} • {course.credits} Credits</div>
+        <p class="course-description">{course.description}</p>
+    </div>
+    """, "course_card")
+
+def course_cards_html(coursework: Sequence[Course]) -> Tuple[str, ...]:
+    """Build one card per course."""
+    return tuple(
+        COURSE_CARD_TEMPLATE.render(course=course, grade_class=_grade_class(course.grade))
+        for course in coursework
+    )
+
+COURSE_STAT_TEMPLATE = Template("""
+    <div class="course-stat">
+        <div class="stat-value">{value}</div>
+        <div class="stat-label">{label}</div>
+    </div>
+    """, "course_stat")
+
+def course_stats_html(coursework: Sequence[Course]) -> Tuple[str, ...]:
+    """Build the three counters under the coursework grid."""
+    total_credits = sum(course.credits for course in coursework)
+    a_plus_courses = sum(1 for course in coursework if course.grade == 'A+')
+
+    counters = [
+        (len(coursework), "Core Courses"),
+        (total_credits, "Total Credits"),
+        (a_plus_courses, "A+ Grades"),
+    ]
+    return tuple(COURSE_STAT_TEMPLATE.render(value=value, label=label) for value, label in counters)
+
+ACADEMIC_PROJECTS_OPEN_HTML = """
+<div class="projects-content">
+    <h4>Major Academic Projects</h4>
+"""
+
+ACADEMIC_PROJECT_CARD_TEMPLATE = Template("""
+    <div class="academic-project-card">
+        <div class="project-header">
+            <h5 class="project-title">{project.title}</h5>
+            <div class="project-grade grade-{grade_class}">{project.grade}</div>
+        </div>
+        <div class="project-year">Academic Year: {project.year}</div>
+        <p class="project-description">{project.description}</p>
+        <div class="project-technologies">
+            <strong>Technologies:</strong>
+            <div class="tech-tags">
+                {technologies}
+            </div>
+        </div>
+    </div>
+    """, "academic_project_card")
+
+def academic_project_cards_html(projects: Sequence[AcademicProject]) -> Tuple[str, ...]:
+    """Build one card per academic project."""
+    return tuple(
+        ACADEMIC_PROJECT_CARD_TEMPLATE.render(
+            project=project,
+            grade_class=_grade_class(project.grade),
+            technologies=_tags_html(TECH_TAG_TEMPLATE, project.technologies)
+        )
+        for project in projects
+    )
+
+ACADEMIC_ACHIEVEMENTS_OPEN_HTML = """
+<div class="achievements-content">
+    <div class="achievements-section">
+        <h4>Academic Achievements</h4>
+        <div class="achievements-grid">
+"""
+
+ACADEMIC_ACHIEVEMENT_CARD_TEMPLATE = Template("""
+    <div class="achievement-card">
+        <div class="achievement-icon">
+            <i class="{achievement.icon}"></i>
+        </div>
+        <div class="achievement-details">
+            <h5 class="achievement-title">{achievement.title}</h5>
+            <p class="achievement-description">{achievement.description}</p>
+            <div class="achievement-year">{achievement.year}</div>
+        </div>
+    </div>
+    """, "academic_achievement_card")
+
+def academic_achievement_cards_html(achievements: Sequence[AcademicAchievement]) -> Tuple[str, ...]:
+    """Build one card per academic achievement."""
+    return ACADEMIC_ACHIEVEMENT_CARD_TEMPLATE.render_each("achievement", achievements)
+
+EXTRACURRICULAR_OPEN_HTML = """
+        </div>
+    </div>
+
+    <div class="extracurricular-section">
+        <h4>Extracurricular Activities</h4>
+        <div class="activities-grid">
+"""
+
+ACTIVITY_CARD_TEMPLATE = Template("""
+    <div class="activity-card">
+        <div class="activity-icon">
+            <i class="{activity.icon}"></i>
+        </div>
+        <div class="activity-details">
+            <h5 class="activity-title">{activity.activity}</h5>
+            <p class="activity-description">{activity.description}</p>
+            <div class="activity-year">{activity.year}</div>
+        </div>
+    </div>
+    """, "activity_card")
+
+def activity_cards_html(activities: Sequence[Activity]) -> Tuple[str, ...]:
+    """Build one card per extracurricular activity."""
+    return ACTIVITY_CARD_TEMPLATE.render_each("activity", activities)
+
+def education_summary_html(education_data: Sequence[Education]) -> Tuple[str, ...]:
+    """Build the four counters under the education cards."""
+    return summary_stats_html([
+        (len(education_data), "Degree Earned"),
+        (sum(len(edu.coursework) for edu in education_data), "Courses Completed"),
+        (sum(len(edu.academic_projects) for edu in education_data), "Academic Projects"),
+        (sum(len(edu.achievements) for edu in education_data), "Achievements"),
+    ])
+
+def _level_class(level: str) -> str:
+    """Turn a language level such as ``Native or Bilingual`` into its CSS class."""
+    return level.lower().replace(' ', '-')
+
+LANGUAGE_CARD_TEMPLATE = Template("""
+    <div class="language-card">
+        <div class="language-name">{lang}</div>
+        <div class="language-level">{level}</div>
+        <div class="language-progress">
+            <div class="progress-bar {level_class}"></div>
+        </div>
+    </div>
+    """, "language_card")
+
+def language_cards_html(languages: Dict[str, str]) -> Tuple[str, ...]:
+    """Build one card per spoken language from ``config.LANGUAGES``."""
+    return tuple(
+        LANGUAGE_CARD_TEMPLATE.render(lang=lang, level=level, level_class=_level_class(level))
+        for lang, level in languages.items()
+    )
+
+# Contact Section
+# ===============
+
+CONTACT_HEADER_HTML = """
+<div class="contact-header">
+    <h2 class="section-title">Let's Work Together</h2>
+    <p class="contact-intro">
+        Ready to bring your next project to life? I'm always excited to discuss new opportunities,
+        collaborate on innovative solutions, or simply connect with fellow technology enthusiasts.
+    </p>
+</div>
+"""
+
+AVAILABILITY_HTML = """
+<div class="availability-status">
+    <div class="status-indicator available">
+        <div class="status-dot"></div>
+        <span class="status-text">Available for new projects</span>
+    </div>
+    <div class="timezone-info">
+        <i class="fas fa-clock"></i>
+        <span>India Standard Time (IST) • Typically respond within 24 hours</span>
+    </div>
+</div>
+"""
+
+CONTACT_FORM_INTRO_HTML = """
+<div class="contact-form-container">
+    <h3><i class="fas fa-paper-plane"></i> Send me a message</h3>
+    <p class="form-description">
+        Whether you have a project in mind, want to discuss collaboration opportunities,
+        or just want to say hello, I'd love to hear from you!
+    </p>
+</div>
+"""
+
+ALTERNATIVE_CONTACT_HTML = """
+<div class="alternative-contact">
+    <p><i class="fas fa-info-circle"></i>
+    Prefer a different method? You can also reach me directly via email or phone using the contact information on the right.</p>
+</div>
+"""
+
+CONTACT_INFO_TEMPLATE = Template("""
+    <div class="contact-info-card">
+        <h3><i class="fas fa-address-card"></i> Contact Information</h3>
+
+        <div class="contact-methods">
+            <div class="contact-method">
+                <div class="contact-icon email">
+                    <i class="fas fa-envelope"></i>
+                </div>
+                <div class="contact-details">
+                    <h4>Email</h4>
+                    <a href="mailto:{email}" class="contact-link">{email}</a>
+                    <p class="contact-note">Best for detailed discussions</p>
+                </div>
+            </div>
+
+            <div class="contact-method">
+                <div class="contact-icon phone">
+                    <i class="fas fa-phone"></i>
+                </div>
+                <div class="contact-details">
+                    <h4>Phone</h4>
+                    <a href="tel:{phone}" class="contact-link">{phone}</a>
+                    <p class="contact-note">Available 9 AM - 6 PM IST</p>
+                </div>
+            </div>
+
+            <div class="contact-method">
+                <div class="contact-icon location">
+                    <i class="fas fa-map-marker-alt"></i>
+                </div>
+                <div class="contact-details">
+                    <h4>Location</h4>
+                    <span class="contact-text">{location}</span>
+                    <p class="contact-note">Open to remote work globally</p>
+                </div>
+            </div>
+        </div>
+
+        <div class="response-expectations">
+            <h4><i class="fas fa-clock"></i> Response Time</h4>
+            <div class="response-times">
+                <div class="response-item">
+                    <span class="response-method">Email/Form:</span>
+                    <span class="response-time">Within 24 hours</span>
+                </div>
+                <div class="response-item">
+                    <span class="response-method">Phone/WhatsApp:</span>
+                    <span class="response-time">Within 4 hours</span>
+                </div>
+                <div class="response-item">
+                    <span class="response-method">LinkedIn:</span>
+                    <span class="response-time">Within 48 hours</span>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, "contact_info")
+
+def contact_info_html(email: str, phone: str, location: str) -> str:
+    """
+    Build the "Contact Information" card.
+
+    Args:
+        email (str): Contact email address
+        phone (str): Contact phone number
+        location (str): Location line
+
+    Returns:
+        str: Contact information HTML
+    """
+    return CONTACT_INFO_TEMPLATE.render(email=email, phone=phone, location=location)
+
+SOCIAL_MEDIA_TEMPLATE = Template("""
+    <div class="social-media-card">
+        <h3><i class="fas fa-share-alt"></i> Connect on Social Media</h3>
+        <div class="social-links-grid">
+            <a href="{social_links[github]}" target="_blank" class="social-link github" title="GitHub">
+                <i class="fab fa-github"></i>
+                <span>GitHub</span>
+                <small>View my code</small>
+            </a>
+
+            <a href="{social_links[linkedin]}" target="_blank" class="social-link linkedin" title="LinkedIn">
+                <i class="fab fa-linkedin-in"></i>
+                <span>LinkedIn</span>
+                <small>Professional network</small>
+            </a>
+
+            <a href="mailto:{email}" class="social-link email" title="Email">
+                <i class="fas fa-envelope"></i>
+                <span>Email</span>
+                <small>Direct contact</small>
+            </a>
+
+            <a href="tel:{phone}" class="social-link phone" title="Phone">
+                <i class="fas fa-phone"></i>
+                <span>Call</span>
+                <small>Voice chat</small>
+            </a>
+        </div>
+    </div>
+    """, "social_media")
+
+def social_media_html(social_links: Dict[str, str], email: str, phone: str) -> str:
+    """Build the "Connect on Social Media" card."""
+    return SOCIAL_MEDIA_TEMPLATE.render(social_links=social_links, email=email, phone=phone)
+
+COLLABORATION_HTML = """
+<div class="collaboration-cta">
+    <h4><i class="fas fa-handshake"></i> Let's Collaborate!</h4>
+    <p>I'm always interested in:</p>
+    <ul class="collaboration-list">
+        <li><i class="fas fa-chart-line"></i> Data Science & Analytics Projects</li>
+        <li><i class="fas fa-robot"></i> Machine Learning Applications</li>
+        <li><i class="fas fa-globe"></i> Web Development & Automation</li>
+        <li><i class="fas fa-graduation-cap"></i> Research & Academic Collaboration</li>
+        <li><i class="fas fa-users"></i> Open Source Contributions</li>
+    </ul>
+</div>
+"""
+
+# Footer
+# ======
+
+FOOTER_TEMPLATE = Template("""
+    <footer class="main-footer">
+        <div class="footer-content">
+            <div class="footer-section">
+                <div class="footer-brand">
+                    <h3>{name}</h3>
+                    <p>Data Scientist & Python Developer</p>
+                    <p class="footer-tagline">Transforming data into actionable insights</p>
+                </div>
+            </div>
+
+            <div class="footer-section">
+                <h4>Quick Links</h4>
+                <nav class="footer-nav">
+                    <a href="#about" class="footer-link">Home</a>
+                    <a href="#about-detailed" class="footer-link">About</a>
+                    <a href="#skills" class="footer-link">Skills</a>
+                    <a href="#projects" class="footer-link">Projects</a>
+                    <a href="#experience" class="footer-link">Experience</a>
+                    <a href="#education" class="footer-link">Education</a>
+                    <a href="#contact" class="footer-link">Contact</a>
+                </nav>
+            </div>
+
+            <div class="footer-section">
+                <h4>Connect</h4>
+                <div class="footer-social">
+                    <a href="{social_links[github]}" target="_blank" class="footer-social-link" title="GitHub">
+                        <i class="fab fa-github"></i>
+                    </a>
+                    <a href="{social_links[linkedin]}" target="_blank" class="footer-social-link" title="LinkedIn">
+                        <i class="fab fa-linkedin-in"></i>
+                    </a>
+                    <a href="mailto:{email}" class="footer-social-link" title="Email">
+                        <i class="fas fa-envelope"></i>
+                    </a>
+                    <a href="tel:{phone}" class="footer-social-link" title="Phone">
+                        <i class="fas fa-phone"></i>
+                    </a>
+                </div>
+                <div class="footer-contact-info">
+                    <p><i class="fas fa-envelope"></i> {email}</p>
+                    <p><i class="fas fa-map-marker-alt"></i> {location}</p>
+                </div>
+            </div>
+
+            <div class="footer-section">
+                <h4>Portfolio</h4>
+                <div class="footer-stats">
+                    <div class="footer-stat">
+                        <span class="stat-number">{stats[projects_completed]}</span>
+                        <span class="stat-label">Projects</span>
+                    </div>
+                    <div class="footer-stat">
+                        <span class="stat-number">{stats[best_accuracy]}</span>
+                        <span class="stat-label">Best Accuracy</span>
+                    </div>
+                    <div class="footer-stat">
+                        <span class="stat-number">{stats[technologies]}</span>
+                        <span class="stat-label">Technologies</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <div class="footer-bottom">
+            <div class="footer-bottom-content">
+                <div class="copyright">
+                    <p>&copy; 2025 {name}. All rights reserved.</p>
+                    <p class="built-with">Built with <i class="fas fa-heart"></i> using Streamlit & Python</p>
+                </div>
+
+                <div class="footer-disclaimer">
+                    <p>This portfolio showcases personal and professional projects. All data and metrics are accurate as of the last update.</p>
+                </div>
+
+                <div class="back-to-top">
+                    <a href="#about" class="back-to-top-btn" title="Back to top">
+                        <i class="fas fa-arrow-up"></i>
+                        <span>Top</span>
+                    </a>
+                </div>
+            </div>
+        </div>
+    </footer>
+    """, "footer")
+
+def footer_html(
+    name: str,
+    email: str,
+    phone: str,
+    location: str,
+    social_links: Dict[str, str],
+    stats: Dict[str, str]
+) -> str:
+    """
+    Build the page footer.
+
+    Args:
+        name (str): Display name for the copyright line
+        email (str): Contact email address
+        phone (str): Contact phone number
+        location (str): Location line
+        social_links (Dict[str, str]): Links from ``config.SOCIAL_LINKS``
+        stats (Dict[str, str]): Quick stats from ``config.STATS``
+
+    Returns:
+        str: Footer HTML
+    """
+    return FOOTER_TEMPLATE.render(name=name, email=email, phone=phone, location=location, social_links=social_links, stats=stats)
+
+# Stylesheet Classes
+# ==================
+
+def content_classes(content: Content, languages: Dict[str, str]) -> Set[str]:
+    """
+    CSS classes the builders derive from content values.
+
+    These names never appear literally in the source, so the stylesheet
+    purge (``css_optimizer.py``) has to be told about them.
+
+    Args:
+        content (Content): Portfolio content
+        languages (Dict[str, str]): Languages from ``config.LANGUAGES``
+
+    Returns:
+        Set[str]: Class names
+    """
+    classes = {_category_class(category.name) for category in content.skill_categories}
+    for edu in content.education:
+        classes.update(f"grade-{_grade_class(item.grade)}" for item in (*edu.coursework, *edu.academic_projects))
+    classes.update(_level_class(level) for level in languages.values())
+    return classes
@@ -0,0 +1,403 @@
+"""
+Portfolio Skill Search
+======================
+
+In-memory search engine behind the skills section search box. The index is
+built once from ``content.CONTENT.skill_categories`` and then answers every keystroke
+without scanning the catalogue:
+
+- Trigram inverted index over skill names, descriptions, category names and
+  the aliases in ``config.SKILL_SEARCH_ALIASES`` for substring matches
+- Unigram and bigram postings for queries too short to have a trigram
+- Prefix trie over skill names for the autocomplete suggestions shown under
+  the search box
+- Bounded edit-distance matching over an n-gram index of the vocabulary, so
+  a typo such as ``"pyton"`` still finds Python
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import re
+import sys
+import logging
+import argparse
+from dataclasses import replace
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+from content import Skill, SkillCategory
+from utils import PerformanceTimer
+
+logger = logging.getLogger(__name__)
+
+# Words are runs of letters, digits and the symbols used in technology names (C++, C#, Node.js)
+_WORD_PATTERN = re.compile(r"[a-z0-9+#.]+")
+
+# Queries shorter than a trigram are answered from unigram/bigram postings
+TRIGRAM_LENGTH = 3
+
+# Gram size used to find typo candidates for each tolerated edit distance:
+# trigrams are selective enough for one edit, two edits need bigrams to keep
+# a useful lower bound on the grams a candidate must share
+TYPO_GRAM_SIZES = {1: 3, 2: 2}
+
+# Number of autocomplete suggestions kept per trie node
+SUGGESTION_LIMIT = 5
+
+# Document id: (category, position of the skill in that category)
+SkillId = Tuple[str, int]
+
+def normalize_query(text: str) -> str:
+    """Lowercase a query and collapse its whitespace."""
+    return " ".join(text.lower().split())
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Return the set of character trigrams of ``text``.
+
+    Args:
+        text (str): Lowercase text
+
+    Returns:
+        Set[str]: Every substring of length 3
+    """
+    return {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+def _padded_grams(word: str, size: int) -> Set[str]:
+    """N-grams of a word padded with ``$``, used to find typo candidates in the vocabulary."""
+    padded = f"${word}$"
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """Whether two different strings are exactly one edit apart (the common typo case, in linear time)."""
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return a[i + 1:] == b[i + 1:] or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i:i + 2][::-1])
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Edit distance between two strings, giving up once it exceeds ``max_distance``.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each cost one edit (optimal string alignment distance). Only
+    the diagonal band of width ``2 * max_distance + 1`` is computed, so the
+    cost is linear in the length of the strings.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        max_distance (int): Largest distance of interest
+
+    Returns:
+        Optional[int]: The distance, or None if it is larger than ``max_distance``
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+    if max_distance == 1:
+        return 1 if _one_edit_apart(a, b) else None
+    if len(a) > len(b):
+        a, b = b, a
+
+    too_far = max_distance + 1
+    before_previous: List[int] = []
+    previous = [j if j <= max_distance else too_far for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        low, high = max(1, i - max_distance), min(len(b), i + max_distance)
+        current = [too_far] * (len(b) + 1)
+        current[0] = i if i <= max_distance else too_far
+        for j in range(low, high + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before_previous[j - 2] + 1)
+            current[j] = min(distance, too_far)
+        if min(current[low - 1:high + 1]) > max_distance:
+            return None
+        before_previous, previous = previous, current
+
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+def max_typos(word: str) -> int:
+    """Number of edits tolerated for a query word: none below 4 characters, then 1, then 2 from 8."""
+    if len(word) < 4:
+        return 0
+    return 1 if len(word) < 8 else 2
+
+class _TrieNode:
+    """Prefix trie node holding its children and the best skill names below it."""
+
+    __slots__ = ("children", "suggestions")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.suggestions: List[str] = []
+
+class SkillSearchIndex:
+    """
+    Search index over a catalogue of ``content.SkillCategory`` records.
+
+    The index is immutable once built; build a new one when the catalogue
+    changes.
+    """
+
+    def __init__(self, catalog: Sequence[SkillCategory], aliases: Optional[Mapping[str, Sequence[str]]] = None):
+        """
+        Build the index.
+
+        Args:
+            catalog (Sequence[SkillCategory]): Skill categories in display order
+            aliases (Optional[Mapping[str, Sequence[str]]]): Other names to find
+                a skill by (``"JS"`` for JavaScript), keyed by skill name
+        """
+        with PerformanceTimer("Building skill search index"):
+            self.catalog = catalog
+            self.aliases = {name: tuple(alias.lower() for alias in names) for name, names in (aliases or {}).items()}
+            self._texts: Dict[SkillId, str] = {}
+            self._trigram_postings: Dict[str, Set[SkillId]] = {}
+            self._word_postings: Dict[str, Set[SkillId]] = {}
+            self._word_grams: Dict[int, Dict[str, Set[str]]] = {size: {} for size in TYPO_GRAM_SIZES.values()}
+            self._short_postings: Dict[str, Set[SkillId]] = {}
+            self._trie = _TrieNode()
+
+            for category in catalog:
+                for position, skill in enumerate(category.skills):
+                    self._add_skill((category.name, position), category.name, skill)
+
+            for word in self._word_postings:
+                for size, postings in self._word_grams.items():
+                    for gram in _padded_grams(word, size):
+                        postings.setdefault(gram, set()).add(word)
+
+            self._add_suggestions(catalog)
+
+        logger.info(
+            f"Indexed {len(self._texts)} skills, {len(self._word_postings)} words "
+            f"and {len(self._trigram_postings)} trigrams"
+        )
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _add_skill(self, skill_id: SkillId, category: str, skill: Skill) -> None:
+        """Index one skill's name, description, category and aliases."""
+        name = skill.name.lower()
+        text = "\n".join((name, skill.description.lower(), category.lower(), *self.aliases.get(skill.name, ())))
+        self._texts[skill_id] = text
+
+        for gram in trigrams(text):
+            self._trigram_postings.setdefault(gram, set()).add(skill_id)
+        for length in range(1, TRIGRAM_LENGTH):
+            for i in range(len(text) - length + 1):
+                self._short_postings.setdefault(text[i:i + length], set()).add(skill_id)
+
+        # The full name is a prefix path too, so "html/c" still completes to HTML/CSS
+        for word in set(_WORD_PATTERN.findall(text)) | {name}:
+            self._word_postings.setdefault(word, set()).add(skill_id)
+
+    def _add_suggestions(self, catalog: Sequence[SkillCategory]) -> None:
+        """Insert every skill name, its words and its aliases into the trie, keeping the best names, by proficiency, per prefix."""
+        ranked = sorted(
+            (skill for category in catalog for skill in category.skills),
+            key=lambda skill: (-skill.proficiency, skill.name)
+        )
+        for skill in ranked:
+            name = skill.name.lower()
+            for word in [name, *_WORD_PATTERN.findall(name), *self.aliases.get(skill.name, ())]:
+                node = self._trie
+                for char in word:
+                    child = node.children.get(char)
+                    if child is None:
+                        child = node.children[char] = _TrieNode()
+                    node = child
+                    if len(node.suggestions) < SUGGESTION_LIMIT and skill.name not in node.suggestions:
+                        node.suggestions.append(skill.name)
+
+    def _prefix_node(self, prefix: str) -> Optional[_TrieNode]:
+        """Return the trie node for ``prefix``, if any word starts with it."""
+        node = self._trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _substring_matches(self, query: str) -> Set[SkillId]:
+        """Skills whose indexed text contains ``query`` literally."""
+        if len(query) < TRIGRAM_LENGTH:
+            return set(self._short_postings.get(query, ()))
+
+        # Intersect the rarest postings first, then confirm the candidates
+        postings = sorted(
+            (self._trigram_postings.get(gram, set()) for gram in trigrams(query)), key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {skill_id for skill_id in candidates if query in self._texts[skill_id]}
+
+    def _fuzzy_word_matches(self, word: str) -> Set[SkillId]:
+        """Skills containing a word within ``max_typos(word)`` edits of ``word`` (or a prefix of one)."""
+        max_distance = max_typos(word)
+        if max_distance == 0:
+            return set()
+
+        # An edit changes at most size + 1 padded n-grams (a transposition) and a
+        # prefix match loses the closing "$" gram, so candidates sharing fewer
+        # grams than that cannot match
+        size = TYPO_GRAM_SIZES[max_distance]
+        word_grams = _padded_grams(word, size)
+        required = max(1, len(word_grams) - (size + 1) * max_distance - 1)
+        postings = self._word_grams[size]
+        shared: Dict[str, int] = {}
+        for gram in word_grams:
+            for candidate in postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        matches: Set[SkillId] = set()
+        for candidate, count in shared.items():
+            if count < required or len(candidate) < len(word) - max_distance:
+                continue
+            # Compare against the candidate and against its prefix of the same length,
+            # so a misspelt partial word ("pyto") still finds the full one
+            if (bounded_edit_distance(word, candidate, max_distance) is not None
+                    or bounded_edit_distance(word, candidate[:len(word)], max_distance) is not None):
+                matches |= self._word_postings[candidate]
+        return matches
+
+    def search(self, query: str) -> Tuple[FrozenSet[SkillId], bool]:
+        """
+        Find the skills matching a query.
+
+        Literal substring matches are returned when there are any; otherwise
+        every word of the query is matched against the vocabulary with a
+        small edit distance.
+
+        Args:
+            query (str): Text typed into the search box
+
+        Returns:
+            Tuple[FrozenSet[SkillId], bool]: Matching skill ids and whether they
+            come from typo-tolerant matching
+        """
+        query = normalize_query(query)
+        if not query:
+            return frozenset(self._texts), False
+
+        exact = self._substring_matches(query)
+        if exact:
+            return frozenset(exact), False
+
+        fuzzy: Optional[Set[SkillId]] = None
+        for word in _WORD_PATTERN.findall(query):
+            word_matches = self._substring_matches(word) or self._fuzzy_word_matches(word)
+            fuzzy = word_matches if fuzzy is None else fuzzy & word_matches
+            if not fuzzy:
+                break
+        return frozenset(fuzzy or ()), True
+
+    def suggest(self, prefix: str, limit: int = SUGGESTION_LIMIT) -> List[str]:
+        """
+        Autocomplete skill names for what has been typed so far.
+
+        Suggestions come from the last word of the query and are ordered by
+        proficiency.
+
+        Args:
+            prefix (str): Text typed into the search box
+            limit (int): Maximum number of suggestions
+
+        Returns:
+            List[str]: Skill names, best first
+        """
+        prefix = normalize_query(prefix)
+        if not prefix:
+            return []
+
+        node = self._prefix_node(prefix)
+        if node is None:
+            words = _WORD_PATTERN.findall(prefix)
+            node = self._prefix_node(words[-1]) if words else None
+        return node.suggestions[:limit] if node else []
+
+    def filter(self, selected_category: str, query: str = "") -> Tuple[List[SkillCategory], bool]:
+        """
+        Restrict the catalogue to a category filter and a search query.
+
+        Args:
+            selected_category (str): Category name, or ``"All"``
+            query (str): Text typed into the search box
+
+        Returns:
+            Tuple[List[SkillCategory], bool]: The matching categories, holding
+            only their matching skills, in catalogue order, and whether
+            typo-tolerant matching was used
+        """
+        matches, fuzzy = self.search(query)
+        filtered: List[SkillCategory] = []
+
+        for category in self.catalog:
+            if selected_category not in ("All", category.name):
+                continue
+            if not query.strip():
+                filtered.append(category)
+                continue
+
+            skills = tuple(skill for position, skill in enumerate(category.skills) if (category.name, position) in matches)
+            if skills:
+                filtered.append(replace(category, skills=skills))
+
+        return filtered, fuzzy
+
+# Command Line
+# ============
+
+# Queries the search box must keep answering, with a skill each one has to find
+SEARCH_CHECKS = {
+    "ml": "HTML/CSS",         # shorter than a trigram, inside a word
+    "js": "JavaScript",       # alias
+    "sql": "SQL",
+    "learn": "Scikit-learn",
+    "pyton": "Python",        # typo
+}
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    from config import SKILL_SEARCH_ALIASES
+    from content import CONTENT
+
+    parser = argparse.ArgumentParser(description="Query the skill search index.")
+    parser.add_argument("queries", nargs="*", help="queries to run against the skills catalogue")
+    parser.add_argument("--check", action="store_true", help="check that every query in SEARCH_CHECKS finds its skill")
+    args = parser.parse_args(argv)
+
+    index = SkillSearchIndex(CONTENT.skill_categories, SKILL_SEARCH_ALIASES)
+    queries = dict.fromkeys(args.queries, None) if args.queries else dict(SEARCH_CHECKS)
+
+    failed = 0
+    for query, expected in queries.items():
+        categories, fuzzy = index.filter("All", query)
+        names = [skill.name for category in categories for skill in category.skills]
+        found = expected is None or expected in names
+        failed += not found
+        print(f"   {'✅' if found else '❌'} {query!r}{' (typo-tolerant)' if fuzzy else ''}: {', '.join(names) or 'no skills'}")
+
+    if args.check or not args.queries:
+        if failed:
+            print(f"❌ {failed} of {len(queries)} queries missed their skill")
+            return 1
+        print(f"✅ All {len(queries)} queries found their skill")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Portfolio Templates
+===================
+
+A small HTML template layer for the section renderers in ``sections.py``.
+
+Templates use ``str.format`` field syntax: ``{name}``, ``{skill.name}``,
+``{stats[projects_completed]}`` and format specs such as ``{value:.1f}``
+(``{{`` and ``}}`` for literal braces).
+Each :class:`Template` is parsed once, when it is created, into a Python
+function that joins its static parts (interned with ``sys.intern``) and its
+escaped values in one ``str.join``. Rendering does no parsing and no string
+formatting beyond the values themselves.
+
+Every value is HTML-escaped unless it is :class:`Markup`, which is what
+templates, :func:`escape` and :func:`join_markup` return: nested fragments
+stay intact, and a value from ``config.py`` or a visitor can never open a tag
+or break out of an attribute. Escaping is a single ``str.translate`` with
+:data:`ESCAPE_TABLE`, skipped for the (common) values that contain none of
+``& < > " '``.
+
+A template and the values it is rendered with are all that determine its
+output, so ``utils.fragment_cache.render_template`` can cache renders under
+exactly that key.
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import re
+import sys
+import hashlib
+from string import Formatter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+# Escaping
+# ========
+
+class Markup(str):
+    """Text that is already HTML: templates insert it without escaping."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"Markup({str.__repr__(self)})"
+
+# Characters that are special in HTML text and quoted attributes
+ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+_SPECIAL_PATTERN = re.compile(r'[&<>"\']')
+
+# Escaped forms of strings seen before, and the strings known to need no
+# escaping (each mapped to itself). Content strings are the same objects on
+# every render and cache their hash, so a lookup is far cheaper than a scan;
+# rendered templates consult the clean strings without a function call.
+_ESCAPED_STRINGS: Dict[str, str] = {}
+_CLEAN_STRINGS: Dict[str, str] = {}
+_MAX_CACHED_STRINGS = 10_000
+
+def escape_text(value: Any) -> str:
+    """
+    Escape a value for HTML text or a quoted attribute, in a single pass.
+
+    Args:
+        value (Any): Value to insert; :class:`Markup` is returned unchanged
+
+    Returns:
+        str: Escaped text
+    """
+    if value.__class__ is str:
+        escaped = _ESCAPED_STRINGS.get(value)
+        if escaped is None:
+            if _SPECIAL_PATTERN.search(value) is None:
+                escaped = value
+                if len(_CLEAN_STRINGS) < _MAX_CACHED_STRINGS:
+                    _CLEAN_STRINGS[value] = value
+            else:
+                escaped = value.translate(ESCAPE_TABLE)
+            if len(_ESCAPED_STRINGS) < _MAX_CACHED_STRINGS:
+                _ESCAPED_STRINGS[value] = escaped
+        return escaped
+    if isinstance(value, Markup):
+        return value
+    text = str(value)
+    if _SPECIAL_PATTERN.search(text) is None:
+        return text
+    return text.translate(ESCAPE_TABLE)
+
+def escape(value: Any) -> Markup:
+    """
+    Escape a value and mark the result as HTML.
+
+    Args:
+        value (Any): Value to escape
+
+    Returns:
+        Markup: Escaped value
+    """
+    return Markup(escape_text(value))
+
+def join_markup(fragments: Iterable[Any], separator: str = "") -> Markup:
+    """
+    Join fragments into one piece of markup, escaping those that are not markup.
+
+    Args:
+        fragments (Iterable[Any]): Rendered templates or plain values
+        separator (str): Markup placed between fragments
+
+    Returns:
+        Markup: Joined markup
+    """
+    return Markup(separator.join(map(escape_text, fragments)))
+
+# Compilation
+# ===========
+
+_FORMATTER = Formatter()
+_FIELD_NAME_PATTERN = re.compile(r'[A-Za-z_]\w*')
+_FIELD_ACCESS_PATTERN = re.compile(r'\.([A-Za-z_]\w*)|\[([^\[\]]+)\]')
+
+def _field_expression(field: str, source_name: str) -> Tuple[str, str]:
+    """
+    Turn a field such as ``skill.name`` or ``stats[best_accuracy]`` into Python.
+
+    Returns:
+        Tuple[str, str]: The top-level value name and the expression reading it
+        from ``values``
+    """
+    head = _FIELD_NAME_PATTERN.match(field)
+    if head is None:
+        raise ValueError(f"Template {source_name}: fields must be named, got '{{{field}}}'")
+
+    expression = f"values[{head.group()!r}]"
+    position = head.end()
+    while position < len(field):
+        access = _FIELD_ACCESS_PATTERN.match(field, position)
+        if access is None:
+            raise ValueError(f"Template {source_name}: cannot read field '{{{field}}}'")
+        attribute, key = access.groups()
+        if attribute is not None:
+            expression += f".{attribute}"
+        else:
+            expression += f"[{(int(key) if key.isdigit() else key)!r}]"
+        position = access.end()
+    return head.group(), expression
+
+def _compile(source: str, name: str) -> Tuple[Callable[[Mapping[str, Any]], Markup], Tuple[str, ...]]:
+    """
+    Parse a template into a render function.
+
+    Returns:
+        Tuple: The function, called with a mapping of values, and the names of
+        the values it reads, in order of first use
+    """
+    namespace: Dict[str, Any] = {
+        '_escape': escape_text,
+        '_clean': _CLEAN_STRINGS.get,
+        '_format': format,
+        '_Markup': Markup,
+    }
+    parts: List[str] = []
+    fast_parts: List[str] = []
+    fields: Dict[str, None] = {}
+
+    try:
+        parsed = list(_FORMATTER.parse(source))
+    except ValueError as e:
+        raise ValueError(f"Template {name}: {e}") from e
+
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            constant = f"_s{len(parts)}"
+            namespace[constant] = sys.intern(literal)
+            parts.append(constant)
+            fast_parts.append(constant)
+        if field is None:
+            continue
+        if conversion:
+            raise ValueError(f"Template {name}: conversions are not supported ('{{{field}!{conversion}}}')")
+        if '{' in spec:
+            raise ValueError(f"Template {name}: nested fields are not supported ('{{{field}:{spec}}}')")
+
+        value_name, expression = _field_expression(field, name)
+        fields[value_name] = None
+        if spec:
+            expression = f"_format({expression}, {spec!r})"
+        parts.append(f"_escape({expression})")
+        # A Markup value equal to a clean string has the same text, so the shortcut holds for it too
+        fast_parts.append(f"(_clean(_v := {expression}) or _escape(_v))")
+
+    if not parts:
+        parts = fast_parts = ["''"]
+    # The fast path needs hashable values; anything else takes the plain one
+    source_code = (
+        "def render_plain(values):\n"
+        f"    return _Markup(''.join(({', '.join(parts)},)))\n"
+        "def render(values):\n"
+        "    try:\n"
+        f"        return _Markup(''.join(({', '.join(fast_parts)},)))\n"
+        "    except TypeError:\n"
+        "        return render_plain(values)\n"
+    )
+    exec(compile(source_code, f"<template {name}>", "exec"), namespace)
+    return namespace['render'], tuple(fields)
+
+# Templates
+# =========
+
+class Template:
+    """
+    An HTML template compiled to a Python function.
+
+    Example:
+        >>> card = Template('<div class="card">{title}</div>', name="card")
+        >>> card.render(title="R&D")
+        Markup('<div class="card">R&amp;D</div>')
+    """
+
+    __slots__ = ('name', 'source', 'fields', 'digest', '_render')
+
+    def __init__(self, source: str, name: str = "template"):
+        """
+        Parse and compile a template.
+
+        Args:
+            source (str): Template text with ``str.format`` fields
+            name (str): Name used in error messages and reprs
+
+        Raises:
+            ValueError: If the template has positional fields, conversions
+                (``!r``) or nested fields in a format spec
+        """
+        self.name = name
+        self.source = source
+        self.digest = hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+        self._render, self.fields = _compile(source, name)
+
+    def render(self, **values: Any) -> Markup:
+        """
+        Render the template.
+
+        Args:
+            **values: A value for every field name
+
+        Returns:
+            Markup: Rendered HTML
+
+        Raises:
+            KeyError: If a field has no value
+        """
+        return self._render(values)
+
+    def render_values(self, values: Mapping[str, Any]) -> Markup:
+        """Render the template from a mapping of values (see :meth:`render`)."""
+        return self._render(values)
+
+    def render_each(self, name: str, items: Iterable[Any], **values: Any) -> Tuple[Markup, ...]:
+        """
+        Render the template once per item.
+
+        Args:
+            name (str): Field name each item is bound to
+            items (Iterable[Any]): Items to render
+            **values: Values shared by every render
+
+        Returns:
+            Tuple[Markup, ...]: One rendered block per item
+        """
+        render = self._render
+        return tuple(render({**values, name: item}) for item in items)
+
+    def render_joined(self, name: str, items: Iterable[Any], separator: str = "", **values: Any) -> Markup:
+        """
+        Render the template once per item and join the results.
+
+        Args:
+            name (str): Field name each item is bound to
+            items (Iterable[Any]): Items to render
+            separator (str): Markup placed between the renders
+            **values: Values shared by every render
+
+        Returns:
+            Markup: The joined renders
+        """
+        render = self._render
+        return Markup(separator.join([render({**values, name: item}) for item in items]))
+
+    def __repr__(self) -> str:
+        # Stable across processes, so it can take part in cache keys
+        return f"Template({self.name!r}, {self.digest})"
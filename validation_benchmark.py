@@ -0,0 +1,168 @@
+"""
+Portfolio Validation Benchmark
+==============================
+
+Times the validators in ``utils`` against the regular expressions they
+replaced, which were recompiled (through the ``re`` cache) on every call and,
+for URLs, could backtrack on crafted input.
+
+Three measurements:
+
+- ``typical``: mean time per call on well-formed and slightly malformed
+  emails, URLs and phone numbers
+- ``adversarial``: worst-case strings of growing length (long runs that fail
+  at the very end, many dots, nested path characters); time per call should
+  grow linearly with the length, so ``ns/char`` stays flat
+- ``batch``: throughput of ``validate_batch`` on a list of records with
+  repeated values, as from a project catalogue or form traffic
+
+Usage:
+    python validation_benchmark.py [--sizes 64 256 1024 2048] [--records 10000]
+
+Author: Aarya Mody
+Date: 2025
+Version: 1.0.0
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from typing import Callable, Dict, List, Optional, Sequence
+
+from utils import validate_batch, validate_email, validate_phone, validate_url
+
+# Validators Being Replaced
+# =========================
+
+def legacy_validate_email(email: str) -> bool:
+    """Email check as it was before the validators were precompiled."""
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, email) is not None
+
+def legacy_validate_url(url: str) -> bool:
+    """URL check as it was before the validators were precompiled."""
+    pattern = r'^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
+    return re.match(pattern, url) is not None
+
+def legacy_validate_phone(phone: str) -> bool:
+    """Phone check as it was before the validators were precompiled."""
+    cleaned = re.sub(r'[\s\-\(\)\+\.]', '', phone)
+    return cleaned.isdigit() and 7 <= len(cleaned) <= 15
+
+VALIDATORS: Dict[str, Dict[str, Callable[[str], bool]]] = {
+    "email": {"legacy": legacy_validate_email, "current": validate_email},
+    "url": {"legacy": legacy_validate_url, "current": validate_url},
+    "phone": {"legacy": legacy_validate_phone, "current": validate_phone},
+}
+
+TYPICAL_INPUTS: Dict[str, List[str]] = {
+    "email": ["aarya@example.com", "first.last+tag@mail.example.co.uk", "not-an-email", "a@b", "x@@y.com"],
+    "url": [
+        "https://github.com/aaryamody",
+        "https://www.linkedin.com/in/aarya-mody/?trk=public#about",
+        "http://localhost:8501",
+        "ftp://example.com/file",
+        "https://example.com/path/to/page?query=1&other=2",
+    ],
+    "phone": ["+1 (555) 123-4567", "555.123.4567", "12345", "+44 20 7946 0958", "phone"],
+}
+
+# Inputs that make a backtracking matcher retry every split point before failing
+# (the legacy URL pattern retries up to 256 host lengths, each rescanning the tail)
+ADVERSARIAL_INPUTS: Dict[str, Callable[[int], str]] = {
+    "email": lambda n: "a@" + "a." * (n // 2) + "!",
+    "url": lambda n: "http://" + "a." * (n // 2) + "!",
+    "url_www": lambda n: "http://" + "www." * (n // 4) + "!",
+    "url_path": lambda n: "http://example.com/" + "(" * n + "!",
+    "phone": lambda n: "1-" * (n // 2) + "x",
+}
+
+# Timing
+# ======
+
+def time_per_call(func: Callable[[str], bool], values: Sequence[str], min_seconds: float = 0.2) -> float:
+    """Mean seconds per call of ``func`` over ``values``, repeated for at least ``min_seconds``."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for value in values:
+            func(value)
+        calls += len(values)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+def time_once(func: Callable[[str], bool], value: str, budget: float) -> Optional[float]:
+    """Seconds for one call, or None if a first call already took longer than ``budget``."""
+    start = time.perf_counter()
+    func(value)
+    elapsed = time.perf_counter() - start
+    if elapsed > budget:
+        return None
+    return min(elapsed, time_per_call(func, [value], min_seconds=0.05))
+
+def make_records(count: int, seed: int = 0) -> List[Dict[str, str]]:
+    """Form-like records drawing from a small pool of emails, links and phone numbers."""
+    rng = random.Random(seed)
+    emails = [f"visitor{i}@example{i % 7}.com" for i in range(count // 10 or 1)] + ["bad-address"]
+    urls = [f"https://example{i % 50}.com/projects/{i}" for i in range(count // 20 or 1)] + ["javascript:alert(1)"]
+    phones = [f"+1 555 {i:03d} {i * 7 % 10000:04d}" for i in range(count // 10 or 1)]
+    return [
+        {"email": rng.choice(emails), "website": rng.choice(urls), "phone": rng.choice(phones)}
+        for _ in range(count)
+    ]
+
+# Command Line
+# ============
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the email, URL and phone validators.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024, 2048],
+                        help="adversarial input lengths (default: 64 256 1024 2048)")
+    parser.add_argument("--records", type=int, default=10000, help="records in the batch run (default: 10000)")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="seconds after which a single legacy call is reported as too slow (default: 2)")
+    args = parser.parse_args(argv)
+
+    print("⏱️  Typical inputs (µs per call)")
+    for kind, values in TYPICAL_INPUTS.items():
+        legacy = time_per_call(VALIDATORS[kind]["legacy"], values) * 1e6
+        current = time_per_call(VALIDATORS[kind]["current"], values) * 1e6
+        print(f"   {kind:<9} legacy {legacy:8.2f}   current {current:8.2f}   ({legacy / current:.1f}x)")
+
+    print("\n🧨 Adversarial inputs (µs per call, ns per character)")
+    for name, build in ADVERSARIAL_INPUTS.items():
+        kind = name.split("_")[0]
+        for size in args.sizes:
+            value = build(size)
+            row = [f"   {name:<9} n={size:<6}"]
+            for variant in ("legacy", "current"):
+                seconds = time_once(VALIDATORS[kind][variant], value, args.budget)
+                if seconds is None:
+                    row.append(f"{variant} > {args.budget:.0f}s")
+                else:
+                    row.append(f"{variant} {seconds * 1e6:10.1f} ({seconds * 1e9 / len(value):6.1f}/char)")
+            print("   ".join(row))
+
+    print(f"\n📦 Batch validation of {args.records} records")
+    records = make_records(args.records)
+    for field, kind in (("email", "email"), ("website", "url"), ("phone", "phone")):
+        values = [record[field] for record in records]
+        start = time.perf_counter()
+        for value in values:
+            VALIDATORS[kind]["current"](value)
+        one_by_one = time.perf_counter() - start
+        start = time.perf_counter()
+        verdicts = validate_batch(values, kind)
+        batched = time.perf_counter() - start
+        print(f"   {field:<8} one by one {one_by_one * 1e3:7.2f} ms   validate_batch {batched * 1e3:7.2f} ms"
+              f"   ({len(values) / batched:,.0f} values/s, {verdicts.count(False)} invalid)")
+
+    print("\n✅ Done")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())